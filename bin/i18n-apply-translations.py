@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Apply the translation dictionaries of one or more locales to their catalogs.
+
+Replaces translate_ru.py, translate_ru_pass2.py and translate_ru_pass3.py.
+i18n-apply-translations.data.json lists, per locale, the dictionary layers
+under bin/i18n-dictionaries/ in precedence order (first match wins; a layer
+with "only" applies to fuzzy or untranslated entries alone) and the custom
+msgids to "add" when the catalog lacks them. See i18nlib/apply.py for the
+.tsv/.json dictionary formats. Entries no dictionary covers are looked up in
+the translation memory (i18nlib/tm.py) unless --no-tm.
+
+Each catalog is read once: untranslated entries are filled, fuzzy ones fixed,
+and the stats printed come from that same pass. Plural rows whose number of
+forms is not the catalog's nplurals are refused and listed. The .po (then the .mo) is
+only rewritten when something changed.
+"""
+import argparse
+import json
+import os
+import sys
+
+from i18nlib import po_path, rel
+from i18nlib.apply import apply_catalog, load_layers
+from i18nlib.mofile import compile_po
+from i18nlib.tm import TranslationMemory
+from i18nlib.writer import write_if_changed
+
+BIN = os.path.dirname(os.path.abspath(__file__))
+DATA_FILE = os.path.join(BIN, "i18n-apply-translations.data.json")
+DICT_DIR = os.path.join(BIN, "i18n-dictionaries")
+
+
+def main():
+    with open(DATA_FILE, encoding="utf-8") as fh:
+        data = json.load(fh)
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("locales", nargs="*", metavar="LOCALE",
+                    help=f"locales to apply (default: all of {', '.join(data)})")
+    ap.add_argument("--dry-run", action="store_true", help="report, write nothing")
+    ap.add_argument("--no-tm", action="store_true", help="dictionaries only, no translation memory")
+    ap.add_argument("--list", type=int, default=30, metavar="N",
+                    help="untranslated/fuzzy msgids to print per locale (default 30)")
+    args = ap.parse_args()
+
+    unknown = [loc for loc in args.locales if loc not in data]
+    if unknown:
+        ap.error(f"no dictionaries for {', '.join(unknown)}")
+    tm = None if args.no_tm else TranslationMemory.open()
+    changed = []
+    for locale in args.locales or list(data):
+        spec = data[locale]
+        layers = load_layers(DICT_DIR, spec["layers"])
+        path = po_path(locale)
+        text, st = apply_catalog(path, layers, add=spec.get("add", ()), tm=tm, locale=locale)
+
+        print(f"=== {locale}: {len(layers)} dictionaries, "
+              f"{sum(len(layer.table) for layer in layers)} translations ===")
+        print(f"  Translated: {st.filled}")
+        print(f"  Fuzzy fixed: {st.fuzzy_fixed}")
+        print(f"  Custom entries added: {st.added}")
+        if tm is not None:
+            print(f"  From translation memory: {st.from_tm}")
+        print(f"  Total: {st.total}  translated: {st.translated}  "
+              f"fuzzy: {st.fuzzy}  untranslated: {st.untranslated}")
+        if st.rejected:
+            print(f"  Rejected plural translations, wrong number of forms ({len(st.rejected)}):")
+            for mid, forms in st.rejected[:args.list]:
+                print(f"    {mid[:70]!r}: {forms} forms")
+        for label, ids in (("untranslated", st.still_untranslated), ("fuzzy", st.still_fuzzy)):
+            if ids and args.list:
+                print(f"  Still {label} ({len(ids)}):")
+                for i, mid in enumerate(ids[:args.list], 1):
+                    print(f"    {i}. {mid[:80]!r}")
+
+        if args.dry_run:
+            continue
+        if write_if_changed(path, text.encode("utf-8")):
+            changed.append(path)
+        mo = path[:-3] + ".mo"
+        if (path in changed or os.path.exists(mo)) and write_if_changed(mo, compile_po(path)):
+            changed.append(mo)
+
+    if not args.dry_run:
+        print(f"\n{len(changed)} file(s) changed")
+        for path in changed:
+            print(f"  {rel(path)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
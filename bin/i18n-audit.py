@@ -1,108 +1,141 @@
 #!/usr/bin/env python3
 """Audit InfraSignal loc()/_() strings against ru/tr/es catalogs.
 
+--all-locales audits every locale/*/LC_MESSAGES/FixMyStreet.po on a worker
+pool and prints a locale x category count matrix instead of per-string lists.
+--format json|junit prints machine-readable results instead (the same data
+run_audit() in i18nlib/audit.py returns to in-process callers).
+--watch keeps running and, each time a template or catalog is saved, prints
+the MISSING/EMPTY/FUZZY entries that appeared (+) or went away (-).
+
 Reports, per language:
   - MISSING : msgid used in templates but absent from the .po catalog
   - EMPTY   : present but msgstr is empty (renders English)
   - FUZZY   : marked fuzzy (renders English / unreviewed)
-  - LEAK    : msgstr identical to the English msgid (likely untranslated)
+  - LEAK    : English words left in the msgstr (i18nlib/leaks.py; the full
+              per-entry report is bin/i18n-leaks.py)
 """
-import os, re, sys
-import polib
-
-ROOT = "/opt/infrasignal-dev"
-TPL_DIR = os.path.join(ROOT, "templates/web/infrasignal")
-COBRAND = os.path.join(ROOT, "perllib/FixMyStreet/Cobrand/Infrasignal.pm")
-LANGS = {"ru": "ru_RU", "tr": "tr_TR", "es": "es"}
-
-# Pages that are fully translated via dedicated per-language template files
-# (about-ru.html etc.), so their English source templates are NOT catalog-driven.
-SKIP_FILES = re.compile(r"/(about|faq|privacy|terms|security)\b.*\.html$")
-
-# loc('...') / loc("...") and the inner string of tprintf(loc('...'), ...)
-LOC_RE = re.compile(r"""loc\(\s*(['"])(.*?)(?<!\\)\1""", re.S)
-GETTEXT_RE = re.compile(r"""(?<![\w])_\(\s*(['"])(.*?)(?<!\\)\1""", re.S)
-
-
-def collect_msgids():
-    ids = {}  # msgid -> set(files)
-    for dirpath, _dirs, files in os.walk(TPL_DIR):
-        for f in files:
-            if not f.endswith(".html"):
+import argparse, json, os, time
+
+from i18nlib import discover_locales
+from i18nlib.audit import CATEGORIES, HARD, LANGS, run_audit, to_junit
+from i18nlib.extract import SCOPES
+from i18nlib.watch import Watcher
+
+# what each extraction scope reads (see i18nlib/extract.py)
+SCOPE_SOURCES = {
+    "infrasignal": "infrasignal templates and the Infrasignal cobrand module",
+    "cobrand": "the templates and Perl modules an InfraSignal request can render",
+    "all": "all templates/web/* and perllib/**/*.pm",
+    "full": "all templates, perllib, db/alert_types.pl and the bin/ Perl scripts",
+}
+
+
+def _short(mid):
+    return (mid[:70] + "…") if len(mid) > 70 else mid
+
+
+def print_report(res):
+    missing, empty, fuzzy, leak = (res[c] for c in CATEGORIES)
+    print("=" * 72)
+    print(f"### {res['lang']} ({res['locale']})  [{res['ms']:.1f} ms]")
+    print(f"  MISSING={len(missing)}  EMPTY={len(empty)}  FUZZY={len(fuzzy)}  LEAK={len(leak)}")
+    def dump(title, rows):
+        if not rows:
+            return
+        print(f"\n  -- {title} ({len(rows)}) --")
+        for r in rows:
+            print(f"     [{r['file']}] '{_short(r['msgid'])}'")
+    dump("MISSING from catalog", missing)
+    dump("EMPTY msgstr (shows English)", empty)
+    dump("FUZZY (shows English)", fuzzy)
+    dump("LEAK: English left in the translation", leak)
+    print()
+
+
+def print_matrix(results, total):
+    w = max(len(r["locale"]) for r in results)
+    print(f"{'locale':<{w}}  " + "  ".join(f"{c:>7}" for c in CATEGORIES) + "  coverage")
+    for r in results:
+        counts = [r["counts"][c] for c in CATEGORIES]
+        ok = total - counts[0] - counts[1] - counts[2]
+        cov = 100.0 * ok / total if total else 100.0
+        print(f"{r['locale']:<{w}}  " + "  ".join(f"{n:7d}" for n in counts) + f"  {cov:7.1f}%")
+
+
+def watch(args):
+    w = Watcher(discover_locales() if args.all_locales else LANGS, scope=args.scope)
+    def counts():
+        for lang, c in w.counts().items():
+            print(f"  {lang}: " + "  ".join(f"{cat}={c[cat]}" for cat in HARD))
+    print(f"Watching {len(w.files)} files and {len(w.langs)} catalogs "
+          f"(every {args.interval:g}s, Ctrl-C to stop)")
+    counts()
+    try:
+        while True:
+            time.sleep(args.interval)
+            t0 = time.perf_counter()
+            touched, delta = w.poll()
+            if not touched:
                 continue
-            path = os.path.join(dirpath, f)
-            rel = path[len(ROOT) + 1:]
-            text = open(path, encoding="utf-8", errors="ignore").read()
-            for m in LOC_RE.finditer(text):
-                # Template Toolkit unescapes \" and \' at runtime; loc() looks up
-                # the unescaped value, so normalize to match the catalog.
-                mid = m.group(2).replace('\\"', '"').replace("\\'", "'")
-                ids.setdefault(mid, set()).add(rel)
-    # cobrand admin page titles wrapped with _()
-    if os.path.exists(COBRAND):
-        text = open(COBRAND, encoding="utf-8", errors="ignore").read()
-        for m in GETTEXT_RE.finditer(text):
-            ids.setdefault(m.group(2), set()).add("perllib/.../Infrasignal.pm")
-    return ids
-
-
-def normalize(s):
-    # collapse TT-style whitespace so multi-line msgids match catalog forms
-    return re.sub(r"\s+", " ", s).strip()
-
-
-def has_cyrillic(s):
-    return bool(re.search(r"[\u0400-\u04FF]", s))
+            ms = (time.perf_counter() - t0) * 1000
+            print(f"\n[{time.strftime('%H:%M:%S')}] {', '.join(touched)}  ({ms:.1f} ms)")
+            for sign, cat, mid, langs, where in delta:
+                print(f"  {sign} {cat:<7} '{_short(mid)}'  [{' '.join(langs)}]  {where}")
+            if delta:
+                counts()
+            else:
+                print("  no change in MISSING/EMPTY/FUZZY")
+    except KeyboardInterrupt:
+        pass
 
 
 def main():
-    ids = collect_msgids()
-    print(f"Collected {len(ids)} distinct loc()/_() msgids from infrasignal templates\n")
-
-    for lang, locale in LANGS.items():
-        po_path = os.path.join(ROOT, f"locale/{locale}.UTF-8/LC_MESSAGES/FixMyStreet.po")
-        po = polib.pofile(po_path)
-        cat = {}
-        for e in po:
-            cat[e.msgid] = e
-            cat[normalize(e.msgid)] = e
-
-        missing, empty, fuzzy, leak = [], [], [], []
-        for mid, files in ids.items():
-            if not mid.strip():
-                continue
-            e = cat.get(mid) or cat.get(normalize(mid))
-            sample = sorted(files)[0]
-            short = (mid[:70] + "…") if len(mid) > 70 else mid
-            if e is None:
-                missing.append((short, sample))
-            elif "fuzzy" in e.flags:
-                fuzzy.append((short, sample))
-            elif not e.msgstr.strip():
-                empty.append((short, sample))
-            elif e.msgstr.strip() == mid.strip():
-                # identical translation: strong signal for ru (cyrillic expected),
-                # weaker for es/tr (could be 'Email', 'OK', proper nouns)
-                if lang == "ru" or len(mid) > 12:
-                    leak.append((short, e.msgstr[:40], sample))
-
-        print("=" * 72)
-        print(f"### {lang} ({locale})")
-        print(f"  MISSING={len(missing)}  EMPTY={len(empty)}  FUZZY={len(fuzzy)}  LEAK(eng==translit)={len(leak)}")
-        def dump(title, rows, withval=False):
-            if not rows:
-                return
-            print(f"\n  -- {title} ({len(rows)}) --")
-            for r in rows:
-                if withval:
-                    print(f"     [{r[2]}] '{r[0]}'  ==>  '{r[1]}'")
-                else:
-                    print(f"     [{r[1]}] '{r[0]}'")
-        dump("MISSING from catalog", missing)
-        dump("EMPTY msgstr (shows English)", empty)
-        dump("FUZZY (shows English)", fuzzy)
-        dump("LEAK: translation == English source", leak, withval=True)
-        print()
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--no-cache", action="store_true",
+                    help="ignore and do not update the extraction cache")
+    ap.add_argument("--scope", choices=SCOPES, default="infrasignal",
+                    help="; ".join(f"{s}: {SCOPE_SOURCES[s]}" for s in SCOPES)
+                         + " (default: infrasignal)")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                    help="worker processes (default: CPU count; 1 = serial)")
+    ap.add_argument("--all-locales", action="store_true",
+                    help="audit every locale/*/LC_MESSAGES/FixMyStreet.po, print a matrix")
+    ap.add_argument("--format", choices=("text", "json", "junit"), default="text")
+    ap.add_argument("--watch", action="store_true",
+                    help="keep running, print the delta after each save")
+    ap.add_argument("--interval", type=float, default=0.25,
+                    help="seconds between change checks with --watch")
+    args = ap.parse_args()
+
+    if args.watch:
+        watch(args)
+        return
+
+    t0 = time.perf_counter()
+    result = run_audit(scope=args.scope, jobs=args.jobs, use_cache=not args.no_cache,
+                       all_locales=args.all_locales)
+    if args.format == "json":
+        print(json.dumps(result, ensure_ascii=False, indent=1))
+        return
+    if args.format == "junit":
+        print(to_junit(result))
+        return
+
+    ex = result["extract"]
+    print(f"Collected {result['msgids']} distinct loc()/_() msgids from "
+          f"{SCOPE_SOURCES[args.scope]}")
+    if result.get("daemon"):
+        print(f"  served by i18n-catalogd (generation {result['daemon']})\n")
+    else:
+        print(f"  extract cache: {ex['hits']} hit / {ex['misses']} miss ({ex['ms']:.0f} ms)\n")
+    if args.all_locales:
+        print_matrix(result["locales"], result["msgids"])
+        print(f"\n{len(result['locales'])} locales audited in "
+              f"{(time.perf_counter() - t0) * 1000:.0f} ms (jobs={args.jobs})")
+    else:
+        for res in result["locales"]:
+            print_report(res)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the i18n tooling in bin/i18nlib.
+
+Usage:
+    python3 bin/i18n-bench.py tokenizer [--repeat N]
+    python3 bin/i18n-bench.py extract [--repeat N] [--jobs N]
+    python3 bin/i18n-bench.py po [--repeat N]
+    python3 bin/i18n-bench.py similar [--repeat N]
+    python3 bin/i18n-bench.py mo [--repeat N]
+    python3 bin/i18n-bench.py tm [--repeat N]
+
+tokenizer : msgid scanner vs the legacy LOC_RE/GETTEXT_RE regexes, in MB/s,
+            over every templates/web/**/*.html and perllib/**/*.pm file.
+extract   : uncached --scope all extraction, serial vs the process pool; fails
+            if the two runs do not return identical records.
+po        : polib.pofile() vs i18nlib.poreader.read_po() building a
+            {msgid: entry} map of the ru_RU, tr_TR and es catalogs; parse time
+            and peak RSS above an import-only baseline, each in a fresh process.
+similar   : nearest translated entries for the ru_RU MISSING msgids, trigram
+            index (all 40 locales) vs a difflib.get_close_matches() scan.
+mo        : libintl-style lookups of one page's loc() calls (the InfraSignal
+            template with the most of them) in a .mo with the gettext hash
+            table vs one without (polib's), as string compares per lookup and
+            time per page. The times are for the Python lookups, where the
+            byte-wise hash_string() dominates; in libintl (C) hashing is
+            negligible and the compare count is what differs.
+tm        : translation memory build from every catalog and data file into a
+            scratch SQLite file, then per-lookup time for hits and misses
+            across all locales, against finding the same strings by parsing
+            the catalogs (read_po) as the scripts used to.
+"""
+import argparse
+import difflib
+import json
+import os
+import re
+import resource
+import subprocess
+import sys
+import time
+
+from i18nlib import ROOT, po_path
+from i18nlib.extract import collect
+from i18nlib.tokenizer import scan_perl, scan_template
+
+# The regexes the audit/dump scripts used before i18nlib.tokenizer.
+LEGACY_LOC_RE = re.compile(r"""loc\(\s*(['"])(.*?)(?<!\\)\1""", re.S)
+LEGACY_GETTEXT_RE = re.compile(r"""(?<![\w])_\(\s*(['"])(.*?)(?<!\\)\1""", re.S)
+
+
+def _corpus():
+    tpl, perl = [], []
+    for sub, ext, out in (("templates/web", ".html", tpl), ("perllib", ".pm", perl)):
+        for dirpath, _dirs, files in os.walk(os.path.join(ROOT, sub)):
+            for f in sorted(files):
+                if f.endswith(ext):
+                    with open(os.path.join(dirpath, f), encoding="utf-8", errors="ignore") as fh:
+                        out.append(fh.read())
+    return tpl, perl
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def _row(label, nbytes, secs, n):
+    print(f"  {label:<28} {secs * 1000:9.1f} ms  {nbytes / secs / 1e6:8.1f} MB/s  {n:7d} msgids")
+
+
+def bench_tokenizer(args):
+    tpl, perl = _corpus()
+    tpl_bytes = sum(len(t.encode("utf-8")) for t in tpl)
+    perl_bytes = sum(len(t.encode("utf-8")) for t in perl)
+    print(f"templates: {len(tpl)} files, {tpl_bytes / 1e6:.2f} MB; "
+          f"perl: {len(perl)} files, {perl_bytes / 1e6:.2f} MB; best of {args.repeat}\n")
+
+    print("templates/web/**/*.html")
+    _row("legacy LOC_RE", tpl_bytes,
+         *_best(lambda: sum(1 for t in tpl for _m in LEGACY_LOC_RE.finditer(t)), args.repeat))
+    _row("scan_template", tpl_bytes,
+         *_best(lambda: sum(1 for t in tpl for _m in scan_template(t)), args.repeat))
+    print("perllib/**/*.pm")
+    _row("legacy GETTEXT_RE", perl_bytes,
+         *_best(lambda: sum(1 for t in perl for _m in LEGACY_GETTEXT_RE.finditer(t)), args.repeat))
+    _row("scan_perl", perl_bytes,
+         *_best(lambda: sum(1 for t in perl for _m in scan_perl(t)), args.repeat))
+
+
+def bench_extract(args):
+    results = {}
+    for label, jobs in (("serial", 1), (f"pool x{args.jobs}", args.jobs)):
+        secs, recs = _best(lambda: collect(scope="all", jobs=jobs), args.repeat)
+        results[label] = recs
+        print(f"  {label:<12} {secs * 1000:9.1f} ms  {len(recs)} records")
+    serial, pooled = results.values()
+    if serial != pooled:
+        print("MISMATCH: parallel extraction differs from serial")
+        return 1
+    print("  parallel output identical to serial")
+
+
+PO_LOCALES = ("ru_RU", "tr_TR", "es")
+
+
+def _po_child(args):
+    """Runs in a fresh interpreter so ru_maxrss is this parser's peak alone."""
+    if args.child == "polib":
+        import polib
+        parse = lambda p: {e.msgid: e for e in polib.pofile(p)}
+    elif args.child == "stream":
+        from i18nlib.poreader import catalog as parse
+    else:
+        parse = lambda p: None
+    best = float("inf")
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        cat = parse(args.path)
+        best = min(best, time.perf_counter() - t0)
+    print(json.dumps({"secs": best, "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                      "entries": len(cat) if cat is not None else 0}))
+
+
+def bench_po(args):
+    if args.child:
+        return _po_child(args)
+
+    def run(parser, path):
+        out = subprocess.check_output([sys.executable, os.path.abspath(__file__), "po",
+                                       "--child", parser, "--path", path,
+                                       "--repeat", str(args.repeat)])
+        return json.loads(out)
+
+    print(f"{'catalog':<8} {'parser':<7} {'parse ms':>9} {'peak RSS MB':>12} {'entries':>8}")
+    for locale in PO_LOCALES:
+        path = po_path(locale)
+        base = run("none", path)["rss_kb"]
+        for parser in ("polib", "stream"):
+            r = run(parser, path)
+            print(f"{locale:<8} {parser:<7} {r['secs'] * 1000:9.1f} "
+                  f"{(r['rss_kb'] - base) / 1024:12.1f} {r['entries']:8d}")
+
+
+def bench_similar(args):
+    from i18nlib import discover_locales
+    from i18nlib.audit import run_audit
+    from i18nlib.similar import Suggester
+
+    missing = [r["msgid"] for r in
+               run_audit({"ru": "ru_RU"}, use_cache=False)["locales"][0]["MISSING"]]
+    if not missing:
+        print("ru_RU has no MISSING msgids: nothing to suggest for")
+        return
+    locales = list(discover_locales())
+    secs, sug = _best(lambda: Suggester(locales), 1)
+    print(f"index over {len(locales)} catalogs: {len(sug.index.strings)} msgids, "
+          f"{len(sug.index.postings)} trigrams, built in {secs * 1000:.0f} ms\n")
+
+    ru = list(sug.catalogs["ru_RU"])
+    secs, _ = _best(lambda: [sug.suggest(m, "ru_RU") for m in missing], args.repeat)
+    print(f"  {'trigram, ru_RU':<24} {secs / len(missing) * 1000:8.2f} ms/query")
+    secs, _ = _best(lambda: [sug.suggest(m, loc) for m in missing for loc in locales], args.repeat)
+    print(f"  {'trigram, all locales':<24} {secs / len(missing) / len(locales) * 1000:8.2f} ms/query")
+    secs, _ = _best(lambda: [difflib.get_close_matches(m, ru, n=3, cutoff=0.6) for m in missing], 1)
+    print(f"  {'difflib scan, ru_RU':<24} {secs / len(missing) * 1000:8.2f} ms/query")
+    print(f"\n  {len(missing)} missing msgids, "
+          f"{sum(1 for m in missing if sug.suggest(m, 'ru_RU'))} with a suggestion (score >= 0.3)")
+
+
+def bench_mo(args):
+    from i18nlib.mofile import MOFile, compile_po
+
+    by_file = {}
+    for m in collect():
+        by_file.setdefault(m.file, []).append(m.msgid.encode("utf-8"))
+    page_file, page = max(by_file.items(), key=lambda kv: len(kv[1]))
+    print(f"page: {page_file} ({len(page)} loc() calls); best of {args.repeat}\n")
+    print(f"{'catalog':<8} {'lookup':<11} {'size KB':>8} {'cmp/lookup':>11} {'py us/page':>11}")
+    for locale in PO_LOCALES:
+        path = po_path(locale)
+        for label, data, find in (("hash table", compile_po(path), "find_hashed"),
+                                  ("bisect", compile_po(path, hash_table=False), "find_bisect")):
+            mo = MOFile(data)
+            fn = getattr(mo, find)
+            secs, _ = _best(lambda: [fn(mid) for mid in page], args.repeat)
+            mo.probes = 0
+            found = sum(1 for mid in page if fn(mid) is not None)
+            print(f"{locale:<8} {label:<11} {len(data) / 1024:8.1f} "
+                  f"{mo.probes / len(page):11.2f} {secs * 1e6:11.0f}   ({found} found)")
+
+
+def bench_tm(args):
+    import tempfile
+
+    from i18nlib import discover_locales
+    from i18nlib.poreader import catalog
+    from i18nlib.tm import TranslationMemory, build
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tm.sqlite")
+        secs, rows = _best(lambda: build(path), args.repeat)
+        print(f"build: {rows} rows in {secs * 1000:.0f} ms ({os.path.getsize(path) / 1024:.0f} KB)\n")
+        tm = TranslationMemory(path)
+        locales = list(discover_locales())
+        probes = [m.msgid for m in collect()]
+        hits = [(mid, loc) for mid in probes for loc in locales]
+        secs, found = _best(lambda: sum(tm.get(mid, loc) is not None for mid, loc in hits), args.repeat)
+        print(f"  {'tm.get(), used msgids':<28} {secs / len(hits) * 1e6:8.2f} us/lookup "
+              f"({found}/{len(hits)} found)")
+        misses = [(mid + " (not in any catalog)", loc) for mid, loc in hits[:2000]]
+        secs, _ = _best(lambda: [tm.get(mid, loc) for mid, loc in misses], args.repeat)
+        print(f"  {'tm.get(), misses':<28} {secs / len(misses) * 1e6:8.2f} us/lookup")
+        secs, _ = _best(lambda: [catalog(po_path(loc)) for loc in locales], 1)
+        print(f"  {'read_po(), all catalogs':<28} {secs * 1000:8.0f} ms before the first lookup")
+        tm.close()
+
+
+BENCHES = {"tokenizer": bench_tokenizer, "extract": bench_extract, "po": bench_po,
+           "similar": bench_similar, "mo": bench_mo, "tm": bench_tm}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("bench", choices=sorted(BENCHES))
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--child", help=argparse.SUPPRESS)
+    ap.add_argument("--path", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    return BENCHES[args.bench](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
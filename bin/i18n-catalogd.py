@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Catalog daemon for the i18n tools (see bin/i18nlib/catalogd.py).
+
+Usage:
+    python3 bin/i18n-catalogd.py serve [--scope S] [--interval SECS]
+    python3 bin/i18n-catalogd.py ping|status|where|missing [--msgid M] [--locale L]
+                                 [--repeat N]
+
+serve    : load every catalog and the template msgids, then answer queries on
+           $I18N_SOCKET (default .i18n-cache/catalogd.sock) until killed.
+           i18n-audit.py, i18n-dump-missing.py and the staging gate use it
+           automatically while it is running.
+others   : send one query and print the JSON reply. --repeat N sends it N
+           times over one connection and reports the mean round trip.
+"""
+import argparse
+import json
+import signal
+import sys
+import time
+
+from i18nlib.catalogd import SOCKET, Client, serve
+from i18nlib.extract import SCOPES
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("op", choices=("serve", "ping", "status", "where", "missing"))
+    ap.add_argument("--socket", default=SOCKET)
+    ap.add_argument("--scope", choices=SCOPES, default="infrasignal")
+    ap.add_argument("--interval", type=float, default=1.0,
+                    help="seconds between change checks (serve)")
+    ap.add_argument("--msgid")
+    ap.add_argument("--locale", default="ru_RU")
+    ap.add_argument("--repeat", type=int, default=1)
+    args = ap.parse_args()
+
+    if args.op == "serve":
+        # SIGTERM unwinds serve() so the socket file is removed
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        print(f"i18n-catalogd: loading ({args.scope})", file=sys.stderr)
+        try:
+            serve(args.scope, args.socket, args.interval)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    req = {"op": args.op, "locale": args.locale, "scope": args.scope}
+    if args.op in ("status", "where"):
+        if args.msgid is None:
+            ap.error(f"{args.op} needs --msgid")
+        req["msgid"] = args.msgid
+    try:
+        client = Client(args.socket)
+    except OSError as e:
+        print(f"i18n-catalogd: not running on {args.socket}: {e}", file=sys.stderr)
+        return 1
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        resp = client.request(req)
+    dt = (time.perf_counter() - t0) / args.repeat
+    client.close()
+    print(json.dumps(resp, ensure_ascii=False, indent=1))
+    if args.repeat > 1:
+        print(f"{args.repeat} requests, mean round trip {dt * 1e6:.0f} us", file=sys.stderr)
+    return 0 if resp.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
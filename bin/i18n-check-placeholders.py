@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Check that translations keep their msgid's placeholders and markup.
+
+Every translated, non-fuzzy entry of every catalog (or of the LOCALEs given)
+is reduced to a signature (i18nlib/placeholders.py) and compared with its
+msgid's:
+
+  placeholder : printf conversions (%s, %d, %.1f, %1$s) differ in number,
+                type or order, a literal %% appeared or went away, or a
+                {{FIELD}} / {0} field is missing or renamed. A plural form is
+                only flagged when it adds a conversion msgid_plural lacks.
+  markup      : the HTML tags differ (<a> without </a>, a dropped <strong>)
+  entity      : the &entities; differ
+
+placeholder and markup issues are errors (exit 1); entity is a warning.
+"""
+import argparse
+import json
+import sys
+import time
+
+from i18nlib import discover_locales, po_path
+from i18nlib.placeholders import ERRORS, check_catalog
+
+KINDS = ("placeholder", "markup", "entity")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("locales", nargs="*", metavar="LOCALE",
+                    help="catalogs to check (default: every catalog under locale/)")
+    ap.add_argument("--format", choices=("text", "json"), default="text")
+    ap.add_argument("--list", type=int, default=5, metavar="N",
+                    help="issues printed per locale and kind (default 5)")
+    ap.add_argument("--no-warnings", action="store_true", help="leave entity warnings out")
+    args = ap.parse_args()
+
+    known = discover_locales()
+    unknown = [loc for loc in args.locales if loc not in known]
+    if unknown:
+        ap.error(f"no catalog for {', '.join(unknown)}")
+    t0 = time.perf_counter()
+    results = {}
+    for loc in args.locales or known:
+        checked, issues = check_catalog(po_path(loc))
+        if args.no_warnings:
+            issues = [i for i in issues if i.kind in ERRORS]
+        results[loc] = {"checked": checked, "issues": issues}
+    elapsed = time.perf_counter() - t0
+    errors = sum(1 for r in results.values() for i in r["issues"] if i.kind in ERRORS)
+    warnings = sum(len(r["issues"]) for r in results.values()) - errors
+
+    if args.format == "json":
+        print(json.dumps({"elapsed": round(elapsed, 3), "errors": errors, "warnings": warnings,
+                          "locales": {loc: dict(r, issues=[i._asdict() for i in r["issues"]])
+                                      for loc, r in results.items()}},
+                         ensure_ascii=False, indent=1))
+        return 1 if errors else 0
+
+    for loc, r in results.items():
+        counts = {kind: sum(1 for i in r["issues"] if i.kind == kind) for kind in KINDS}
+        print(f"{loc:<8} {r['checked']:5d} entries  "
+              + "  ".join(f"{kind}={n}" for kind, n in counts.items()))
+        for kind in KINDS:
+            issues = [i for i in r["issues"] if i.kind == kind]
+            for i in issues[:args.list]:
+                print(f"  {kind.upper():<11} {i.msgid[:50]!r}  {i.detail}")
+            if len(issues) > args.list:
+                print(f"  {kind.upper():<11} ... {len(issues) - args.list} more")
+    entries = sum(r["checked"] for r in results.values())
+    print(f"\n{len(results)} locales, {entries} entries in {elapsed:.2f}s: "
+          f"{errors} error(s), {warnings} warning(s)")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
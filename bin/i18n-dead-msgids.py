@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Classify catalog entries as used, unused or obsolete against the source tree.
+
+  used     : msgid referenced by a loc()/_()/nget() call anywhere in the tree
+             (extraction scope `full`, bin/ scripts included), or allowlisted
+             in i18n-slim-mo.data.json
+  unused   : live entry that nothing references any more
+  obsolete : #~ entry (never compiled into the .mo)
+
+An unused msgid that still appears as a quoted string somewhere in the tree
+(a FormHandler label, a message built at runtime) may well be looked up
+through a variable. --compact refuses to run while any such msgid is
+neither allowlisted (`allow`, i18n-slim-mo.data.json) nor gone from the code.
+
+--compact rewrites each catalog without its unused and obsolete entries. Kept
+entries stay byte for byte as they were. Removed blocks are appended, with
+their translations, to FixMyStreet.archive.po next to the catalog (once per
+msgid), so a string that comes back can be restored from there.
+"""
+import argparse
+import json
+import os
+import sys
+
+from i18nlib import discover_locales, normalize, po_path, rel
+from i18nlib.audit import LANGS
+from i18nlib.extract import ExtractCache, collect, literals
+from i18nlib.mofile import compile_mo, po_messages
+from i18nlib.poreader import read_blocks, read_po
+from i18nlib.writer import write_if_changed
+
+SLIM_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "i18n-slim-mo.data.json")
+CLASSES = ("used", "unused", "obsolete")
+ARCHIVE_HEAD = "# Entries removed from FixMyStreet.po by bin/i18n-dead-msgids.py --compact\n\n"
+
+
+def referenced(jobs=1):
+    """Exact and whitespace-normalized msgids referenced anywhere in the tree."""
+    ids = {m.msgid for m in collect(ExtractCache(scope="full"), scope="full", jobs=jobs)}
+    with open(SLIM_DATA, encoding="utf-8") as fh:
+        ids.update(json.load(fh)["allow"])
+    return ids | {normalize(mid) for mid in ids}
+
+
+def classify(po, used):
+    """[(class or None, entry, block text)] for every block of a catalog."""
+    out = []
+    for e, text in read_blocks(po):
+        if e is None or not e.msgid:
+            cls = None  # header, comment-only block: always kept
+        elif e.obsolete:
+            cls = "obsolete"
+        elif e.msgid in used or normalize(e.msgid) in used:
+            cls = "used"
+        else:
+            cls = "unused"
+        out.append((cls, e, text))
+    return out
+
+
+def compact(po, blocks):
+    """Rewrite po without unused/obsolete blocks and archive them; returns written paths."""
+    kept = [text for cls, _e, text in blocks if cls in (None, "used")]
+    dropped = [(e, text) for cls, e, text in blocks if cls in ("unused", "obsolete")]
+    if not dropped:
+        return []
+    written = []
+    body = "".join(kept).rstrip("\n") + "\n"
+    if write_if_changed(po, body.encode("utf-8")):
+        written.append(po)
+
+    archive = po[:-3] + ".archive.po"
+    if os.path.exists(archive):
+        with open(archive, encoding="utf-8") as fh:
+            old = fh.read().rstrip("\n") + "\n\n"
+        archived = {e.msgid for e in read_po(archive)}
+    else:
+        old, archived = ARCHIVE_HEAD, set()
+    new = [text.rstrip("\n") + "\n\n" for e, text in dropped if e.msgid not in archived]
+    if new and write_if_changed(archive, (old + "".join(new)).rstrip("\n").encode("utf-8") + b"\n"):
+        written.append(archive)
+    return written
+
+
+def suspects(blocks, quoted):
+    """Unused msgids that appear as a quoted string in the tree: {msgid: path}."""
+    return {e.msgid: quoted.get(e.msgid) or quoted[normalize(e.msgid)]
+            for cls, e, _t in blocks
+            if cls == "unused" and (e.msgid in quoted or normalize(e.msgid) in quoted)}
+
+
+def report(locale, po, blocks, used):
+    counts = dict.fromkeys(CLASSES, 0)
+    sizes = dict.fromkeys(CLASSES, 0)
+    for cls, _e, text in blocks:
+        if cls:
+            counts[cls] += 1
+            sizes[cls] += len(text.encode("utf-8"))
+    messages = po_messages(po)
+    slim = [(orig, tr) for orig, tr in messages
+            if not orig or orig.split(b"\0", 1)[0].decode("utf-8") in used]
+    return {"locale": locale, "counts": counts, "bytes": sizes,
+            "po_bytes": os.path.getsize(po),
+            "mo_bytes": len(compile_mo(messages)), "mo_bytes_compacted": len(compile_mo(slim)),
+            "unused": [e.msgid for cls, e, _t in blocks if cls == "unused"]}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--all-locales", action="store_true",
+                    help="every catalog under locale/, not just ru/tr/es")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--list", action="store_true", help="print the unused msgids")
+    ap.add_argument("--format", choices=("text", "json"), default="text")
+    ap.add_argument("--compact", action="store_true",
+                    help="drop unused/obsolete entries, archiving them")
+    args = ap.parse_args()
+
+    used = referenced(args.jobs)
+    quoted = literals("full")
+    quoted.update({normalize(q): path for q, path in list(quoted.items())})
+    locales = list(discover_locales() if args.all_locales else LANGS.values())
+    results, catalogs, dynamic = [], [], {}
+    for locale in locales:
+        po = po_path(locale)
+        blocks = classify(po, used)
+        results.append(report(locale, po, blocks, used))
+        catalogs.append((po, blocks))
+        dynamic.update(suspects(blocks, quoted))
+    if args.compact and dynamic:
+        print(f"--compact refused: {len(dynamic)} unused msgid(s) are still quoted in the "
+              f"tree and may be looked up at runtime. Allowlist them (`allow` in "
+              f"bin/{os.path.basename(SLIM_DATA)}) or remove them from the code:", file=sys.stderr)
+        for mid, path in sorted(dynamic.items(), key=lambda kv: (kv[1], kv[0])):
+            print(f"  {mid[:70]!r}  {path}", file=sys.stderr)
+        return 1
+    written = []
+    if args.compact:
+        for po, blocks in catalogs:
+            written.extend(compact(po, blocks))
+
+    if args.format == "json":
+        print(json.dumps({"locales": results, "quoted_unused": dynamic,
+                          "written": [rel(p) for p in written]},
+                         ensure_ascii=False, indent=1))
+        return 0
+
+    print(f"{'locale':<8} {'used':>6} {'unused':>7} {'obsolete':>9} {'po KB':>7} "
+          f"{'dead KB':>8} {'mo KB':>15}")
+    for r in results:
+        c, b = r["counts"], r["bytes"]
+        print(f"{r['locale']:<8} {c['used']:6d} {c['unused']:7d} {c['obsolete']:9d} "
+              f"{r['po_bytes'] / 1024:7.0f} {(b['unused'] + b['obsolete']) / 1024:8.0f} "
+              f"{r['mo_bytes'] / 1024:6.0f} -> {r['mo_bytes_compacted'] / 1024:<5.0f}")
+        if args.list:
+            for mid in r["unused"]:
+                print(f"    {mid[:90]!r}")
+    if dynamic:
+        print(f"\n{len(dynamic)} unused msgid(s) still quoted in the tree (not allowlisted):")
+        for mid, path in sorted(dynamic.items(), key=lambda kv: (kv[1], kv[0])):
+            print(f"  {mid[:70]!r}  {path}")
+    if args.compact:
+        print(f"\n{len(written)} file(s) written")
+        for path in written:
+            print(f"  {rel(path)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
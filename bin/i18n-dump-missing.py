@@ -1,46 +1,105 @@
 #!/usr/bin/env python3
 """Dump the exact msgids that are missing from the ru catalog (same set for all
-three languages) as a JSON list, preserving placeholders/markup."""
-import os, re, json
-import polib
-
-ROOT = "/opt/infrasignal-dev"
-TPL_DIR = os.path.join(ROOT, "templates/web/infrasignal")
-COBRAND = os.path.join(ROOT, "perllib/FixMyStreet/Cobrand/Infrasignal.pm")
-
-LOC_RE = re.compile(r"""loc\(\s*(['"])(.*?)(?<!\\)\1""", re.S)
-GETTEXT_RE = re.compile(r"""(?<![\w])_\(\s*(['"])(.*?)(?<!\\)\1""", re.S)
-
-
-def collect():
-    ids = {}
-    for dp, _d, fs in os.walk(TPL_DIR):
-        for f in fs:
-            if f.endswith(".html"):
-                t = open(os.path.join(dp, f), encoding="utf-8", errors="ignore").read()
-                for m in LOC_RE.finditer(t):
-                    ids.setdefault(m.group(2), os.path.join(dp, f)[len(ROOT)+1:])
-    t = open(COBRAND, encoding="utf-8", errors="ignore").read()
-    for m in GETTEXT_RE.finditer(t):
-        ids.setdefault(m.group(2), "cobrand")
-    return ids
-
-
-po = polib.pofile(os.path.join(ROOT, "locale/ru_RU.UTF-8/LC_MESSAGES/FixMyStreet.po"))
-have = set(e.msgid for e in po)
-norm = {re.sub(r"\s+", " ", e.msgid).strip() for e in po}
-
-missing = []
-for mid, f in collect().items():
-    if not mid.strip():
-        continue
-    if mid in have or re.sub(r"\s+", " ", mid).strip() in norm:
-        continue
-    missing.append({"msgid": mid, "file": f})
+three languages) as a JSON list, preserving placeholders/markup.
+
+--suggest K adds, per msgid, the K most similar translated catalog entries for
+each audited language (trigram index, i18nlib/similar.py) as starting points.
+
+--jsonl streams one JSON object per line as each missing msgid is found, with
+the total on stderr. --since REF only extracts from the InfraSignal templates
+and Perl files git reports as changed since REF (including uncommitted and
+untracked ones), which is what a pre-commit check needs.
+"""
+import argparse
+import json
+import os
+import sys
+
+from i18nlib import po_path
+from i18nlib.catindex import CatalogIndex
+from i18nlib.extract import changed_since, collect
 
 # drop obvious proper-noun / placeholder false positives
 SKIP = {"MapIt", "JSON:", "SocietyWorks", "WCAG 2.1 AA", "Open311 v2", "your@email.com"}
-missing = [m for m in missing if m["msgid"] not in SKIP]
 
-print(json.dumps(missing, ensure_ascii=False, indent=1))
-print(f"\nTOTAL={len(missing)}", )
+
+def iter_missing(paths=None):
+    """First use of each msgid absent from ru_RU, in extraction order."""
+    idx = CatalogIndex.open(po_path("ru_RU"))
+    seen = set()
+    for m in collect(paths=paths):
+        mid = m.msgid
+        if not mid.strip() or mid in seen:
+            continue
+        seen.add(mid)
+        if mid in idx:
+            continue
+        rec = {"msgid": mid, "file": m.file, "line": m.line}
+        if m.msgid_plural is not None:
+            rec["msgid_plural"] = m.msgid_plural
+        yield rec
+
+
+def find_missing(paths=None):
+    return list(iter_missing(paths))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--suggest", type=int, default=0, metavar="K",
+                    help="add the K nearest translated entries per language")
+    ap.add_argument("--jsonl", action="store_true",
+                    help="one JSON record per line, streamed as found")
+    ap.add_argument("--since", metavar="REF",
+                    help="only files changed since this git ref")
+    args = ap.parse_args()
+
+    if args.since:
+        try:
+            paths = changed_since(args.since)
+        except ValueError as e:
+            ap.error(f"--since {args.since}: {e}")
+        missing = iter_missing(paths)
+    else:
+        from i18nlib.catalogd import ask
+        # a running i18n-catalogd has the same answer in memory
+        missing = ask("missing", locale="ru_RU", scope="infrasignal")
+        if missing is None:
+            missing = iter_missing()
+    missing = (m for m in missing if m["msgid"] not in SKIP)
+
+    if args.suggest:
+        from i18nlib.audit import LANGS
+        from i18nlib.similar import Suggester
+        sug = Suggester(LANGS.values())
+
+        def with_suggestions(records):
+            for m in records:
+                m["suggest"] = {loc: sug.suggest(m["msgid"], loc, k=args.suggest)
+                                for loc in LANGS.values()}
+                yield m
+
+        missing = with_suggestions(missing)
+
+    if args.jsonl:
+        total = 0
+        try:
+            for m in missing:
+                sys.stdout.write(json.dumps(m, ensure_ascii=False) + "\n")
+                sys.stdout.flush()
+                total += 1
+        except BrokenPipeError:
+            # reader went away (| head): stop quietly
+            sys.stdout = open(os.devnull, "w")
+            return 1
+        print(f"TOTAL={total}", file=sys.stderr)
+        return 0
+
+    missing = list(missing)
+    print(json.dumps(missing, ensure_ascii=False, indent=1))
+    print(f"\nTOTAL={len(missing)}", )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Check that catalogs render glossary terms the way the glossary mandates.
+
+i18n-glossary.data.json maps each English term (its whole-word source forms,
+plus phrases in which it is a verb and does not count) to the stems its
+translation must contain, per locale: "report" is обращение in ru_RU,
+bildirim in tr_TR and reporte in es. Every translated, non-fuzzy entry whose
+msgid uses a term is reported when its msgstr contains none of the term's
+stems for that locale. All terms are compiled into one Aho-Corasick
+automaton (i18nlib/glossary.py), so each msgid and msgstr is scanned once.
+
+Exits 1 when an entry breaks the glossary.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+
+from i18nlib import po_path
+from i18nlib.glossary import Glossary
+from i18nlib.poreader import read_po
+
+BIN = os.path.dirname(os.path.abspath(__file__))
+DATA_FILE = os.path.join(BIN, "i18n-glossary.data.json")
+
+
+def main():
+    glossary = Glossary.load(DATA_FILE)
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("locales", nargs="*", metavar="LOCALE",
+                    help=f"locales to check (default: all of {', '.join(glossary.locales)})")
+    ap.add_argument("--term", action="append", help="only this glossary term (repeatable)")
+    ap.add_argument("--format", choices=("text", "json"), default="text")
+    ap.add_argument("--list", type=int, default=5, metavar="N",
+                    help="entries printed per locale and term (default 5)")
+    args = ap.parse_args()
+
+    unknown = [loc for loc in args.locales if loc not in glossary.locales]
+    if unknown:
+        ap.error(f"no glossary targets for {', '.join(unknown)}")
+    known = {t["term"] for t in glossary.terms}
+    unknown = [t for t in args.term or () if t not in known]
+    if unknown:
+        ap.error(f"not in the glossary: {', '.join(unknown)}")
+
+    t0 = time.perf_counter()
+    results = {}
+    for loc in args.locales or glossary.locales:
+        issues = glossary.check_catalog(read_po(po_path(loc), obsolete=False), loc)
+        results[loc] = [i for i in issues if not args.term or i.term in args.term]
+    elapsed = time.perf_counter() - t0
+    total = sum(len(issues) for issues in results.values())
+
+    if args.format == "json":
+        print(json.dumps({"elapsed": round(elapsed, 3), "issues": total,
+                          "locales": {loc: [i._asdict() for i in issues]
+                                      for loc, issues in results.items()}},
+                         ensure_ascii=False, indent=1))
+        return 1 if total else 0
+
+    for loc, issues in results.items():
+        counts = Counter(i.term for i in issues)
+        print(f"{loc:<8} {len(issues):4d} entries off-glossary  "
+              + "  ".join(f"{term}={n}" for term, n in counts.most_common()))
+        for term in counts:
+            rows = [i for i in issues if i.term == term]
+            print(f"  {term} -> {' / '.join(rows[0].expected)}")
+            for i in rows[:args.list]:
+                print(f"    {i.msgid[:50]!r}  =>  {i.msgstr[:50]!r}")
+            if len(rows) > args.list:
+                print(f"    ... {len(rows) - args.list} more")
+    print(f"\n{len(results)} locales, {len(glossary.terms)} terms in {elapsed:.2f}s: "
+          f"{total} entr{'y' if total == 1 else 'ies'} off-glossary")
+    return 1 if total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
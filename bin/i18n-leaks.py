@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Find English left inside translations, per entry, in every catalog.
+
+Each translated, non-fuzzy msgstr is split into words by Unicode script
+(i18nlib/leaks.py). In a catalog written in another script (ru, el, ar, zh,
+...) the share of its words that are lowercase Latin words also found in the
+msgid is reported; in a Latin-script catalog, the share that are common
+English words also found in the msgid and not used natively by the
+catalog. An entry at or above --threshold with two such words (or one that
+is the whole string, in non-Latin catalogs) is a leak, and so is an msgstr
+identical to its msgid (in Latin-script catalogs only above 12 characters)
+unless it is made of brand names and acronyms alone. The audit's LEAK
+category comes from the same scanner.
+
+Exits 1 when any leak is found, so it can gate CI.
+"""
+import argparse
+import json
+import sys
+import time
+
+from i18nlib import discover_locales, po_path
+from i18nlib.leaks import THRESHOLD, scan_catalog
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("locales", nargs="*", metavar="LOCALE",
+                    help="catalogs to scan (default: every catalog under locale/)")
+    ap.add_argument("--threshold", type=float, default=THRESHOLD,
+                    help=f"share of leaked words that makes a leak (default {THRESHOLD})")
+    ap.add_argument("--format", choices=("text", "json"), default="text")
+    ap.add_argument("--list", type=int, default=5, metavar="N",
+                    help="leaks printed per locale, worst first (default 5)")
+    args = ap.parse_args()
+
+    known = discover_locales()
+    unknown = [loc for loc in args.locales if loc not in known]
+    if unknown:
+        ap.error(f"no catalog for {', '.join(unknown)}")
+    t0 = time.perf_counter()
+    results = {}
+    for loc in args.locales or known:
+        scanner, scanned, leaks = scan_catalog(po_path(loc), args.threshold)
+        results[loc] = {"script": scanner.script, "native": sorted(scanner.native),
+                        "scanned": scanned,
+                        "leaks": sorted(leaks, key=lambda lk: -lk.share)}
+    elapsed = time.perf_counter() - t0
+    total = sum(len(r["leaks"]) for r in results.values())
+
+    if args.format == "json":
+        print(json.dumps({"elapsed": round(elapsed, 3), "leaks": total,
+                          "locales": {loc: dict(r, leaks=[lk._asdict() for lk in r["leaks"]])
+                                      for loc, r in results.items()}},
+                         ensure_ascii=False, indent=1))
+        return 1 if total else 0
+
+    for loc, r in results.items():
+        print(f"{loc:<8} {r['script']:<9} {r['scanned']:5d} strings  {len(r['leaks']):3d} leak(s)")
+        for lk in r["leaks"][:args.list]:
+            print(f"  {lk.share:4.0%} {lk.msgstr[:60]!r}  [{' '.join(lk.words[:8])}]")
+        if len(r["leaks"]) > args.list:
+            print(f"  ... {len(r['leaks']) - args.list} more")
+    scanned = sum(r["scanned"] for r in results.values())
+    print(f"\n{len(results)} locales, {scanned} strings in {elapsed:.2f}s: {total} leak(s)")
+    return 1 if total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
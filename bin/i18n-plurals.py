@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Check plural entries against each catalog's Plural-Forms header.
+
+For every locale the plural= expression is compiled (i18nlib/plural.py) and
+evaluated over n = 0..--limit to find which form indices are reachable, with
+the first few n that select each one. Then:
+
+  header    : Plural-Forms missing or unparseable, or plural= yields an index
+              >= nplurals
+  forms     : a plural entry's msgstr[] indices are not 0..nplurals-1
+  duplicate : two reachable forms of an entry carry the same text (one string
+              copied into every slot); not checked for languages whose forms
+              are normally identical (tr, zh, ...: SAME_FORM_LANGS) or when
+              plural= only ever picks one form
+
+header and forms issues are errors (exit 1); duplicate is a warning.
+"""
+import argparse
+import json
+import sys
+import time
+
+from i18nlib import discover_locales, po_path
+from i18nlib.audit import LANGS
+from i18nlib.plural import LIMIT, check_catalog, distinct_forms_expected
+
+ERRORS = ("header", "forms")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--all-locales", action="store_true",
+                    help="every catalog under locale/, not just ru/tr/es")
+    ap.add_argument("--limit", type=int, default=LIMIT, help=f"largest n evaluated (default {LIMIT})")
+    ap.add_argument("--format", choices=("text", "json"), default="text")
+    ap.add_argument("--list", type=int, default=5, metavar="N",
+                    help="issues printed per locale and kind (default 5)")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    locales = list(discover_locales() if args.all_locales else LANGS.values())
+    results = {loc: check_catalog(po_path(loc), args.limit, distinct_forms_expected(loc))
+               for loc in locales}
+    elapsed = time.perf_counter() - t0
+    errors = sum(1 for r in results.values() for i in r["issues"] if i.kind in ERRORS)
+
+    if args.format == "json":
+        print(json.dumps({loc: dict(r, issues=[i._asdict() for i in r["issues"]])
+                          for loc, r in results.items()}, ensure_ascii=False, indent=1))
+        return 1 if errors else 0
+
+    for loc, r in results.items():
+        forms = "  ".join(f"[{idx}] n={','.join(map(str, ns))}" for idx, ns in r["examples"].items())
+        print(f"{loc:<8} nplurals={r['nplurals']}  {r['entries']:3d} plural entries  {forms}")
+        if r["unreachable"]:
+            print(f"         unreachable for integer n<={args.limit}: {r['unreachable']}")
+        for kind in ("header", "forms", "duplicate"):
+            issues = [i for i in r["issues"] if i.kind == kind]
+            for i in issues[:args.list]:
+                print(f"  {kind.upper():<9} {i.msgid[:50]!r}  {i.detail}" if i.msgid
+                      else f"  {kind.upper():<9} {i.detail}")
+            if len(issues) > args.list:
+                print(f"  {kind.upper():<9} ... {len(issues) - args.list} more")
+    warnings = sum(len(r["issues"]) for r in results.values()) - errors
+    print(f"\n{len(locales)} locales in {elapsed:.2f}s: {errors} error(s), {warnings} warning(s)")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
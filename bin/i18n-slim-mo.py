@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Build slim per-locale .mo catalogs with only the msgids InfraSignal uses.
+
+Reachable msgids are the `cobrand` extraction scope (InfraSignal + base
+templates, default email templates, alert types, core Perl minus other
+cobrands' modules), minus msgids whose every use is under an `exclude` prefix
+in i18n-slim-mo.data.json, plus its `allow` list: msgids reaching _() through a
+variable, which the extractor cannot see.
+
+Each locale gets locale/<dir>/LC_MESSAGES/<domain>.mo next to FixMyStreet.mo,
+compiled like msgfmt (with hash table) and only rewritten when it changes.
+bin/make_msg runs this after msgfmt, and the Infrasignal cobrand loads it
+through `sub language_domain { 'InfraSignal' }`.
+
+Reports entries, file size and the resident size of the mapping with every
+page touched, which is what each preforked worker holds per language.
+
+The fallback check does not trust the extractor: it takes every catalog
+msgid that appears as a quoted string in the cobrand scope's sources (outside
+`exclude`), whether or not it is passed to loc()/_() where the scanner can see
+it, looks each up in both catalogs and fails (exit 1) if the slim one drops or
+changes its translation. A msgid it reports is reached at runtime through a
+variable (a FormHandler label, say) and belongs in `allow`; a quoted string
+that only happens to equal a msgid (a CSV header, a tag name) goes in
+`not_looked_up` instead.
+"""
+import argparse
+import json
+import mmap
+import os
+import sys
+import tempfile
+
+from i18nlib import discover_locales, normalize, po_path, rel
+from i18nlib.audit import LANGS
+from i18nlib.extract import ExtractCache, collect, literals
+from i18nlib.mofile import MOFile, compile_mo, po_messages
+from i18nlib.writer import write_if_changed
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "i18n-slim-mo.data.json")
+
+
+def reachable(data, jobs=1):
+    """Set of msgids an InfraSignal request can look up."""
+    exclude = tuple(data["exclude"])
+    used = set()
+    for m in collect(ExtractCache(scope="cobrand"), scope="cobrand", jobs=jobs):
+        if m.msgid.strip() and not m.file.startswith(exclude):
+            used.add(m.msgid)
+    return used | set(data["allow"])
+
+
+def slim(messages, keep):
+    """The header plus the (original, translation) pairs whose msgid is kept."""
+    return [(orig, tr) for orig, tr in messages
+            if not orig or orig.split(b"\0", 1)[0].decode("utf-8") in keep]
+
+
+def quoted(data):
+    """Quoted strings in the cobrand scope's sources outside `exclude`,
+    whitespace-normalized too, less `not_looked_up`."""
+    exclude = tuple(data["exclude"])
+    found = {q for q, path in literals("cobrand").items() if not path.startswith(exclude)}
+    return (found | {normalize(q) for q in found}) - set(data.get("not_looked_up", ()))
+
+
+def mapped_rss_kb(path):
+    """Resident kB of a read-only mapping of path with every page touched."""
+    path = os.path.realpath(path)  # /proc lists the resolved path
+    with open(path, "rb") as fh:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        sum(mm[i] for i in range(0, len(mm), mmap.PAGESIZE))
+        with open("/proc/self/smaps") as fh:
+            inside = False
+            for line in fh:
+                if line[:1].isdigit() or line[:1] in "abcdef":
+                    inside = line.rstrip().endswith(path)
+                elif inside and line.startswith("Rss:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    finally:
+        mm.close()
+    return None
+
+
+def fallback_check(full, slim, msgids):
+    """msgids whose translation differs between the two catalogs."""
+    return sorted(mid for mid in msgids
+                  if full.find(mid.encode("utf-8")) != slim.find(mid.encode("utf-8")))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--all-locales", action="store_true",
+                    help="every catalog under locale/, not just ru/tr/es")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    args = ap.parse_args()
+
+    with open(DATA_FILE, encoding="utf-8") as fh:
+        data = json.load(fh)
+    keep = reachable(data, jobs=args.jobs)
+    check = quoted(data)
+    locales = list(discover_locales() if args.all_locales else LANGS.values())
+    print(f"{len(keep)} reachable msgids ({len(data['allow'])} allowlisted)\n")
+    print(f"{'locale':<8} {'entries':>13} {'file KB':>17} {'RSS/worker KB':>17}  written")
+
+    failed = checked = 0
+    for locale in locales:
+        po = po_path(locale)
+        messages = po_messages(po)
+        full_data = compile_mo(messages)
+        slim_messages = slim(messages, keep)
+        slim_data = compile_mo(slim_messages)
+        out = os.path.join(os.path.dirname(po), data["domain"] + ".mo")
+        written = write_if_changed(out, slim_data)
+
+        # measure the full catalog as compiled now, not a possibly stale .mo
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(po), suffix=".mo") as tmp:
+            tmp.write(full_data)
+            tmp.flush()
+            rss_full, rss_slim = mapped_rss_kb(tmp.name), mapped_rss_kb(out)
+        rss = "n/a" if rss_full is None else f"{rss_full:>6} -> {rss_slim:<6}"
+        print(f"{locale:<8} {len(messages):>5} -> {len(slim_messages):<5} "
+              f"{len(full_data) / 1024:>7.0f} -> {len(slim_data) / 1024:<7.0f} {rss:>17}  "
+              f"{rel(out) if written else 'unchanged'}")
+
+        msgids = {mid for mid in (orig.split(b"\0", 1)[0].decode("utf-8")
+                                  for orig, _tr in messages if orig)
+                  if mid in check or normalize(mid) in check}
+        checked = max(checked, len(msgids))
+        bad = fallback_check(MOFile(full_data), MOFile(slim_data), msgids)
+        if bad:
+            failed += 1
+            print(f"  FALLBACK CHECK FAILED: {len(bad)} msgids quoted in the sources are "
+                  f"missing or differ, e.g. {bad[0]!r}")
+            for mid in bad[:10]:
+                print(f"    {mid[:90]!r}")
+
+    if failed:
+        return 1
+    print(f"\nfallback check: up to {checked} catalog msgids quoted in the sources translate "
+          f"identically in {len(locales)} slim catalogs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
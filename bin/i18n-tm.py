@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Build and query the SQLite translation memory (i18nlib/tm.py).
+
+Usage:
+    python3 bin/i18n-tm.py import [--force]
+    python3 bin/i18n-tm.py lookup MSGID [--locale LOCALE ...]
+    python3 bin/i18n-tm.py stats
+
+import    : rebuild from every catalog, the i18n-apply-translations
+            dictionaries and i18n-fill-missing.data.json (only if a source
+            changed, unless --force)
+lookup    : every locale's translation of MSGID (whitespace-insensitive) and
+            where it comes from
+stats     : rows per locale and per source
+
+i18n-apply-translations.py and i18n-fill-missing.py open the memory
+themselves and rebuild it when it is stale, so import is only needed to
+prebuild it or to time it.
+"""
+import argparse
+import json
+import sqlite3
+import sys
+import time
+
+from i18nlib import rel
+from i18nlib.tm import PATH, TranslationMemory, build, signature, source_files
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("cmd", choices=("import", "lookup", "stats"))
+    ap.add_argument("msgid", nargs="?")
+    ap.add_argument("--locale", action="append", help="restrict lookup to LOCALE (repeatable)")
+    ap.add_argument("--force", action="store_true", help="import even if no source changed")
+    ap.add_argument("--format", choices=("text", "json"), default="text")
+    args = ap.parse_args()
+
+    if args.cmd == "import":
+        files = source_files()
+        t0 = time.perf_counter()
+        try:
+            with TranslationMemory(PATH) as tm:
+                fresh = tm.signature == signature(files)
+        except (sqlite3.Error, ValueError):
+            fresh = False
+        if fresh and not args.force:
+            print(f"{rel(PATH)}: up to date ({len(files)} sources)")
+            return 0
+        rows = build(PATH, files)
+        print(f"{rel(PATH)}: {rows} translations from {len(files)} sources "
+              f"in {time.perf_counter() - t0:.2f}s")
+        return 0
+
+    with TranslationMemory.open() as tm:
+        if args.cmd == "stats":
+            st = tm.stats()
+            if args.format == "json":
+                print(json.dumps(st, ensure_ascii=False, indent=1))
+                return 0
+            print(f"{rel(PATH)}: {st['rows']} translations of {st['keys']} msgids "
+                  f"in {len(st['locales'])} locales\n")
+            for source, n in st["sources"].items():
+                print(f"  {n:6d}  {source}")
+            return 0
+
+        if not args.msgid:
+            ap.error("lookup needs a MSGID")
+        hits = [h for h in tm.lookup(args.msgid) if not args.locale or h[0] in args.locale]
+        if args.format == "json":
+            print(json.dumps([{"locale": loc, "msgstr": value, "source": source}
+                              for loc, value, source in hits], ensure_ascii=False, indent=1))
+        else:
+            for loc, value, source in hits:
+                print(f"{loc:<8} {value!r}  [{source}]")
+        return 0 if hits else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
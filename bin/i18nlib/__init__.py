@@ -0,0 +1,43 @@
+"""Shared code for the InfraSignal i18n tools in bin/ (i18n-*.py).
+
+The tools are run as `python3 bin/i18n-audit.py` etc., so bin/ is on sys.path
+and this package imports as plain `i18nlib`.
+"""
+import glob
+import os
+import re
+
+ROOT = os.environ.get("INFRASIGNAL_ROOT", "/opt/infrasignal-dev")
+TPL_DIR = os.path.join(ROOT, "templates/web/infrasignal")
+COBRAND = os.path.join(ROOT, "perllib/FixMyStreet/Cobrand/Infrasignal.pm")
+CACHE_DIR = os.environ.get("I18N_CACHE_DIR", os.path.join(ROOT, ".i18n-cache"))
+
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize(s):
+    # collapse TT-style whitespace so multi-line msgids match catalog forms
+    return _WS_RE.sub(" ", s).strip()
+
+
+def po_path(locale):
+    return os.path.join(ROOT, f"locale/{locale}.UTF-8/LC_MESSAGES/FixMyStreet.po")
+
+
+def discover_locales():
+    """{lang: locale} for every locale/<locale>.UTF-8/LC_MESSAGES/FixMyStreet.po.
+
+    lang is the locale without the .UTF-8 suffix (ru_RU, es, zh), which is
+    also what po_path() takes.
+    """
+    out = {}
+    for po in sorted(glob.glob(os.path.join(ROOT, "locale/*/LC_MESSAGES/FixMyStreet.po"))):
+        locale = os.path.basename(os.path.dirname(os.path.dirname(po)))
+        if locale.endswith(".UTF-8"):
+            locale = locale[:-len(".UTF-8")]
+        out[locale] = locale
+    return out
+
+
+def rel(path):
+    return os.path.relpath(path, ROOT)
@@ -0,0 +1,228 @@
+"""Apply translation dictionaries to a catalog in one pass.
+
+A dictionary is a data file mapping English msgids to translations:
+
+  .tsv   msgid<TAB>msgstr, or msgid<TAB>form0<TAB>form1... for plural
+         entries; \\n, \\t and \\\\ are escaped, lines starting with # are
+         comments
+  .json  {msgid: msgstr or [forms]}
+
+Layers are given in precedence order, first match wins. A layer can be
+restricted to fuzzy or untranslated entries (`only`). A translation memory
+(i18nlib.tm), if given, answers for entries no layer has. Like the translate_ru*
+passes these replace, the engine only fills untranslated entries and fixes
+fuzzy ones (dropping the flag); translated entries are left alone, except a
+plural entry whose msgstr[] count is not the header's nplurals, which is
+refilled like an untranslated one.
+
+A plural value must have exactly nplurals forms (a single string fills every
+form). One that does not is refused: the entry is left as it is and the
+msgid is reported in Stats.rejected.
+
+apply_catalog() walks the catalog block by block (poreader.read_blocks).
+Untouched blocks are copied byte for byte; the changed ones are parsed by
+polib together, in one go, and re-rendered, so the diff shows just the new
+translations. The stats come from the same pass.
+"""
+import csv
+import json
+import os
+import re
+from collections import namedtuple
+
+import polib
+
+from .poreader import read_blocks
+
+Layer = namedtuple("Layer", "path only table")
+Stats = namedtuple("Stats", "total translated fuzzy untranslated "
+                            "filled fuzzy_fixed added from_tm still_untranslated still_fuzzy "
+                            "rejected")
+
+ONLY = (None, "fuzzy", "untranslated")
+_TSV_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "\\": "\\"}
+_TSV_ESC_RE = re.compile(r"\\(.)")
+_NPLURALS_RE = re.compile(r"nplurals\s*=\s*(\d+)")
+_HEADER = 'msgid ""\nmsgstr ""\n\n'
+
+
+def _tsv_unescape(s):
+    return _TSV_ESC_RE.sub(lambda m: _TSV_ESCAPES.get(m.group(1), m.group(0)), s)
+
+
+def tsv_escape(s):
+    return s.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def load_dictionary(path):
+    """{msgid: str or tuple of plural forms} from a .tsv or .json file."""
+    table = {}
+    if path.endswith(".json"):
+        with open(path, encoding="utf-8") as fh:
+            for msgid, value in json.load(fh).items():
+                table[msgid] = value if isinstance(value, str) else tuple(value)
+        return table
+    with open(path, encoding="utf-8", newline="") as fh:
+        for lineno, row in enumerate(csv.reader(fh, delimiter="\t", quoting=csv.QUOTE_NONE), 1):
+            if not row or row[0].startswith("#"):
+                continue
+            if len(row) < 2:
+                raise ValueError(f"{path}:{lineno}: expected msgid<TAB>msgstr")
+            msgid, forms = _tsv_unescape(row[0]), [_tsv_unescape(v) for v in row[1:]]
+            table[msgid] = forms[0] if len(forms) == 1 else tuple(forms)
+    return table
+
+
+def merge(layers):
+    """({msgid: value} for fuzzy entries, {msgid: value} for untranslated ones).
+
+    layers are in precedence order; the first layer that has a msgid and
+    applies to the entry's state wins.
+    """
+    fuzzy, untranslated = {}, {}
+    for layer in reversed(layers):
+        if layer.only in (None, "fuzzy"):
+            fuzzy.update(layer.table)
+        if layer.only in (None, "untranslated"):
+            untranslated.update(layer.table)
+    return fuzzy, untranslated
+
+
+def is_translated(e):
+    """polib's POEntry.translated() for a poreader Entry."""
+    if e.obsolete or "fuzzy" in e.flags:
+        return False
+    if e.msgstr:
+        return True
+    return bool(e.msgstr_plural) and all(e.msgstr_plural.values())
+
+
+def nplurals(header_msgstr, default=2):
+    m = _NPLURALS_RE.search(header_msgstr)
+    return int(m.group(1)) if m else default
+
+
+def forms_fit(value, n):
+    """True when value can fill a plural entry of a catalog with n plural forms."""
+    return isinstance(value, str) or len(value) == n
+
+
+def _fill(entry, value, n):
+    """Set a polib entry's translation from a dictionary value."""
+    if entry.msgid_plural:
+        if not forms_fit(value, n):
+            raise ValueError(f"{entry.msgid!r}: {len(value)} plural forms, nplurals={n}")
+        forms = [value] * n if isinstance(value, str) else list(value)
+        entry.msgstr_plural = dict(enumerate(forms))
+    else:
+        entry.msgstr = value if isinstance(value, str) else value[0]
+    if "fuzzy" in entry.flags:
+        entry.flags.remove("fuzzy")
+
+
+def _render(entry, sep):
+    return entry.__unicode__(78).rstrip("\n") + sep
+
+
+def apply_catalog(path, layers, add=(), tm=None, locale=None):
+    """Apply layers to a catalog; returns (new text, Stats).
+
+    add lists msgids to append when the catalog lacks them and some layer has
+    a translation (custom InfraSignal strings the extractor never saw).
+    tm is a TranslationMemory consulted for locale after the layers.
+    """
+    fuzzy_map, untranslated_map = merge(layers)
+    from_tm = 0
+
+    def lookup(table, msgid):
+        nonlocal from_tm
+        value = table.get(msgid)
+        if value is None and tm is not None:
+            value = tm.get(msgid, locale)
+            from_tm += value is not None
+        return value
+
+    n = 2
+    out, seen, pending = [], set(), []
+    total = translated = fuzzy = filled = fuzzy_fixed = 0
+    still_untranslated, still_fuzzy, rejected = [], [], []
+    for e, text in read_blocks(path):
+        if e is None or e.obsolete:
+            out.append(text)
+            continue
+        if not e.msgid:
+            n = nplurals(e.msgstr)
+            out.append(text)
+            continue
+        total += 1
+        seen.add(e.msgid)
+        plural = e.msgid_plural is not None
+        if is_translated(e) and not (plural and len(e.msgstr_plural) != n):
+            translated += 1
+            out.append(text)
+            continue
+        is_fuzzy = "fuzzy" in e.flags
+        value = lookup(fuzzy_map if is_fuzzy else untranslated_map, e.msgid)
+        if value is not None and plural and not forms_fit(value, n):
+            rejected.append((e.msgid, len(value)))
+            value = None
+        if value is None:
+            if is_fuzzy:
+                fuzzy += 1
+                still_fuzzy.append(e.msgid)
+            else:
+                still_untranslated.append(e.msgid)
+            out.append(text)
+            continue
+        body = text.rstrip()
+        pending.append((len(out), body, text[len(body):], value))
+        out.append(None)
+        translated += 1
+        if is_fuzzy:
+            fuzzy_fixed += 1
+        else:
+            filled += 1
+
+    if pending:
+        # one polib parse for every changed block; the dummy header keeps
+        # the first block's comments on its entry
+        entries = polib.pofile(_HEADER + "\n\n".join(body for _i, body, _s, _v in pending) + "\n")
+        for entry, (i, _body, sep, value) in zip(entries, pending):
+            _fill(entry, value, n)
+            out[i] = _render(entry, sep)
+
+    added = 0
+    for msgid in add:
+        if msgid in seen:
+            continue
+        value = lookup(untranslated_map, msgid)
+        if not isinstance(value, str):
+            continue
+        if out and not out[-1].endswith("\n\n"):
+            out[-1] = out[-1].rstrip("\n") + "\n\n"
+        out.append(_render(polib.POEntry(msgid=msgid, msgstr=value), "\n\n"))
+        seen.add(msgid)
+        added += 1
+        total += 1
+        translated += 1
+
+    text = "".join(out)
+    if added:
+        text = text.rstrip("\n") + "\n"
+    return text, Stats(total, translated, fuzzy, total - translated - fuzzy,
+                       filled, fuzzy_fixed, added, from_tm, still_untranslated, still_fuzzy,
+                       rejected)
+
+
+def load_layers(base_dir, specs):
+    """Layers from manifest entries: "path" or {"file": path, "only": state}."""
+    layers = []
+    for spec in specs:
+        if isinstance(spec, str):
+            spec = {"file": spec}
+        only = spec.get("only")
+        if only not in ONLY:
+            raise ValueError(f"{spec['file']}: only must be one of {ONLY[1:]}")
+        path = os.path.join(base_dir, spec["file"])
+        layers.append(Layer(path, only, load_dictionary(path)))
+    return layers
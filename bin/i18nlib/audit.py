@@ -0,0 +1,148 @@
+"""Catalog audit: classify extracted msgids against each locale's catalog.
+
+run_audit() is the entry point for bin/i18n-audit.py and for callers that
+want the results in-process (the staging gate's suite C). It returns plain
+dicts/lists, so the result can be passed straight to json.dumps():
+
+    {"scope": ..., "msgids": N,
+     "extract": {"hits": .., "misses": .., "ms": ..},
+     "locales": [{"lang": "ru", "locale": "ru_RU", "ms": ..,
+                  "counts": {"MISSING": n, "EMPTY": n, "FUZZY": n, "LEAK": n},
+                  "MISSING": [{"msgid": .., "file": ..}, ...], ...}, ...]}
+"""
+import concurrent.futures
+import os
+import re
+import time
+from xml.sax.saxutils import escape, quoteattr
+
+from . import discover_locales, po_path
+from .catindex import STATUS_EMPTY, STATUS_FUZZY, STATUS_LEAK, CatalogIndex
+from .extract import ExtractCache, by_msgid, collect
+
+LANGS = {"ru": "ru_RU", "tr": "tr_TR", "es": "es"}
+CATEGORIES = ("MISSING", "EMPTY", "FUZZY", "LEAK")
+# LEAK is a heuristic; only these block a release
+HARD = ("MISSING", "EMPTY", "FUZZY")
+
+# Pages that are fully translated via dedicated per-language template files
+# (about-ru.html etc.), so their English source templates are NOT catalog-driven.
+SKIP_FILES = re.compile(r"/(about|faq|privacy|terms|security)\b.*\.html$")
+
+
+def collect_msgids(cache=None, scope="infrasignal", jobs=1):
+    """msgid -> set(files) for loc()/nget() in templates and _()/nget() in Perl."""
+    return by_msgid(collect(cache, scope=scope, jobs=jobs))
+
+
+def classify(status):
+    """Audit category for a CatalogIndex.lookup() result, or None when fine."""
+    if status is None:
+        return "MISSING"
+    if status & STATUS_FUZZY:
+        return "FUZZY"
+    if status & STATUS_EMPTY:
+        return "EMPTY"
+    if status & STATUS_LEAK:
+        # set by the index build from i18nlib/leaks.py: English words left in
+        # the msgstr, judged against the catalog's own script
+        return "LEAK"
+    return None
+
+
+def audit_locale(lang, locale, ids):
+    """Classify every msgid against one catalog; returns a result dict."""
+    t0 = time.perf_counter()
+    # compiled index (rebuilt only when the .po changed); obsolete (#~)
+    # entries are not compiled into the .mo, so they count as missing
+    idx = CatalogIndex.open(po_path(locale))
+
+    res = {c: [] for c in CATEGORIES}
+    for mid, files in ids.items():
+        if not mid.strip():
+            continue
+        cat = classify(idx.lookup(mid))
+        if cat is not None:
+            res[cat].append({"msgid": mid, "file": sorted(files)[0]})
+    idx.close()
+    res.update(lang=lang, locale=locale, ms=(time.perf_counter() - t0) * 1000,
+               counts={c: len(res[c]) for c in CATEGORIES})
+    return res
+
+
+_IDS = None
+
+
+def _init_worker(ids):
+    global _IDS
+    _IDS = ids
+
+
+def _audit_worker(pair):
+    return audit_locale(pair[0], pair[1], _IDS)
+
+
+def audit_locales(langs, ids, jobs=1):
+    """audit_locale() over {lang: locale}, in langs order, on `jobs` processes."""
+    pairs = list(langs.items())
+    if jobs > 1 and len(pairs) > 1:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(jobs, len(pairs)), initializer=_init_worker,
+                initargs=(ids,)) as pool:
+            return list(pool.map(_audit_worker, pairs))
+    return [audit_locale(lang, locale, ids) for lang, locale in pairs]
+
+
+def run_audit(langs=None, scope="infrasignal", jobs=1, use_cache=True, all_locales=False):
+    """Extract msgids and audit them against `langs` ({lang: locale}).
+
+    langs defaults to LANGS, or to every catalog under locale/ with
+    all_locales=True. With use_cache, a running i18n-catalogd answers instead
+    (result then carries "daemon": its reload generation).
+    """
+    if langs is None:
+        langs = discover_locales() if all_locales else LANGS
+    if use_cache:
+        from .catalogd import ask  # catalogd imports this module
+        res = ask("audit", langs=langs, scope=scope)
+        if res is not None:
+            return res
+    t0 = time.perf_counter()
+    cache = ExtractCache(enabled=use_cache, scope=scope)
+    ids = collect_msgids(cache, scope=scope, jobs=jobs)
+    extract = {"hits": cache.hits, "misses": cache.misses,
+               "ms": (time.perf_counter() - t0) * 1000}
+    return {"scope": scope, "msgids": sum(1 for mid in ids if mid.strip()),
+            "extract": extract, "locales": audit_locales(langs, ids, jobs=jobs)}
+
+
+def hard_issues(result):
+    """Total MISSING + EMPTY + FUZZY over all audited locales."""
+    return sum(loc["counts"][c] for loc in result["locales"] for c in HARD)
+
+
+def to_junit(result):
+    """JUnit XML: one testsuite per locale, one testcase per category.
+
+    MISSING/EMPTY/FUZZY fail when non-zero; LEAK is listed but never fails.
+    """
+    out = ['<?xml version="1.0" encoding="UTF-8"?>',
+           f'<testsuites name="i18n-audit" tests="{len(result["locales"]) * len(CATEGORIES)}" '
+           f'failures="{sum(1 for loc in result["locales"] for c in HARD if loc["counts"][c])}">']
+    for loc in result["locales"]:
+        fails = sum(1 for c in HARD if loc["counts"][c])
+        out.append(f'  <testsuite name={quoteattr("i18n." + loc["locale"])} '
+                   f'tests="{len(CATEGORIES)}" failures="{fails}" time="{loc["ms"] / 1000:.3f}">')
+        for c in CATEGORIES:
+            rows = loc[c]
+            out.append(f'    <testcase classname={quoteattr("i18n." + loc["locale"])} name="{c}">')
+            detail = "\n".join(f'[{r["file"]}] {r["msgid"]}' for r in rows)
+            if rows and c in HARD:
+                out.append(f'      <failure message="{len(rows)} {c.lower()} msgids">'
+                           f'{escape(detail)}</failure>')
+            elif rows:
+                out.append(f'      <system-out>{escape(detail)}</system-out>')
+            out.append('    </testcase>')
+        out.append('  </testsuite>')
+    out.append('</testsuites>')
+    return "\n".join(out)
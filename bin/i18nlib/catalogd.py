@@ -0,0 +1,262 @@
+"""Long-lived catalog service for the i18n tools, over a Unix socket.
+
+The daemon (bin/i18n-catalogd.py serve) extracts the template msgids once,
+keeps a CatalogIndex open for every locale and answers newline-delimited JSON
+requests, one object per line in each direction:
+
+    {"op": "ping"}
+    {"op": "status",  "msgid": ..., "locale": "ru_RU"}
+    {"op": "where",   "msgid": ...}
+    {"op": "missing", "locale": "ru_RU", "scope": ...}
+    {"op": "audit",   "langs": {"ru": "ru_RU", ...}, "scope": ...}
+
+Replies are {"ok": true, "result": ...} or {"ok": false, "error": "..."}.
+
+A poller thread re-stats the sources and catalogs every `interval` seconds
+and reloads what changed. "missing" and "audit" also re-stat before answering,
+so the CLIs that go through ask() never see stale data. "status" and "where"
+are answered straight from memory (the poller keeps them current).
+
+Clients call ask(). It returns None when no daemon is listening, or when the
+daemon serves a different scope, and the caller then does the work itself.
+Set I18N_NO_DAEMON=1 to bypass the daemon.
+"""
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+
+from . import CACHE_DIR, discover_locales, normalize, po_path
+from .audit import audit_locale, classify
+from .catindex import CatalogIndex
+from .extract import ExtractCache, by_msgid, collect, source_files
+
+SOCKET = os.environ.get("I18N_SOCKET", os.path.join(CACHE_DIR, "catalogd.sock"))
+TIMEOUT = 60
+
+
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class _State:
+    """Extracted msgids for one scope; rebuilt whole when any source changes."""
+
+    def __init__(self, scope):
+        self.sig = self.signature(scope)
+        self.messages = collect(ExtractCache(scope=scope), scope=scope)
+        self.ids = by_msgid(self.messages)
+        self.refs = {}
+        for m in self.messages:
+            if m.msgid.strip():
+                self.refs.setdefault(m.msgid, []).append(m)
+        self.norm = {}
+        for mid in self.refs:
+            self.norm.setdefault(normalize(mid), mid)
+
+    @staticmethod
+    def signature(scope):
+        return tuple((p, _stat_key(p)) for p in source_files(scope))
+
+    def resolve(self, msgid):
+        """The msgid as extracted (exact, then whitespace-normalized), or None."""
+        if msgid in self.refs:
+            return msgid
+        return self.norm.get(normalize(msgid))
+
+
+class CatalogService:
+    def __init__(self, scope="infrasignal"):
+        self.scope = scope
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.state = None
+        self.indexes = {}  # locale -> (stat key, CatalogIndex)
+        self.audits = {}  # (lang, locale) -> audit_locale() result
+        self.refresh()
+
+    def _index(self, locale):
+        """Open index for a locale, reopened when its .po changed."""
+        po = po_path(locale)
+        sk = _stat_key(po)
+        cur = self.indexes.get(locale)
+        if cur is not None and cur[0] == sk:
+            return cur[1]
+        if sk is None:
+            raise KeyError(f"no catalog for locale {locale!r}")
+        # old index is dropped, not closed: another thread may still read it
+        idx = CatalogIndex.open(po)
+        self.indexes[locale] = (sk, idx)
+        for k in [k for k in self.audits if k[1] == locale]:
+            del self.audits[k]
+        return idx
+
+    def refresh(self):
+        """Re-stat sources and catalogs; reload whatever changed."""
+        with self.lock:
+            if self.state is None or _State.signature(self.scope) != self.state.sig:
+                self.state = _State(self.scope)
+                self.audits = {}
+                self.generation += 1
+            for locale in discover_locales():
+                self._index(locale)
+
+    def watch(self, interval):
+        def loop():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.refresh()
+                except Exception:  # keep serving the last good state
+                    pass
+        threading.Thread(target=loop, daemon=True).start()
+
+    # ── ops ──
+
+    def op_ping(self, req):
+        return {"scope": self.scope, "msgids": len(self.state.ids),
+                "locales": len(self.indexes), "generation": self.generation}
+
+    def op_status(self, req):
+        msgid, locale = req["msgid"], req["locale"]
+        _sk, idx = self.indexes[locale]
+        st = idx.lookup(msgid)
+        return {"status": st, "category": classify(st),
+                "used": self.state.resolve(msgid) is not None}
+
+    def op_where(self, req):
+        state = self.state
+        mid = state.resolve(req["msgid"])
+        refs = state.refs.get(mid, [])
+        return {"msgid": mid, "refs": [[m.file, m.line] for m in refs],
+                "files": sorted({m.file for m in refs})}
+
+    def op_missing(self, req):
+        """First use of each msgid absent from the locale's catalog, in file order."""
+        self._check_scope(req)
+        self.refresh()
+        state = self.state
+        idx = self.indexes[req["locale"]][1]
+        out = []
+        for mid, refs in state.refs.items():
+            if mid in idx:
+                continue
+            m = refs[0]
+            rec = {"msgid": mid, "file": m.file, "line": m.line}
+            if m.msgid_plural is not None:
+                rec["msgid_plural"] = m.msgid_plural
+            out.append(rec)
+        return out
+
+    def op_audit(self, req):
+        self._check_scope(req)
+        self.refresh()
+        with self.lock:
+            state = self.state
+            locales = []
+            for lang, locale in req["langs"].items():
+                res = self.audits.get((lang, locale))
+                if res is None:
+                    res = self.audits[lang, locale] = audit_locale(lang, locale, state.ids)
+                locales.append(res)
+        # every source is served from memory: report them all as cache hits
+        return {"scope": self.scope, "msgids": len(state.ids),
+                "extract": {"hits": len(state.sig), "misses": 0, "ms": 0.0},
+                "locales": locales, "daemon": self.generation}
+
+    def _check_scope(self, req):
+        if req.get("scope", self.scope) != self.scope:
+            raise LookupError(f"daemon serves scope {self.scope!r}")
+
+    def handle(self, req):
+        fn = getattr(self, "op_" + str(req.get("op")), None)
+        if fn is None:
+            return {"ok": False, "error": f"unknown op {req.get('op')!r}"}
+        try:
+            return {"ok": True, "result": fn(req)}
+        except (KeyError, LookupError, ValueError) as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                req = json.loads(line)
+            except ValueError as e:
+                resp = {"ok": False, "error": f"bad request: {e}"}
+            else:
+                resp = self.server.service.handle(req)
+            self.wfile.write(json.dumps(resp, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(scope="infrasignal", path=SOCKET, interval=1.0):
+    """Run the daemon in the foreground until interrupted."""
+    if os.path.exists(path):
+        try:
+            Client(path).close()
+        except OSError:
+            os.unlink(path)  # stale socket from a dead daemon
+        else:
+            raise RuntimeError(f"a daemon is already listening on {path}")
+    service = CatalogService(scope)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    server = _Server(path, _Handler)
+    server.service = service
+    service.watch(interval)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        os.unlink(path)
+
+
+class Client:
+    """Persistent connection to the daemon; raises OSError if none is running."""
+
+    def __init__(self, path=SOCKET, timeout=TIMEOUT):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.sock.settimeout(timeout)
+            self.sock.connect(path)
+        except OSError:
+            self.sock.close()
+            raise
+        self.rfile = self.sock.makefile("rb")
+
+    def request(self, req):
+        self.sock.sendall(json.dumps(req, ensure_ascii=False).encode("utf-8") + b"\n")
+        line = self.rfile.readline()
+        if not line:
+            raise ConnectionError("daemon closed the connection")
+        return json.loads(line)
+
+    def close(self):
+        self.rfile.close()
+        self.sock.close()
+
+
+def ask(op, path=SOCKET, **args):
+    """Result of one request, or None when the daemon is absent or refuses it."""
+    if os.environ.get("I18N_NO_DAEMON") or not os.path.exists(path):
+        return None
+    try:
+        client = Client(path)
+        try:
+            resp = client.request(dict(args, op=op))
+        finally:
+            client.close()
+    except (OSError, ValueError):
+        return None
+    return resp["result"] if resp.get("ok") else None
@@ -0,0 +1,168 @@
+"""Compiled per-locale catalog index, shared by the i18n tools.
+
+One file per catalog in CACHE_DIR (catalog-<locale dir>.idx):
+
+    header   magic, version, .po mtime_ns, .po size, entry count
+    keys     count x u64   msgid hashes, sorted
+    strs     count x u32   crc32 of the msgstr (plural forms joined by NUL)
+    status   count x u8    STATUS_* bits
+
+Both the exact msgid and its whitespace-normalized form are keyed, so callers
+do not need a second normalized map. The file is mmap'd and queried by binary
+search in place: opening costs a stat plus an mmap, not a parse. It is rebuilt
+from the .po (with poreader) only when the .po mtime or size changed.
+"""
+import bisect
+import hashlib
+import mmap
+import os
+import struct
+import zlib
+from array import array
+
+from . import CACHE_DIR, normalize
+from .leaks import LeakScanner, pairs
+from .poreader import read_po, translation
+
+MAGIC = b"ISCX"
+VERSION = 3  # bump when i18nlib/leaks.py changes its verdicts
+_HEADER = struct.Struct("=4sIqqI")
+
+STATUS_TRANSLATED = 0x01
+STATUS_FUZZY = 0x02
+STATUS_EMPTY = 0x04
+STATUS_LEAK = 0x08  # English left in the msgstr (i18nlib/leaks.py)
+STATUS_PLURAL = 0x10
+STATUS_NORMALIZED = 0x20  # key is the whitespace-normalized msgid
+
+
+def key(s):
+    return int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def str_crc(msgstr):
+    return zlib.crc32(msgstr.encode("utf-8"))
+
+
+def entry_status(e, scanner):
+    text = translation(e)
+    if "fuzzy" in e.flags:
+        st = STATUS_FUZZY
+    elif not text.strip():
+        st = STATUS_EMPTY
+    else:
+        st = STATUS_TRANSLATED
+        if any(scanner.is_leak(msgid, msgstr) for msgid, msgstr in pairs((e,))):
+            st |= STATUS_LEAK
+    if e.msgid_plural is not None:
+        st |= STATUS_PLURAL
+    return st
+
+
+def entry_crc(e):
+    if e.msgid_plural is not None:
+        return str_crc("\0".join(v for _k, v in sorted(e.msgstr_plural.items())))
+    return str_crc(e.msgstr)
+
+
+def index_path(po):
+    locale_dir = os.path.basename(os.path.dirname(os.path.dirname(os.path.abspath(po))))
+    return os.path.join(CACHE_DIR, f"catalog-{locale_dir}.idx")
+
+
+def build(po, path=None):
+    """Compile the index for one .po file; returns the index path."""
+    path = path or index_path(po)
+    st = os.stat(po)
+    rows = {}
+    entries = list(read_po(po, obsolete=False))
+    scanner = LeakScanner.for_catalog(pairs(entries))
+    for e in entries:
+        status, crc = entry_status(e, scanner), entry_crc(e)
+        rows[key(e.msgid)] = (crc, status)
+        norm = normalize(e.msgid)
+        if norm != e.msgid:
+            rows.setdefault(key(norm), (crc, status | STATUS_NORMALIZED))
+    keys = sorted(rows)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(_HEADER.pack(MAGIC, VERSION, st.st_mtime_ns, st.st_size, len(keys)))
+        array("Q", keys).tofile(fh)
+        array("I", (rows[k][0] for k in keys)).tofile(fh)
+        fh.write(bytes(rows[k][1] for k in keys))
+    os.replace(tmp, path)
+    return path
+
+
+class CatalogIndex:
+    """Read-only view of a compiled index; see open()."""
+
+    def __init__(self, path):
+        with open(path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.po_mtime, self.po_size, n = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"{path}: not a v{VERSION} catalog index")
+        self._view = view = memoryview(self._mm)
+        off = _HEADER.size
+        self._keys = view[off:off + 8 * n].cast("Q")
+        off += 8 * n
+        self._crcs = view[off:off + 4 * n].cast("I")
+        off += 4 * n
+        self._status = view[off:off + n]
+        self._n = n
+
+    @classmethod
+    def open(cls, po, rebuild=True):
+        """Index for a .po file, recompiling it first if the .po changed."""
+        path = index_path(po)
+        if rebuild:
+            st = os.stat(po)
+            try:
+                idx = cls(path)
+                if (idx.po_mtime, idx.po_size) == (st.st_mtime_ns, st.st_size):
+                    return idx
+                idx.close()
+            except (OSError, ValueError, struct.error):
+                pass
+            build(po, path)
+        return cls(path)
+
+    def __len__(self):
+        return self._n
+
+    def _find(self, s):
+        k = key(s)
+        i = bisect.bisect_left(self._keys, k)
+        if i < self._n and self._keys[i] == k:
+            return i
+        return None
+
+    def lookup(self, msgid):
+        """STATUS_* bits for msgid (exact, then normalized), or None if absent."""
+        i = self._find(msgid)
+        if i is None:
+            i = self._find(normalize(msgid))
+        return None if i is None else self._status[i]
+
+    def __contains__(self, msgid):
+        return self.lookup(msgid) is not None
+
+    def msgstr_matches(self, msgid, msgstr):
+        """True when msgid is present, not fuzzy, and translated as msgstr."""
+        i = self._find(msgid)
+        return (i is not None and not self._status[i] & STATUS_FUZZY
+                and self._crcs[i] == str_crc(msgstr))
+
+    def close(self):
+        for view in (self._keys, self._crcs, self._status, self._view):
+            view.release()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
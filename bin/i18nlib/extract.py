@@ -0,0 +1,271 @@
+"""msgid extraction over the InfraSignal templates, with a persistent cache.
+
+The cache maps rel path -> {mtime, size, sha1, msgs}. A file whose mtime/size
+are unchanged is a hit without being read; a touched file is re-hashed and
+only rescanned when its content actually changed.
+
+Four scopes:
+  infrasignal : templates/web/infrasignal + the Infrasignal cobrand module
+  cobrand     : everything an InfraSignal request can render: its templates,
+                the base templates they fall back to, the default/infrasignal
+                email templates, db/alert_types.pl and perllib/**/*.pm minus
+                the other cobrands' modules
+  all         : every templates/web/*/**.html and perllib/**/*.pm, i.e. the
+                strings InfraSignal inherits from base and the core modules
+  full        : all, plus every email template, db/alert_types.pl and the
+                Perl scripts under bin/ (extensionless ones included), which
+                bin/gettext-extract scans too: each source in the tree that
+                can reference a catalog msgid
+
+Cache misses are scanned on a process pool. Results are merged back in file
+order, so a parallel run returns exactly what a serial one does.
+
+literals(scope) is the independent cross-check: every quoted string in the
+scope's sources, whether or not it is passed to loc()/_() where the scanner
+can see it (FormHandler labels, messages built at runtime).
+
+changed_since(ref) lists the files git sees as changed since ref (plus
+untracked ones), so collect(paths=...) can scan only those.
+"""
+import concurrent.futures
+import hashlib
+import json
+import os
+import re
+import subprocess
+
+from . import CACHE_DIR, COBRAND, ROOT, TPL_DIR, rel
+from .tokenizer import Message, scan_perl, scan_template
+
+CACHE_VERSION = 3
+SCOPES = ("infrasignal", "cobrand", "all", "full")
+# Cobrand modules InfraSignal runs (Infrasignal -> Default -> Base)
+COBRAND_CHAIN = ("Base.pm", "Default.pm", "Infrasignal.pm")
+# bin/ directories with no Perl in them
+BIN_SKIP = {"i18nlib", "i18n-dictionaries", "fixtures", "__pycache__"}
+# a one-line quoted string, Perl or template
+_LITERAL_RES = (re.compile(r"'((?:[^'\\\n]|\\.)*)'"), re.compile(r'"((?:[^"\\\n]|\\.)*)"'))
+# below this many misses the pool start-up costs more than it saves
+MIN_PARALLEL = 64
+
+
+def _scanner(path):
+    # templates are .html/.txt; everything else collected is Perl (bin/ scripts)
+    return scan_template if path.endswith((".html", ".txt")) else scan_perl
+
+
+def _is_perl_script(path):
+    """.pl/.pm, or a #! line naming perl (bin/ scripts have no extension)."""
+    if path.endswith((".pl", ".pm")):
+        return True
+    try:
+        with open(path, "rb") as fh:
+            first = fh.readline(200)
+    except OSError:
+        return False
+    return first.startswith(b"#!") and b"perl" in first
+
+
+def cache_file(scope):
+    return os.path.join(CACHE_DIR, f"extract-{scope}.json")
+
+
+def _scan_one(path):
+    """(sha1, mtime_ns, size, msgs) for one file; runs in pool workers."""
+    st = os.stat(path)
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    text = raw.decode("utf-8", errors="ignore")
+    msgs = [[m.msgid, m.msgid_plural, m.line] for m in _scanner(path)(text)]
+    return hashlib.sha1(raw).hexdigest(), st.st_mtime_ns, st.st_size, msgs
+
+
+def _scan_chunk(paths):
+    return [_scan_one(p) for p in paths]
+
+
+class ExtractCache:
+    def __init__(self, path=None, enabled=True, scope="infrasignal"):
+        self.path = path or cache_file(scope)
+        self.enabled = enabled
+        self.files = {}
+        self.seen = set()
+        self.hits = self.misses = 0
+        self.dirty = False
+        if enabled and os.path.exists(self.path):
+            try:
+                with open(self.path, encoding="utf-8") as fh:
+                    data = json.load(fh)
+                if data.get("version") == CACHE_VERSION and data.get("root") == ROOT:
+                    self.files = data["files"]
+            except (OSError, ValueError, KeyError):
+                self.files = {}
+
+    def lookup(self, path, relpath):
+        """Cached msgs when the file's stat key, or else its sha1, still
+        matches; None when it has to be scanned."""
+        self.seen.add(relpath)
+        ent = self.files.get(relpath)
+        if ent is None:
+            return None
+        st = os.stat(path)
+        if ent["mtime"] != st.st_mtime_ns or ent["size"] != st.st_size:
+            with open(path, "rb") as fh:
+                if hashlib.sha1(fh.read()).hexdigest() != ent["sha1"]:
+                    return None
+            # touched but not edited: keep the msgs, refresh the stat key
+            ent["mtime"], ent["size"] = st.st_mtime_ns, st.st_size
+            self.dirty = True
+        self.hits += 1
+        return ent["msgs"]
+
+    def store(self, relpath, sha, mtime, size, msgs):
+        self.misses += 1
+        self.files[relpath] = {"sha1": sha, "mtime": mtime, "size": size, "msgs": msgs}
+        self.dirty = True
+        return msgs
+
+    def save(self):
+        stale = set(self.files) - self.seen
+        for relpath in stale:
+            del self.files[relpath]
+        if not self.enabled or not (self.dirty or stale):
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"version": CACHE_VERSION, "root": ROOT, "files": self.files},
+                      fh, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+
+def source_files(scope="infrasignal"):
+    """Files to extract from, in a stable order."""
+    if scope == "infrasignal":
+        # InfraSignal templates (walk order) followed by the cobrand module
+        for dirpath, _dirs, files in os.walk(TPL_DIR):
+            for f in files:
+                if f.endswith(".html"):
+                    yield os.path.join(dirpath, f)
+        if os.path.exists(COBRAND):
+            yield COBRAND
+        return
+    if scope == "cobrand":
+        yield from _cobrand_files()
+        return
+    found = []
+    subs = [("templates/web", ".html"), ("perllib", ".pm")]
+    if scope == "full":
+        subs.append(("templates/email", (".html", ".txt")))
+    for sub, ext in subs:
+        for dirpath, _dirs, files in os.walk(os.path.join(ROOT, sub)):
+            found.extend(os.path.join(dirpath, f) for f in files if f.endswith(ext))
+    if scope == "full" and os.path.exists(os.path.join(ROOT, "db/alert_types.pl")):
+        found.append(os.path.join(ROOT, "db/alert_types.pl"))
+    if scope == "full":
+        for dirpath, dirs, files in os.walk(os.path.join(ROOT, "bin")):
+            dirs[:] = [d for d in dirs if d not in BIN_SKIP]
+            found.extend(p for p in (os.path.join(dirpath, f) for f in files)
+                         if _is_perl_script(p))
+    yield from sorted(found)
+
+
+def _cobrand_files():
+    found = []
+    for sub, ext in (("templates/web/infrasignal", ".html"),
+                     ("templates/web/base", ".html"),
+                     ("templates/email/infrasignal", (".html", ".txt")),
+                     ("templates/email/default", (".html", ".txt"))):
+        for dirpath, _dirs, files in os.walk(os.path.join(ROOT, sub)):
+            found.extend(os.path.join(dirpath, f) for f in files if f.endswith(ext))
+    other_cobrands = os.path.join(ROOT, "perllib/FixMyStreet/Cobrand")
+    for dirpath, _dirs, files in os.walk(os.path.join(ROOT, "perllib")):
+        for f in files:
+            if not f.endswith(".pm"):
+                continue
+            if dirpath.startswith(other_cobrands) and (
+                    dirpath != other_cobrands or f not in COBRAND_CHAIN):
+                continue
+            found.append(os.path.join(dirpath, f))
+    alert_types = os.path.join(ROOT, "db/alert_types.pl")
+    if os.path.exists(alert_types):
+        found.append(alert_types)
+    return sorted(found)
+
+
+def changed_since(ref):
+    """Absolute paths changed since git ref (committed, staged or not), plus
+    untracked files. Raises ValueError for a ref git does not know."""
+    def git(*args):
+        res = subprocess.run(["git", "-C", ROOT, *args], capture_output=True, text=True)
+        if res.returncode:
+            raise ValueError(res.stderr.strip() or f"git {args[0]} failed")
+        return [p for p in res.stdout.split("\0") if p]
+
+    roots = ("templates", "perllib", "db", "bin")  # where every scope's sources live
+    names = git("diff", "--name-only", "--relative", "-z", ref, "--", *roots)
+    names += git("ls-files", "-z", "--others", "--exclude-standard", "--", *roots)
+    return {os.path.join(ROOT, n) for n in names}
+
+
+def collect(cache=None, scope="infrasignal", jobs=1, paths=None):
+    """All Message records from the sources in `scope`, in file order.
+
+    jobs > 1 scans cache misses on that many worker processes. paths, if
+    given, restricts the scan to those of the scope's files (see
+    changed_since()); the persistent cache is not used then, as every file
+    left out would look deleted to it.
+    """
+    if paths is not None:
+        wanted = set(paths)
+        cache = ExtractCache(enabled=False, scope=scope)
+        paths = [p for p in source_files(scope) if p in wanted]
+    else:
+        paths = list(source_files(scope))
+    cache = cache or ExtractCache(enabled=False, scope=scope)
+    found = {}
+    todo = []
+    for path in paths:
+        msgs = cache.lookup(path, rel(path))
+        if msgs is None:
+            todo.append(path)
+        else:
+            found[path] = msgs
+    if jobs > 1 and len(todo) >= MIN_PARALLEL:
+        size = max(1, len(todo) // (jobs * 4))
+        chunks = [todo[i:i + size] for i in range(0, len(todo), size)]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+            scanned = [r for chunk in pool.map(_scan_chunk, chunks) for r in chunk]
+    else:
+        scanned = [_scan_one(p) for p in todo]
+    for path, res in zip(todo, scanned):
+        found[path] = cache.store(rel(path), *res)
+    cache.save()
+    out = []
+    for path in paths:
+        relpath = rel(path)
+        out.extend(Message(mid, plural, relpath, line) for mid, plural, line in found[path])
+    return out
+
+
+def literals(scope="full"):
+    """{string: first rel path} for every one-line quoted string in the
+    scope's sources, backslash escapes left as written."""
+    out = {}
+    for path in source_files(scope):
+        with open(path, encoding="utf-8", errors="ignore") as fh:
+            text = fh.read()
+        relpath = rel(path)
+        for rx in _LITERAL_RES:
+            for m in rx.finditer(text):
+                out.setdefault(m.group(1), relpath)
+    return out
+
+
+def by_msgid(messages):
+    """msgid -> set(files), skipping blank msgids."""
+    ids = {}
+    for m in messages:
+        if m.msgid.strip():
+            ids.setdefault(m.msgid, set()).add(m.file)
+    return ids
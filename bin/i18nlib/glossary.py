@@ -0,0 +1,133 @@
+"""Glossary consistency: a source term in the msgid, its mandated rendering in
+the msgstr.
+
+Every pattern of the glossary (source forms, ignore phrases and the target
+stems of every locale) goes into one Aho-Corasick automaton, so checking an
+entry is one linear pass over the msgid and one over the msgstr, whatever
+the size of the glossary. msgid results are cached: a msgid shared by many
+catalogs is scanned once.
+
+Source forms and ignore phrases match whole words (case-insensitive); a
+match inside an ignore phrase ("Report a problem", a verb) does not count.
+Target stems match as substrings, so one stem covers the inflected forms
+(обращени: обращение, обращения, обращений).
+"""
+import functools
+import json
+from collections import deque, namedtuple
+
+Issue = namedtuple("Issue", "term msgid msgstr expected")
+
+START = "\x02"  # stands for ^ in ignore phrases
+
+SOURCE, IGNORE, TARGET = "source", "ignore", "target"
+
+
+class Automaton:
+    """Aho-Corasick matcher over a fixed set of (pattern, payload) pairs."""
+
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.out = [[]]
+        for pattern, payload in patterns:
+            node = 0
+            for ch in pattern:
+                nxt = self.goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][ch] = nxt
+                    self.goto.append({})
+                    self.out.append([])
+                node = nxt
+            self.out[node].append((len(pattern), payload))
+        # breadth-first: a node's fail link is the longest proper suffix that
+        # is also a path from the root; outputs are merged along it
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def search(self, text):
+        """Yield (start, end, payload) for every occurrence, overlaps included."""
+        goto, fail, out = self.goto, self.fail, self.out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, payload in out[node]:
+                yield i + 1 - length, i + 1, payload
+
+
+def _bounded(text, start, end):
+    """True when text[start:end] does not begin or end inside a word."""
+    return ((start == 0 or not text[start].isalnum() or not text[start - 1].isalnum())
+            and (end == len(text) or not text[end - 1].isalnum() or not text[end].isalnum()))
+
+
+class Glossary:
+    """A compiled glossary; see load()."""
+
+    def __init__(self, terms):
+        self.terms = terms
+        self.locales = sorted({loc for t in terms for loc in t.get("require", {})})
+        patterns = []
+        for i, t in enumerate(terms):
+            patterns += [(m.lower(), (SOURCE, i)) for m in t["match"]]
+            patterns += [(START + p[1:].lower() if p.startswith("^") else p.lower(), (IGNORE, i))
+                         for p in t.get("ignore", ())]
+            for loc, stems in t.get("require", {}).items():
+                patterns += [(s.lower(), (TARGET, i, loc)) for s in stems]
+        self.automaton = Automaton(patterns)
+        self.sources = functools.lru_cache(maxsize=None)(self._sources)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as fh:
+            return cls(json.load(fh)["terms"])
+
+    def _sources(self, msgid):
+        """Indices of the terms msgid uses outside its ignore phrases."""
+        text = START + msgid.lower()
+        found, ignored = [], []
+        for start, end, payload in self.automaton.search(text):
+            if payload[0] == TARGET or not _bounded(text, start, end):
+                continue
+            (found if payload[0] == SOURCE else ignored).append((start, end, payload[1]))
+        return frozenset(i for start, end, i in found
+                         if not any(i == j and s <= start and end <= e for s, e, j in ignored))
+
+    def targets(self, msgstr, locale):
+        """Indices of the terms whose required rendering for locale is in msgstr."""
+        return {p[1] for _s, _e, p in self.automaton.search(msgstr.lower())
+                if p[0] == TARGET and p[2] == locale}
+
+    def check(self, msgid, msgstr, locale):
+        """Indices of the terms msgid uses that msgstr does not render as required."""
+        used = {i for i in self.sources(msgid) if locale in self.terms[i].get("require", {})}
+        return used - self.targets(msgstr, locale) if used else set()
+
+    def check_catalog(self, entries, locale):
+        """[Issue] over the translated, non-fuzzy entries of a catalog."""
+        issues = []
+        for e in entries:
+            if e.obsolete or "fuzzy" in e.flags:
+                continue
+            if e.msgid_plural is None:
+                msgid, msgstr = e.msgid, e.msgstr
+            else:
+                msgid = f"{e.msgid}\n{e.msgid_plural}"
+                msgstr = "\n".join(v for _k, v in sorted(e.msgstr_plural.items()))
+            if not msgstr.strip():
+                continue
+            for i in sorted(self.check(msgid, msgstr, locale)):
+                t = self.terms[i]
+                issues.append(Issue(t["term"], e.msgid, msgstr, t["require"][locale]))
+        return issues
@@ -0,0 +1,230 @@
+"""English leaking into translations, found by Unicode script.
+
+Two rules, either of which makes a leak:
+
+  - identical: the msgstr is the msgid copied over. Always a leak in a
+    catalog whose script is not Latin; in a Latin-script one only above
+    IDENTICAL_MIN characters ('Email', 'OK' are often right as they are).
+    A string made of BRANDS alone (FixMyStreet, URL, ...) is never one.
+  - script scan, which also catches a translation that kept an English
+    clause:
+      - non-Latin catalogs (ru, el, ar, zh, ...): the share of msgstr words
+        in Latin script that also occur in the msgid. Words with a capital
+        letter do not count when the msgstr has words in the catalog's own
+        script: names and acronyms (FixMyStreet, App Store, URL) are kept in
+        every language. In an msgstr written in Latin script alone they do
+        count, BRANDS excepted.
+      - Latin-script catalogs: the share of msgstr words that are common
+        English words (LEXICON) also present in the msgid. A LEXICON word
+        the catalog uses natively ("is" in Dutch, "in" in German) is left
+        out: that is any word found in at least NATIVE msgstrs whose msgid
+        lacks it.
+
+A catalog's script is the one most of its translated letters are written in
+(sr is Latin, uk is Cyrillic), so no per-locale table has to be kept.
+
+Scripts come from a 64K-entry table built once from ranges of code points,
+one code character per BMP code point; str.translate() maps a whole string
+through it in a single C-level pass, and two regex passes over the result
+count the words and pick out the Latin ones. msgid words are cached, so a
+msgid shared by 40 catalogs is only split once.
+"""
+import bisect
+import functools
+import re
+import unicodedata
+from collections import Counter, namedtuple
+
+from .poreader import read_po
+
+Leak = namedtuple("Leak", "msgid msgstr words total share")
+
+LATIN = "Latin"
+SCRIPTS = {"L": LATIN, "C": "Cyrillic", "G": "Greek", "R": "Armenian", "H": "Hebrew",
+           "A": "Arabic", "D": "Devanagari", "T": "Thai", "M": "Myanmar",
+           "E": "Georgian", "K": "Hangul", "Z": "Han", "O": "other"}
+# (first, last, code) ranges; letters and marks outside them are "O"
+_RANGES = sorted([
+    (0x0041, 0x024F, "L"), (0x1E00, 0x1EFF, "L"), (0x2C60, 0x2C7F, "L"),
+    (0xA720, 0xA7FF, "L"), (0xFF21, 0xFF5A, "L"), (0x0300, 0x036F, "L"),
+    (0x0370, 0x03FF, "G"), (0x1F00, 0x1FFF, "G"),
+    (0x0400, 0x052F, "C"), (0x2DE0, 0x2DFF, "C"), (0xA640, 0xA69F, "C"),
+    (0x0530, 0x058F, "R"), (0x0590, 0x05FF, "H"), (0xFB1D, 0xFB4F, "H"),
+    (0x0600, 0x06FF, "A"), (0x0750, 0x077F, "A"), (0x08A0, 0x08FF, "A"),
+    (0xFB50, 0xFDFF, "A"), (0xFE70, 0xFEFF, "A"),
+    (0x0900, 0x097F, "D"), (0x0E00, 0x0E7F, "T"), (0x1000, 0x109F, "M"),
+    (0xAA60, 0xAA7F, "M"), (0x10A0, 0x10FF, "E"),
+    (0x1100, 0x11FF, "K"), (0x3130, 0x318F, "K"), (0xAC00, 0xD7AF, "K"),
+    (0x3040, 0x30FF, "Z"), (0x3400, 0x4DBF, "Z"), (0x4E00, 0x9FFF, "Z"),
+    (0xF900, 0xFAFF, "Z"),
+])
+_STARTS = [r[0] for r in _RANGES]
+DIGIT = "9"
+
+# frequent English words, none of which a translation needs to keep, and
+# the stems of contractions (don't is split as "don", "t")
+LEXICON = frozenset("""
+about above after again all also an and any are as at back be been before
+being below but by can cannot could did do does done down each email every
+few for from further had has have having he her here his how if in into is it
+its just know may me more most must my no not now of off on once only or
+other our out over own please problem problems report reported reports same
+see she should show so some such than that the their them then there these
+they this those through to too under until up very was we were what when
+where which while who why will with would you your
+aren couldn didn doesn don hadn hasn haven isn shouldn wasn weren won wouldn
+""".split())
+NATIVE = 3
+THRESHOLD = 0.3
+# words kept as they are in every language: an msgstr made of these alone is
+# not a leak, even when it is identical to its msgid
+BRANDS = frozenset("""
+FixMyStreet InfraSignal Open311 MapIt mySociety SocietyWorks WasteWorks
+OpenStreetMap Google Bing Twitter Facebook GitHub iOS Android
+OK ID URL API CSV RSS GeoRSS SMS PDF JSON XML HTML GDPR WCAG UK US USA GOV
+""".split())
+IDENTICAL_MIN = 12  # identical strings this long or shorter pass in Latin catalogs
+# code string characters that are not another script's letters
+_LATIN_ONLY = frozenset("L9_ ")
+
+# what is not prose: markup, entities, placeholders, fields, URLs, addresses
+_NOISE_RE = re.compile(r"<[^<>]*>|&#?\w+;|%(?:\d+\$)?[-+#0]*\d*(?:\.\d+)?[a-zA-Z]"
+                       r"|\{\{[^}]*\}\}|\{\d+\}|https?://\S+")
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+# over the code string: a word (one per Han/kana character), and a Latin word
+# of two letters or more that is a whole run (has_photo is "LLL_LLLLL")
+_WORD_RE = re.compile(r"Z|9*[^ 9Z][^ Z]*")
+_LATIN_RE = re.compile(r"(?<![^ ])9*L9*L[L9]*(?![^ ])")
+
+
+@functools.lru_cache(maxsize=None)
+def table():
+    """The BMP code table: script code per letter/mark, DIGIT, "_", else space."""
+    out = []
+    for cp in range(0x10000):
+        cat = unicodedata.category(chr(cp))
+        if cat[0] in "LM":
+            i = bisect.bisect_right(_STARTS, cp) - 1
+            out.append(_RANGES[i][2] if i >= 0 and cp <= _RANGES[i][1] else "O")
+        elif cat == "Nd":
+            out.append(DIGIT)
+        elif cp == 0x5F:
+            out.append("_")
+        else:
+            out.append(" ")
+    return "".join(out)
+
+
+@functools.lru_cache(maxsize=None)
+def classify(s):
+    """(codes, [Latin words], word count) of s's prose.
+
+    codes is s mapped through table(), one script code per character (astral
+    code points map to themselves). Cached: a catalog is scanned twice.
+    """
+    s = _NOISE_RE.sub(" ", s)
+    if "@" in s:
+        s = _EMAIL_RE.sub(" ", s)
+    codes = s.translate(table())
+    latin = [s[m.start():m.end()] for m in _LATIN_RE.finditer(codes)]
+    return codes, latin, len(_WORD_RE.findall(codes))
+
+
+@functools.lru_cache(maxsize=None)
+def source_words(msgid):
+    """Lower-cased Latin words of an msgid; shared by every catalog."""
+    return frozenset(w.lower() for w in classify(msgid)[1])
+
+
+def _is_term(word):
+    """Names and acronyms kept in every script: Open311, MapIt, URL, App Store."""
+    return not word.islower()
+
+
+def is_brand(s):
+    """True when every Latin word of s is in BRANDS (or it has none)."""
+    return all(w in BRANDS for w in classify(s)[1])
+
+
+def pairs(entries):
+    """(msgid, msgstr) per translated, non-fuzzy entry; plural forms pair with
+    msgid_plural."""
+    for e in entries:
+        if e.obsolete or "fuzzy" in e.flags:
+            continue
+        if e.msgid_plural is None:
+            if e.msgstr.strip():
+                yield e.msgid, e.msgstr
+        else:
+            for _idx, form in sorted(e.msgstr_plural.items()):
+                if form.strip():
+                    yield e.msgid_plural, form
+
+
+class LeakScanner:
+    """Per-catalog scanner; see for_catalog()."""
+
+    def __init__(self, script=LATIN, native=frozenset(), threshold=THRESHOLD):
+        self.script = script
+        self.native = native
+        self.threshold = threshold
+
+    @classmethod
+    def for_catalog(cls, pairs, threshold=THRESHOLD):
+        """Scanner for a catalog's (msgid, msgstr) pairs: script and native words."""
+        letters = Counter()
+        used = Counter()
+        for msgid, msgstr in pairs:
+            if msgstr.strip() == msgid.strip():
+                continue
+            codes, latin, _n = classify(msgstr)
+            letters.update(codes)
+            used.update({w.lower() for w in latin} & LEXICON - source_words(msgid))
+        codes = [(n, c) for c, n in letters.items() if c in SCRIPTS]
+        script = SCRIPTS[max(codes)[1]] if codes else LATIN
+        return cls(script, frozenset(w for w, n in used.items() if n >= NATIVE), threshold)
+
+    def scan(self, msgid, msgstr):
+        """(English words, word count, share) of msgstr."""
+        _codes, latin, total = classify(msgstr)
+        if not latin:
+            return [], total, 0.0
+        src = source_words(msgid)
+        if self.script == LATIN:
+            leaked = [w for w in latin if w.lower() in src and w.lower() in LEXICON
+                      and w.lower() not in self.native]
+        elif set(_codes) <= _LATIN_ONLY:
+            # nothing in the catalog's script: capitalised words are English too
+            leaked = [w for w in latin if w.lower() in src and w not in BRANDS]
+        else:
+            leaked = [w for w in latin if w.lower() in src and not _is_term(w)]
+        return leaked, total, len(leaked) / total
+
+    def identical(self, msgid, msgstr):
+        """msgstr is msgid copied over, and not a brand, acronym or short Latin word."""
+        s = msgstr.strip()
+        if s != msgid.strip() or is_brand(s):
+            return False
+        return self.script != LATIN or len(s) > IDENTICAL_MIN
+
+    def is_leak(self, msgid, msgstr):
+        return self.identical(msgid, msgstr) or self.judge(*self.scan(msgid, msgstr))
+
+    def judge(self, leaked, total, share):
+        # a lone English word is usually a loanword, unless it is all there is
+        return share >= self.threshold and (len(leaked) >= 2 or total == len(leaked) == 1
+                                            and self.script != LATIN)
+
+
+def scan_catalog(po, threshold=THRESHOLD):
+    """(scanner, entries scanned, [Leak]) for one .po file."""
+    todo = list(pairs(read_po(po, obsolete=False)))
+    scanner = LeakScanner.for_catalog(todo, threshold)
+    leaks = []
+    for msgid, msgstr in todo:
+        leaked, total, share = scanner.scan(msgid, msgstr)
+        if scanner.identical(msgid, msgstr):
+            leaks.append(Leak(msgid, msgstr, classify(msgstr)[1], total, 1.0))
+        elif scanner.judge(leaked, total, share):
+            leaks.append(Leak(msgid, msgstr, leaked, total, round(share, 3)))
+    return scanner, len(todo), leaks
@@ -0,0 +1,184 @@
+"""GNU .mo compiler (with the gettext hash table) and reader.
+
+compile_po() follows the layout of GNU msgfmt's write-mo.c for our catalogs
+(no msgctxt, no system-dependent strings, default --alignment=1, host byte
+order). The output is not checked against `msgfmt -o`; test_mofile.py reads
+it back with polib and compares it with polib's own to_binary():
+
+  - entries: the header plus every live entry whose first msgstr is non-empty,
+    minus fuzzy ones (the header's fuzzy flag is ignored)
+  - sorted by msgid bytes (strcmp order); plural originals are
+    "msgid\\0msgid_plural", translations the forms joined by NUL
+  - 28-byte header, original and translation descriptor tables, then a hash
+    table of next_prime(n * 4 // 3) slots, then all originals and all
+    translations, each NUL-terminated
+
+polib's to_binary() writes the same layout without the hash table, so libintl
+falls back to binary search over the originals for every lookup. MOFile
+reads either kind and exposes both lookup paths for i18n-bench.py.
+"""
+import struct
+
+from .poreader import read_po
+
+MAGIC = 0x950412DE
+_HEADER = struct.Struct("=7I")
+
+
+def hash_string(data):
+    """gettext's hash_string() (hashpjw) over bytes up to the first NUL.
+
+    Kept to 32 bits at every step, as the C unsigned long wraps on 32-bit
+    hosts and as the 32-bit hash table slots are computed.
+    """
+    hval = 0
+    for c in data:
+        if c == 0:
+            break
+        hval = ((hval << 4) + c) & 0xFFFFFFFF
+        g = hval & 0xF0000000
+        if g:
+            hval ^= g >> 24
+            hval ^= g
+    return hval
+
+
+def _is_prime(candidate):
+    # gettext lib/hash.c, quirks included (odd input, 3 and 9 are "composite")
+    divn = 3
+    sq = divn * divn
+    while sq < candidate and candidate % divn != 0:
+        divn += 1
+        sq += 4 * divn
+        divn += 1
+    return candidate % divn != 0
+
+
+def next_prime(seed):
+    seed |= 1
+    while not _is_prime(seed):
+        seed += 2
+    return seed
+
+
+def po_messages(path):
+    """(original, translation) byte pairs msgfmt would emit for a .po file."""
+    out = []
+    for e in read_po(path, obsolete=False, header=True):
+        if e.msgid_plural is not None:
+            forms = [v for _k, v in sorted(e.msgstr_plural.items())]
+            first = forms[0] if forms else ""
+            orig = e.msgid + "\0" + e.msgid_plural
+            trans = "\0".join(forms)
+        else:
+            first = trans = e.msgstr
+            orig = e.msgid
+        if not first or ("fuzzy" in e.flags and e.msgid):
+            continue
+        out.append((orig.encode("utf-8"), trans.encode("utf-8")))
+    return out
+
+
+def compile_mo(messages, hash_table=True):
+    """.mo bytes for (original, translation) byte pairs."""
+    messages = sorted(messages)
+    n = len(messages)
+    hash_size = 0
+    if hash_table:
+        hash_size = max(next_prime(n * 4 // 3), 3)
+    orig_off = _HEADER.size
+    trans_off = orig_off + 8 * n
+    hash_off = trans_off + 8 * n
+    pos = hash_off + 4 * hash_size
+
+    origs, trans = [], []
+    for orig, _t in messages:
+        origs.append((len(orig), pos))
+        pos += len(orig) + 1
+    for _o, tr in messages:
+        trans.append((len(tr), pos))
+        pos += len(tr) + 1
+
+    table = [0] * hash_size
+    for i, (orig, _t) in enumerate(messages if hash_size else ()):
+        hval = hash_string(orig)
+        idx = hval % hash_size
+        incr = 1 + hval % (hash_size - 2)
+        while table[idx]:
+            if idx >= hash_size - incr:
+                idx -= hash_size - incr
+            else:
+                idx += incr
+        table[idx] = i + 1
+
+    parts = [_HEADER.pack(MAGIC, 0, n, orig_off, trans_off, hash_size, hash_off),
+             struct.pack(f"={2 * n}I", *(v for pair in origs for v in pair)),
+             struct.pack(f"={2 * n}I", *(v for pair in trans for v in pair)),
+             struct.pack(f"={hash_size}I", *table)]
+    parts.extend(orig + b"\0" for orig, _t in messages)
+    parts.extend(tr + b"\0" for _o, tr in messages)
+    return b"".join(parts)
+
+
+def compile_po(path, hash_table=True):
+    return compile_mo(po_messages(path), hash_table=hash_table)
+
+
+class MOFile:
+    """Read-only .mo view with libintl's two lookup paths."""
+
+    def __init__(self, data):
+        self.data = data
+        magic, _rev, n, orig_off, trans_off, self.hash_size, hash_off = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("not a native-endian .mo file")
+        self.n = n
+        self.origs = struct.unpack_from(f"={2 * n}I", data, orig_off)
+        self.trans = struct.unpack_from(f"={2 * n}I", data, trans_off)
+        self.hash = struct.unpack_from(f"={self.hash_size}I", data, hash_off)
+        self.probes = 0  # string comparisons made by the lookups
+
+    def _orig(self, i):
+        length, off = self.origs[2 * i], self.origs[2 * i + 1]
+        # compare on the singular msgid, as strcmp() does on the NUL-split original
+        return self.data[off:off + length].split(b"\0", 1)[0]
+
+    def _trans(self, i):
+        length, off = self.trans[2 * i], self.trans[2 * i + 1]
+        return self.data[off:off + length]
+
+    def find_hashed(self, msgid):
+        """Translation bytes via the hash table (dcigettext.c), or None."""
+        size = self.hash_size
+        hval = hash_string(msgid)
+        idx = hval % size
+        incr = 1 + hval % (size - 2)
+        while True:
+            nstr = self.hash[idx]
+            if nstr == 0:
+                return None
+            self.probes += 1
+            if self._orig(nstr - 1) == msgid:
+                return self._trans(nstr - 1)
+            if idx >= size - incr:
+                idx -= size - incr
+            else:
+                idx += incr
+
+    def find_bisect(self, msgid):
+        """Translation bytes via binary search over the sorted originals, or None."""
+        lo, hi = 0, self.n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            self.probes += 1
+            cur = self._orig(mid)
+            if msgid < cur:
+                hi = mid
+            elif msgid > cur:
+                lo = mid + 1
+            else:
+                return self._trans(mid)
+        return None
+
+    def find(self, msgid):
+        return self.find_hashed(msgid) if self.hash_size > 2 else self.find_bisect(msgid)
@@ -0,0 +1,124 @@
+"""Placeholder and markup signatures of msgid/msgstr pairs.
+
+signature() reduces a string to what its translation must keep:
+
+  conv     : printf conversions in order (%s, %d, %.1f, %2$s ...), what Perl's
+             sprintf/tprintf will consume; the space flag is left out so
+             prose like "50% of" is not read as "% o"
+  percent  : number of literal %%
+  fields   : {{NAME}} / {0} fields substituted by code, sorted
+  tags     : HTML tags as name or /name, sorted (translators may move them)
+  entities : &name; entities, sorted
+
+msgid signatures are cached, so across 40 catalogs that share their msgids
+each one is tokenized once. check_catalog() compares every translated entry:
+conversion, field and tag differences are errors; entities only warn, as
+&ldquo; turning into a typographic quote is a legitimate translation.
+"""
+import functools
+import re
+from collections import Counter, namedtuple
+
+from .poreader import read_po
+
+Issue = namedtuple("Issue", "kind msgid detail")
+Signature = namedtuple("Signature", "conv percent fields tags entities")
+
+ERRORS = ("placeholder", "markup")
+
+# tags are matched apart, so a %s in an attribute (href="%s") still counts
+_TOKEN_RE = re.compile(
+    r"%(?P<conv>(?:\d+\$)?[-+#0]*\d*(?:\.\d+)?[sdiufFeEgGxXocb])"
+    r"|(?P<pct>%%)"
+    r"|(?P<field>\{\{\s*\w+\s*\}\}|\{\d+\})"
+    r"|(?P<ent>&#?\w+;)")
+_TAG_RE = re.compile(r"<(/?[a-zA-Z][a-zA-Z0-9]*)\b[^<>]*>")
+
+
+def signature(s):
+    conv, fields, entities = [], [], []
+    percent = 0
+    for m in _TOKEN_RE.finditer(s):
+        kind = m.lastgroup
+        if kind == "conv":
+            conv.append(m.group("conv"))
+        elif kind == "pct":
+            percent += 1
+        elif kind == "field":
+            fields.append(re.sub(r"\s+", "", m.group("field")))
+        else:
+            entities.append(m.group("ent"))
+    tags = sorted(m.group(1).lower() for m in _TAG_RE.finditer(s))
+    return Signature(tuple(conv), percent, tuple(sorted(fields)),
+                     tuple(tags), tuple(sorted(entities)))
+
+
+msgid_signature = functools.lru_cache(maxsize=None)(signature)
+
+
+def _conv_key(conv):
+    """Comparable form of a conversion list: (argument index, conversion) pairs.
+
+    Plain conversions take the next argument, so "%s of %s" and its reordered
+    translation "%2$s из %1$s" have the same key.
+    """
+    return sorted((int(c.split("$")[0]), c.split("$")[1]) if "$" in c else (i + 1, c)
+                  for i, c in enumerate(conv))
+
+
+def _fmt(items):
+    return " ".join(items) or "none"
+
+
+def compare(src, dst, plural_form=False):
+    """[(kind, detail)] where dst (a msgstr signature) breaks src's.
+
+    A plural form may leave out conversions (a "one" form often spells the
+    number out) but must not add any.
+    """
+    out = []
+    if plural_form:
+        extra = Counter(dst.conv) - Counter(src.conv)
+        if extra:
+            out.append(("placeholder", f"adds {_fmt(sorted(extra.elements()))} "
+                                       f"(msgid_plural has {_fmt(src.conv)})"))
+    elif _conv_key(src.conv) != _conv_key(dst.conv):
+        out.append(("placeholder", f"expects {_fmt(src.conv)}, has {_fmt(dst.conv)}"))
+    if src.percent and not dst.percent or dst.percent and not src.percent:
+        out.append(("placeholder", f"%% {src.percent} -> {dst.percent}"))
+    if src.fields != dst.fields:
+        out.append(("placeholder", f"fields {_fmt(src.fields)} -> {_fmt(dst.fields)}"))
+    if src.tags != dst.tags:
+        missing = Counter(src.tags) - Counter(dst.tags)
+        added = Counter(dst.tags) - Counter(src.tags)
+        out.append(("markup", f"tags missing: {_fmt(sorted(missing.elements()))}; "
+                              f"added: {_fmt(sorted(added.elements()))}"))
+    if src.entities != dst.entities:
+        out.append(("entity", f"{_fmt(src.entities)} -> {_fmt(dst.entities)}"))
+    return out
+
+
+def check_catalog(path):
+    """(entries checked, [Issue]) for the translated, non-fuzzy entries of a .po."""
+    issues = []
+    checked = 0
+    for e in read_po(path, obsolete=False):
+        if "fuzzy" in e.flags:
+            continue
+        if e.msgid_plural is None:
+            if not e.msgstr:
+                continue
+            checked += 1
+            for kind, detail in compare(msgid_signature(e.msgid), signature(e.msgstr)):
+                issues.append(Issue(kind, e.msgid, detail))
+            continue
+        if not any(e.msgstr_plural.values()):
+            continue
+        checked += 1
+        src = msgid_signature(e.msgid_plural)
+        for idx, form in sorted(e.msgstr_plural.items()):
+            if not form:
+                continue
+            for kind, detail in compare(src, signature(form), plural_form=True):
+                issues.append(Issue(kind, e.msgid, f"msgstr[{idx}] {detail}"))
+    return checked, issues
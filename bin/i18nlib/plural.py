@@ -0,0 +1,194 @@
+"""Plural-Forms headers: safe compilation, reachable forms, entry checks.
+
+The plural= expression is C (the subset gettext's plural.y accepts: n,
+unsigned integer constants, ! * / % + - < > <= >= == != && || ?: and
+parentheses). It is parsed here, never handed to eval() as text: the parser
+emits the equivalent Python expression, with C's 0/1 results for && and ||,
+and that is compiled into one list comprehension over n = 0..limit. A
+locale's whole table of form indices is then a single call, and the
+expressions (about 20 distinct ones across the 40 catalogs) are compiled once.
+
+check_catalog() flags plural entries whose msgstr[] indices do not match
+nplurals and entries that repeat the same text in two reachable forms (one
+string copied into every slot). The duplicate check is skipped where identical
+forms are normal: a plural= that only ever picks one form, and languages whose
+nouns stay singular after a numeral (Turkish "1 gün", "5 gün"), SAME_FORM_LANGS.
+"""
+import functools
+import re
+from collections import namedtuple
+
+from .poreader import read_po
+
+LIMIT = 10000
+# languages where a noun after a numeral stays singular, so msgstr[0] == msgstr[1] is
+# the right translation, not a copy-paste
+SAME_FORM_LANGS = frozenset("az cy hu id ja ka ko ms th tr vi zh".split())
+
+Issue = namedtuple("Issue", "kind msgid detail")
+
+_TOKEN_RE = re.compile(r"\s*(?:(\d+)|(n)\b|(\|\||&&|==|!=|<=|>=|[-+*/%<>!?:()]))")
+_HEADER_RE = re.compile(r"nplurals\s*=\s*(\d+)\s*;\s*plural\s*=\s*([^;]+);?")
+# binary operators by C precedence, loosest first
+_LEVELS = (("||",), ("&&",), ("==", "!="), ("<", ">", "<=", ">="), ("+", "-"), ("*", "/", "%"))
+_PY = {"/": "//", "&&": "and", "||": "or"}
+
+
+def _tokenize(expr):
+    tokens, pos = [], 0
+    expr = expr.rstrip()
+    while pos < len(expr):
+        m = _TOKEN_RE.match(expr, pos)
+        if not m:
+            raise ValueError(f"unexpected {expr[pos:].strip()[:10]!r} in plural expression")
+        tokens.append(m.group(1) or m.group(2) or m.group(3))
+        pos = m.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive descent over the tokens, returning Python source."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self, want=None):
+        tok = self.peek()
+        if tok is None or (want is not None and tok != want):
+            raise ValueError(f"expected {want or 'operand'}, got {tok or 'end'}")
+        self.pos += 1
+        return tok
+
+    def parse(self):
+        src = self.ternary()
+        if self.peek() is not None:
+            raise ValueError(f"unexpected {self.peek()!r} in plural expression")
+        return src
+
+    def ternary(self):
+        cond = self.binary(0)
+        if self.peek() != "?":
+            return cond
+        self.take("?")
+        then = self.ternary()
+        self.take(":")
+        return f"({then} if {cond} else {self.ternary()})"
+
+    def binary(self, level):
+        if level == len(_LEVELS):
+            return self.unary()
+        left = self.binary(level + 1)
+        while self.peek() in _LEVELS[level]:
+            op = self.take()
+            right = self.binary(level + 1)
+            if op in ("&&", "||"):
+                left = f"(1 if {left} {_PY[op]} {right} else 0)"
+            else:
+                left = f"({left} {_PY.get(op, op)} {right})"
+        return left
+
+    def unary(self):
+        tok = self.peek()
+        if tok == "!":
+            self.take()
+            return f"(0 if {self.unary()} else 1)"
+        if tok == "-":
+            self.take()
+            return f"(-{self.unary()})"
+        if tok == "(":
+            self.take()
+            src = self.ternary()
+            self.take(")")
+            return src
+        tok = self.take()
+        if tok != "n" and not tok.isdigit():
+            raise ValueError(f"unexpected {tok!r} in plural expression")
+        return tok
+
+
+@functools.lru_cache(maxsize=None)
+def compile_plural(expr):
+    """Function mapping an iterable of n to the list of form indices."""
+    src = _Parser(_tokenize(expr)).parse()
+    code = compile(f"[{src} for n in ns]", "<plural>", "eval")
+    return lambda ns: eval(code, {"__builtins__": {}}, {"ns": ns})
+
+
+@functools.lru_cache(maxsize=None)
+def forms_table(expr, limit=LIMIT):
+    """{form index: [n, ...]} for n = 0..limit, n ascending."""
+    table = {}
+    for n, idx in enumerate(compile_plural(expr)(range(limit + 1))):
+        table.setdefault(int(idx), []).append(n)
+    return table
+
+
+def parse_header(header_msgstr):
+    """(nplurals, expression) from a catalog header, or None."""
+    for line in header_msgstr.splitlines():
+        if line.lower().startswith("plural-forms:"):
+            m = _HEADER_RE.search(line)
+            if m:
+                return int(m.group(1)), m.group(2).strip()
+    return None
+
+
+def distinct_forms_expected(locale):
+    """False for a locale (tr_TR, zh) whose plural forms are normally identical."""
+    return locale.split("_")[0].split("-")[0].lower() not in SAME_FORM_LANGS
+
+
+def check_catalog(path, limit=LIMIT, duplicates=True):
+    """{"nplurals", "expr", "examples", "unreachable", "entries", "issues"} for a .po.
+
+    duplicates=False leaves the duplicate-forms check out (see
+    distinct_forms_expected()); it is also skipped when plural= is constant.
+    """
+    out = {"nplurals": None, "expr": None, "examples": {}, "unreachable": [],
+           "entries": 0, "issues": []}
+    table = {}
+    for e in read_po(path, obsolete=False, header=True):
+        if not e.msgid:
+            rule = parse_header(e.msgstr)
+            if rule is None:
+                out["issues"].append(Issue("header", "", "no usable Plural-Forms header"))
+                continue
+            out["nplurals"], out["expr"] = rule
+            try:
+                table = forms_table(out["expr"], limit)
+            except (ValueError, ZeroDivisionError) as err:
+                out["issues"].append(Issue("header", "", f"{out['expr']!r}: {err}"))
+                continue
+            out["examples"] = {idx: ns[:3] for idx, ns in sorted(table.items())}
+            out["unreachable"] = [i for i in range(out["nplurals"]) if i not in table]
+            beyond = sorted(i for i in table if not 0 <= i < out["nplurals"])
+            if beyond:
+                out["issues"].append(Issue("header", "", f"plural= gives index {beyond} "
+                                           f"(n={table[beyond[0]][0]}) >= nplurals={out['nplurals']}"))
+            continue
+        if e.msgid_plural is None or not any(e.msgstr_plural.values()):
+            continue
+        out["entries"] += 1
+        if out["nplurals"] is None:
+            continue
+        have = sorted(e.msgstr_plural)
+        if have != list(range(out["nplurals"])):
+            out["issues"].append(Issue("forms", e.msgid,
+                                       f"msgstr{have} but nplurals={out['nplurals']}"))
+        if not duplicates or len(table) < 2:
+            continue
+        seen = {}
+        for idx in sorted(table):
+            text = e.msgstr_plural.get(idx)
+            if not text:
+                continue
+            if text in seen:
+                out["issues"].append(Issue("duplicate", e.msgid,
+                                           f"msgstr[{seen[text]}] == msgstr[{idx}]: {text[:40]!r}"))
+                break
+            seen[text] = idx
+    return out
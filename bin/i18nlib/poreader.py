@@ -0,0 +1,139 @@
+"""Streaming, read-only .po reader.
+
+read_po() yields one lightweight Entry per catalog message and keeps nothing
+else: translator/extracted comments, occurrences (#:) and previous-msgid (#|)
+lines are skipped without being stored. Use polib when a catalog has to be
+modified and written back.
+
+Entry.msgstr_plural is {index: str} like polib's, so code written against
+POEntry attributes keeps working.
+"""
+import re
+from collections import namedtuple
+
+Entry = namedtuple("Entry", "msgid msgid_plural msgstr msgstr_plural flags obsolete")
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\", "a": "\a",
+            "b": "\b", "f": "\f", "v": "\v"}
+_ESC_RE = re.compile(r"\\(.)")
+_BLOCK_RE = re.compile(r"(\n[ \t]*\n)")
+
+
+def _unescape(s):
+    if "\\" not in s:
+        return s
+    return _ESC_RE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(0)), s)
+
+
+def read_po(path, obsolete=True, header=False):
+    """Yield Entry records from a .po file, header entry excluded.
+
+    Obsolete (#~) entries are yielded with obsolete=True unless obsolete=False.
+    header=True also yields the header (msgid "") entry.
+    """
+    with open(path, encoding="utf-8") as fh:
+        yield from _parse(fh, obsolete, header)
+
+
+def _parse(lines, obsolete, header):
+    msgid = plural = msgstr = None
+    forms = {}
+    flags = ()
+    is_obsolete = False
+    cur = None  # list collecting the string parts of the current keyword
+
+    def flush():
+        """The finished entry (or None), resetting state for the next one."""
+        nonlocal msgid, plural, msgstr, forms, flags, is_obsolete, cur
+        done = None
+        if msgid is not None and (obsolete or not is_obsolete):
+            mid = "".join(msgid)
+            if mid or header:
+                done = Entry(
+                    mid,
+                    None if plural is None else "".join(plural),
+                    "" if msgstr is None else "".join(msgstr),
+                    {k: "".join(v) for k, v in forms.items()},
+                    flags,
+                    is_obsolete,
+                )
+        msgid = plural = msgstr = cur = None
+        forms = {}
+        flags = ()
+        is_obsolete = False
+        return done
+
+    for line in lines:
+        obs = line.startswith("#~")
+        if obs:
+            line = line[2:].lstrip()
+            if line[:1] == "#":
+                continue
+        elif line[:1] == "#":
+            if line.startswith("#,"):
+                if msgid is not None:
+                    # comments after a complete entry start the next one
+                    e = flush()
+                    if e:
+                        yield e
+                flags = tuple(f.strip() for f in line[2:].split(",") if f.strip())
+            continue
+        line = line.strip()
+        if not line:
+            e = flush()
+            if e:
+                yield e
+            continue
+        if line[0] == '"':
+            if cur is not None:
+                cur.append(_unescape(line[1:-1]))
+            continue
+        key, _sp, rest = line.partition(" ")
+        value = _unescape(rest.strip()[1:-1])
+        if key == "msgid":
+            if msgid is not None:
+                # no blank line between entries
+                e = flush()
+                if e:
+                    yield e
+            msgid = cur = [value]
+            is_obsolete = obs
+        elif key == "msgid_plural":
+            plural = cur = [value]
+        elif key == "msgstr":
+            msgstr = cur = [value]
+        elif key.startswith("msgstr["):
+            cur = forms[int(key[7:-1])] = [value]
+        else:
+            cur = None  # msgctxt and anything else we do not track
+    e = flush()
+    if e:
+        yield e
+
+
+def read_blocks(path):
+    """Yield (Entry or None, text) for each blank-line separated block.
+
+    text is the block exactly as in the file, including its comments and the
+    separator that follows it, so joining every text gives the file back.
+    Blocks without a message (comments only) come with None.
+    """
+    with open(path, encoding="utf-8") as fh:
+        text = fh.read()
+    parts = _BLOCK_RE.split(text)
+    for i in range(0, len(parts), 2):
+        block = parts[i] + (parts[i + 1] if i + 1 < len(parts) else "")
+        entries = list(_parse(block.splitlines(True), True, True))
+        yield (entries[0] if len(entries) == 1 else None), block
+
+
+def catalog(path):
+    """{msgid: Entry} for the live (non-obsolete) entries of a catalog."""
+    return {e.msgid: e for e in read_po(path, obsolete=False)}
+
+
+def translation(e):
+    """msgstr, or the joined plural forms for nget() entries."""
+    if e.msgid_plural is not None:
+        return " ".join(v for _k, v in sorted(e.msgstr_plural.items()) if v.strip())
+    return e.msgstr
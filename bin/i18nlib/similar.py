@@ -0,0 +1,85 @@
+"""Nearest translated catalog entries for a msgid, by trigram similarity.
+
+The catalogs share (almost) the same msgids, so one inverted index over the
+union of msgids serves every locale. Each locale then keeps only the hits it
+has a translation for. Strings are compared on a key that ignores case,
+punctuation and whitespace runs, and the score is the Jaccard similarity of
+their trigram sets. A query counts shared trigrams with Counter.update() over
+the posting lists, so its cost follows the number of strings that share a
+trigram with it, not the catalog size.
+"""
+import heapq
+import re
+from collections import Counter
+
+from . import po_path
+from .poreader import read_po, translation
+
+_KEY_RE = re.compile(r"[^\w%$]+")
+
+
+def sim_key(s):
+    return " " + _KEY_RE.sub(" ", s.lower()).strip() + " "
+
+
+def trigrams(s):
+    key = sim_key(s)
+    return {key[i:i + 3] for i in range(len(key) - 2)}
+
+
+class TrigramIndex:
+    def __init__(self, strings):
+        self.strings = list(strings)
+        self.sizes = []
+        self.postings = {}
+        for i, s in enumerate(self.strings):
+            grams = trigrams(s)
+            self.sizes.append(len(grams))
+            for g in grams:
+                self.postings.setdefault(g, []).append(i)
+
+    def query(self, s, k=5, accept=None, min_score=0.3):
+        """Top k (score, string) by trigram Jaccard, best first.
+
+        accept(i), if given, filters candidates by position in self.strings.
+        """
+        grams = trigrams(s)
+        n = len(grams)
+        shared = Counter()
+        for g in grams:
+            ids = self.postings.get(g)
+            if ids:
+                shared.update(ids)
+        sizes = self.sizes
+        # shared / (n + size - shared) >= min_score  <=>  shared >= min_score * (n + size) / (1 + min_score)
+        lo = min_score / (1 + min_score)
+        scored = ((c / (n + sizes[i] - c), i) for i, c in shared.items()
+                  if c >= lo * (n + sizes[i]) and (accept is None or accept(i)))
+        return [(score, self.strings[i]) for score, i in heapq.nlargest(k, scored)]
+
+
+def translated(po):
+    """{msgid: translation} for the non-fuzzy, non-empty entries of a catalog."""
+    out = {}
+    for e in read_po(po, obsolete=False):
+        text = translation(e)
+        if text.strip() and "fuzzy" not in e.flags:
+            out[e.msgid] = text
+    return out
+
+
+class Suggester:
+    """Suggestions from the translated entries of several locales at once."""
+
+    def __init__(self, locales):
+        self.catalogs = {loc: translated(po_path(loc)) for loc in locales}
+        self.index = TrigramIndex(sorted(set().union(*self.catalogs.values())))
+
+    def suggest(self, msgid, locale, k=3, min_score=0.3):
+        """[{"msgid", "msgstr", "score"}] for locale, best first."""
+        cat = self.catalogs[locale]
+        strings = self.index.strings
+        hits = self.index.query(msgid, k=k, min_score=min_score,
+                                accept=lambda i: strings[i] in cat)
+        return [{"msgid": mid, "msgstr": cat[mid], "score": round(score, 3)}
+                for score, mid in hits]
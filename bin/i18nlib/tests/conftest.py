@@ -0,0 +1,11 @@
+"""Unit tests for i18nlib: python3 -m pytest -q bin/i18nlib/tests
+
+The tools import the package as plain `i18nlib` with bin/ on sys.path, and so
+do the tests.
+"""
+import os
+import sys
+
+BIN = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BIN not in sys.path:
+    sys.path.insert(0, BIN)
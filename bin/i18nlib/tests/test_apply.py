@@ -0,0 +1,142 @@
+import polib
+import pytest
+
+from i18nlib.apply import Layer, apply_catalog, load_dictionary, load_layers, merge
+from i18nlib.poreader import read_blocks
+
+CATALOG = r'''# Russian translation
+msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\n"
+"Plural-Forms: nplurals=3; plural=(n%10==1 && n%100!=11 ? 0 : n%10>=2 && "
+"n%10<=4 && (n%100<10 || n%100>=20) ? 1 : 2);\n"
+
+#: templates/web/base/a.html:1
+msgid "Done"
+msgstr "Готово"
+
+#. wrapped the way msgmerge left it, which polib would re-wrap
+msgid "Long"
+msgstr ""
+"часть один "
+"часть два"
+
+#: templates/web/base/a.html:2
+msgid "Untranslated"
+msgstr ""
+
+#, fuzzy
+msgid "Fuzzy one"
+msgstr "старое"
+
+msgid "%d day"
+msgid_plural "%d days"
+msgstr[0] ""
+msgstr[1] ""
+msgstr[2] ""
+
+msgid "%d week"
+msgid_plural "%d weeks"
+msgstr[0] "неделя"
+msgstr[1] "недели"
+
+#~ msgid "Gone"
+#~ msgstr "Ушло"
+'''
+
+
+@pytest.fixture
+def po(tmp_path):
+    path = tmp_path / "FixMyStreet.po"
+    path.write_text(CATALOG, encoding="utf-8")
+    return str(path)
+
+
+def _layer(table, only=None):
+    return Layer("test.tsv", only, table)
+
+
+def _entries(text):
+    return {e.msgid: e for e in polib.pofile(text)}
+
+
+def test_no_layers_leaves_the_catalog_as_it_is(po):
+    text, st = apply_catalog(po, [])
+    assert text == CATALOG
+    assert (st.total, st.translated, st.fuzzy, st.untranslated) == (6, 2, 1, 3)
+    assert st.still_untranslated == ["Untranslated", "%d day", "%d week"]
+    assert st.still_fuzzy == ["Fuzzy one"]
+
+
+def test_first_layer_wins(po):
+    a = _layer({"Untranslated": "A", "Fuzzy one": "A", "Done": "A"})
+    b = _layer({"Untranslated": "B", "Fuzzy one": "B"})
+    for layers, want in (([a, b], "A"), ([b, a], "B")):
+        text, st = apply_catalog(po, layers)
+        entries = _entries(text)
+        assert entries["Untranslated"].msgstr == want
+        assert entries["Fuzzy one"].msgstr == want
+        assert "fuzzy" not in entries["Fuzzy one"].flags
+        assert entries["Done"].msgstr == "Готово"  # translated entries are left alone
+        assert (st.filled, st.fuzzy_fixed) == (1, 1)
+
+
+def test_only_restricts_a_layer_to_an_entry_state(po):
+    fuzzy_only = _layer({"Untranslated": "F", "Fuzzy one": "F"}, only="fuzzy")
+    untranslated_only = _layer({"Untranslated": "U", "Fuzzy one": "U"}, only="untranslated")
+    assert merge([fuzzy_only, untranslated_only]) == (
+        {"Untranslated": "F", "Fuzzy one": "F"}, {"Untranslated": "U", "Fuzzy one": "U"})
+    text, _st = apply_catalog(po, [fuzzy_only, untranslated_only])
+    entries = _entries(text)
+    assert (entries["Untranslated"].msgstr, entries["Fuzzy one"].msgstr) == ("U", "F")
+
+    text, st = apply_catalog(po, [fuzzy_only])
+    assert _entries(text)["Untranslated"].msgstr == ""
+    assert st.still_untranslated[0] == "Untranslated"
+
+
+def test_plural_forms_must_match_nplurals(po):
+    text, st = apply_catalog(po, [_layer({"%d day": ("день", "дня"),
+                                          "%d week": ("неделя", "недели", "недель")})])
+    assert st.rejected == [("%d day", 2)]
+    entries = _entries(text)
+    assert entries["%d day"].msgstr_plural == {0: "", 1: "", 2: ""}
+    # a translated entry short of nplurals forms is refilled
+    assert entries["%d week"].msgstr_plural == {0: "неделя", 1: "недели", 2: "недель"}
+
+    text, st = apply_catalog(po, [_layer({"%d day": "дн."})])
+    assert st.rejected == []
+    assert _entries(text)["%d day"].msgstr_plural == {0: "дн.", 1: "дн.", 2: "дн."}
+
+
+def test_untouched_blocks_stay_byte_identical(po):
+    changed = {"Untranslated", "Fuzzy one"}
+    text, _st = apply_catalog(po, [_layer({m: "X" for m in changed})])
+    for entry, block in read_blocks(po):
+        if entry is None or entry.msgid not in changed:
+            assert block in text
+    assert text.startswith(CATALOG[:CATALOG.index("#: templates/web/base/a.html:2")])
+    assert text.endswith(CATALOG[CATALOG.index('msgid "%d day"'):])
+
+
+def test_add_appends_missing_msgids(po):
+    text, st = apply_catalog(po, [_layer({"New string": "Новое", "Done": "Сделано"})],
+                             add=["New string", "Done"])
+    assert st.added == 1
+    assert text.startswith(CATALOG.rstrip("\n"))
+    assert _entries(text)["New string"].msgstr == "Новое"
+    assert _entries(text)["Done"].msgstr == "Готово"
+
+
+def test_dictionaries_and_manifest(tmp_path):
+    (tmp_path / "ru.tsv").write_text("# comment\nDone\tГотово\\nвсё\n%d day\tдень\tдня\tдней\n",
+                                     encoding="utf-8")
+    (tmp_path / "ru.json").write_text('{"Done": "Сделано", "%d day": ["д", "д", "д"]}',
+                                      encoding="utf-8")
+    assert load_dictionary(str(tmp_path / "ru.tsv")) == {
+        "Done": "Готово\nвсё", "%d day": ("день", "дня", "дней")}
+    assert load_dictionary(str(tmp_path / "ru.json")) == {"Done": "Сделано", "%d day": ("д", "д", "д")}
+    layers = load_layers(str(tmp_path), ["ru.tsv", {"file": "ru.json", "only": "fuzzy"}])
+    assert [layer.only for layer in layers] == [None, "fuzzy"]
+    with pytest.raises(ValueError):
+        load_layers(str(tmp_path), [{"file": "ru.json", "only": "translated"}])
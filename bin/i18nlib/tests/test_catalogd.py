@@ -0,0 +1,111 @@
+import os
+import threading
+
+import pytest
+
+from i18nlib import audit, catalogd, catindex
+from i18nlib.catalogd import CatalogService, Client, ask
+
+HEADER = 'msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=UTF-8\\n"\n\n'
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    """A one-locale tree: xx_XX translates the first msgid the scope uses."""
+    po = tmp_path / "xx_XX.UTF-8" / "LC_MESSAGES" / "FixMyStreet.po"
+    po.parent.mkdir(parents=True)
+    monkeypatch.setattr(catindex, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(catalogd, "discover_locales", lambda: {"xx_XX": "xx_XX"})
+    monkeypatch.setattr(catalogd, "po_path", lambda locale: str(po))
+    monkeypatch.setattr(audit, "po_path", lambda locale: str(po))
+    return po
+
+
+def _write(po, translations):
+    body = "".join(f'msgid "{k}"\nmsgstr "{v}"\n\n' for k, v in translations.items())
+    po.write_text(HEADER + body, encoding="utf-8")
+    # a rewrite within the same mtime tick must still look changed
+    st = os.stat(po)
+    os.utime(po, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def service(catalog):
+    _write(catalog, {})
+    svc = CatalogService("infrasignal")
+    used = sorted(svc.state.refs)
+    svc.po, svc.first, svc.second = catalog, used[0], used[1]
+    _write(catalog, {svc.first: "Один"})
+    svc.refresh()
+    return svc
+
+
+def _ok(svc, **req):
+    resp = svc.handle(req)
+    assert resp["ok"], resp
+    return resp["result"]
+
+
+def test_ping_and_status(service):
+    assert _ok(service, op="ping") == {"scope": "infrasignal", "msgids": len(service.state.ids),
+                                       "locales": 1, "generation": 1}
+    first = _ok(service, op="status", msgid=service.first, locale="xx_XX")
+    assert (first["category"], first["used"]) == (None, True)
+    second = _ok(service, op="status", msgid=service.second, locale="xx_XX")
+    assert (second["status"], second["category"]) == (None, "MISSING")
+    assert _ok(service, op="status", msgid="Never used anywhere", locale="xx_XX")["used"] is False
+
+
+def test_where(service):
+    res = _ok(service, op="where", msgid=service.first)
+    assert res["msgid"] == service.first
+    assert res["refs"] and res["files"] == sorted({f for f, _line in res["refs"]})
+    assert _ok(service, op="where", msgid="Never used anywhere")["refs"] == []
+
+
+def test_missing_and_audit(service):
+    missing = {r["msgid"] for r in _ok(service, op="missing", locale="xx_XX")}
+    assert service.first not in missing and service.second in missing
+    res = _ok(service, op="audit", langs={"xx": "xx_XX"})
+    assert res["daemon"] == 1
+    assert {r["msgid"] for r in res["locales"][0]["MISSING"]} == missing
+
+
+def test_po_change_is_reloaded(service):
+    _write(service.po, {service.first: "Один", service.second: "Два"})
+    missing = {r["msgid"] for r in _ok(service, op="missing", locale="xx_XX")}
+    assert service.second not in missing
+    assert _ok(service, op="status", msgid=service.second, locale="xx_XX")["category"] is None
+    assert _ok(service, op="audit", langs={"xx": "xx_XX"})["locales"][0]["counts"]["MISSING"] \
+        == len(missing)
+
+
+def test_errors(service):
+    resp = service.handle({"op": "missing", "locale": "xx_XX", "scope": "full"})
+    assert resp == {"ok": False, "error": "LookupError: daemon serves scope 'infrasignal'"}
+    assert service.handle({"op": "audit", "langs": {}, "scope": "cobrand"})["ok"] is False
+    assert service.handle({"op": "nope"}) == {"ok": False, "error": "unknown op 'nope'"}
+    assert service.handle({"op": "status", "msgid": "x", "locale": "zz_ZZ"})["ok"] is False
+
+
+def test_socket_round_trip(service, tmp_path):
+    path = str(tmp_path / "d.sock")
+    server = catalogd._Server(path, catalogd._Handler)
+    server.service = service
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = Client(path)
+        try:
+            assert client.request({"op": "ping"})["result"]["locales"] == 1
+            client.sock.sendall(b"not json\n")
+            assert client.rfile.readline().startswith(b'{"ok": false, "error": "bad request')
+        finally:
+            client.close()
+        assert ask("where", path=path, msgid=service.first)["msgid"] == service.first
+        # another scope: the caller does the work itself
+        assert ask("missing", path=path, locale="xx_XX", scope="full") is None
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert ask("ping", path=str(tmp_path / "absent.sock")) is None
@@ -0,0 +1,130 @@
+import glob
+import os
+import struct
+
+import pytest
+
+from i18nlib import catindex, normalize
+from i18nlib.catindex import (MAGIC, STATUS_EMPTY, STATUS_FUZZY, STATUS_NORMALIZED,
+                              STATUS_PLURAL, STATUS_TRANSLATED, VERSION, CatalogIndex,
+                              build, key)
+from i18nlib.poreader import read_po
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+CATALOGS = sorted(glob.glob(os.path.join(REPO, "locale/*/LC_MESSAGES/FixMyStreet.po")))
+
+CATALOG = '''msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+"Plural-Forms: nplurals=2; plural=(n != 1);\\n"
+
+msgid "Sign in"
+msgstr "Войти"
+
+msgid "Report a\\n  problem"
+msgstr "Сообщить о проблеме"
+
+msgid "Not yet"
+msgstr ""
+
+#, fuzzy
+msgid "Unsure"
+msgstr "Неуверенно"
+
+msgid "%d day"
+msgid_plural "%d days"
+msgstr[0] "%d день"
+msgstr[1] "%d дня"
+'''
+
+
+@pytest.fixture
+def po(tmp_path, monkeypatch):
+    monkeypatch.setattr(catindex, "CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "xx_XX.UTF-8" / "LC_MESSAGES" / "FixMyStreet.po"
+    path.parent.mkdir(parents=True)
+    path.write_text(CATALOG, encoding="utf-8")
+    return str(path)
+
+
+def test_file_layout(po):
+    path = build(po)
+    assert path == os.path.join(catindex.CACHE_DIR, "catalog-xx_XX.UTF-8.idx")
+    with open(path, "rb") as fh:
+        data = fh.read()
+    header = struct.Struct("=4sIqqI")
+    magic, version, mtime, size, n = header.unpack_from(data)
+    st = os.stat(po)
+    assert (magic, version, mtime, size) == (MAGIC, VERSION, st.st_mtime_ns, st.st_size)
+    # five entries plus the normalized key of the one with a newline in it
+    assert n == 6
+    assert len(data) == header.size + n * (8 + 4 + 1)
+    keys = struct.unpack_from(f"={n}Q", data, header.size)
+    assert list(keys) == sorted(keys)
+
+
+def test_lookup(po):
+    with CatalogIndex.open(po) as idx:
+        assert len(idx) == 6
+        assert idx.lookup("Sign in") == STATUS_TRANSLATED
+        assert idx.lookup("Not yet") == STATUS_EMPTY
+        assert idx.lookup("Unsure") == STATUS_FUZZY
+        assert idx.lookup("%d day") == STATUS_TRANSLATED | STATUS_PLURAL
+        assert idx.lookup("Report a\n  problem") == STATUS_TRANSLATED
+        # the template spells it on one line: found through the normalized key
+        assert idx.lookup("Report a problem") == STATUS_TRANSLATED | STATUS_NORMALIZED
+        assert idx.lookup("Report  a problem") == STATUS_TRANSLATED | STATUS_NORMALIZED
+        assert "Sign out" not in idx
+        assert idx.msgstr_matches("Sign in", "Войти")
+        assert not idx.msgstr_matches("Sign in", "Вход")
+        assert not idx.msgstr_matches("Unsure", "Неуверенно")
+
+
+def test_rebuilt_only_when_the_po_changes(po):
+    CatalogIndex.open(po).close()
+    idx_path = catindex.index_path(po)
+    built = os.stat(idx_path).st_mtime_ns
+    CatalogIndex.open(po).close()
+    assert os.stat(idx_path).st_mtime_ns == built
+
+    with open(po, "a", encoding="utf-8") as fh:
+        fh.write('\nmsgid "Sign out"\nmsgstr "Выйти"\n')
+    with CatalogIndex.open(po) as idx:
+        assert idx.lookup("Sign out") == STATUS_TRANSLATED
+    with CatalogIndex.open(po, rebuild=False) as idx:
+        assert "Sign out" in idx
+
+
+def test_older_version_is_rebuilt(po):
+    # VERSION is bumped when leaks.py changes its verdicts; an index written
+    # before the bump must not be served
+    path = build(po)
+    with open(path, "r+b") as fh:
+        fh.seek(4)
+        fh.write(struct.pack("=I", VERSION - 1))
+    with pytest.raises(ValueError, match=f"not a v{VERSION} catalog index"):
+        CatalogIndex(path)
+    with CatalogIndex.open(po) as idx:
+        assert idx.lookup("Sign in") == STATUS_TRANSLATED
+
+
+def test_no_key_collisions_in_our_catalogs():
+    # keys are 64-bit blake2b prefixes: a collision would make one msgid
+    # answer for another, so check every msgid we ship
+    strings = set()
+    for po in CATALOGS:
+        for e in read_po(po, obsolete=False):
+            strings.add(e.msgid)
+            strings.add(normalize(e.msgid))
+    assert len(strings) > 1000
+    assert len({key(s) for s in strings}) == len(strings)
+
+
+def test_exact_key_wins_over_a_normalized_one(tmp_path, monkeypatch):
+    monkeypatch.setattr(catindex, "CACHE_DIR", str(tmp_path / "cache"))
+    po = tmp_path / "FixMyStreet.po"
+    po.write_text('msgid ""\nmsgstr ""\n\nmsgid "a  b"\nmsgstr "x"\n\n'
+                  'msgid "a b"\nmsgstr ""\n', encoding="utf-8")
+    with CatalogIndex(build(str(po), str(tmp_path / "i.idx"))) as idx:
+        assert idx.lookup("a b") == STATUS_EMPTY
+        assert idx.lookup("a  b") == STATUS_TRANSLATED
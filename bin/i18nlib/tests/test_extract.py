@@ -0,0 +1,84 @@
+import os
+
+import pytest
+
+from i18nlib import extract
+from i18nlib.extract import ExtractCache, _scan_one
+
+TEMPLATE = "<p>[% loc('Report a problem') %]</p>\n<p>[% loc('Sign in') %]</p>\n"
+
+
+def _lookup_or_scan(cache, path):
+    msgs = cache.lookup(path, "page.html")
+    if msgs is None:
+        msgs = cache.store("page.html", *_scan_one(path))
+    return msgs
+
+
+def _forbid_scan(monkeypatch):
+    monkeypatch.setattr(extract, "_scanner", lambda path: pytest.fail(f"{path} rescanned"))
+
+
+def _msgids(msgs):
+    return [m[0] for m in msgs]
+
+
+def _cache(tmp_path, text=TEMPLATE):
+    src = tmp_path / "page.html"
+    src.write_text(text, encoding="utf-8")
+    cache = ExtractCache(path=str(tmp_path / "cache.json"))
+    assert _msgids(_lookup_or_scan(cache, str(src))) == ["Report a problem", "Sign in"]
+    cache.save()
+    return src, ExtractCache(path=str(tmp_path / "cache.json"))
+
+
+def test_unchanged_file_is_a_hit(tmp_path, monkeypatch):
+    src, cache = _cache(tmp_path)
+    _forbid_scan(monkeypatch)
+    assert _msgids(_lookup_or_scan(cache, str(src))) == ["Report a problem", "Sign in"]
+    assert (cache.hits, cache.misses, cache.dirty) == (1, 0, False)
+
+
+def test_touched_unchanged_file_is_not_rescanned(tmp_path, monkeypatch):
+    src, cache = _cache(tmp_path)
+    st = os.stat(src)
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    _forbid_scan(monkeypatch)
+    assert _msgids(_lookup_or_scan(cache, str(src))) == ["Report a problem", "Sign in"]
+    assert (cache.hits, cache.misses) == (1, 0)
+    # the new stat key is saved, so the next run does not hash the file again
+    assert cache.dirty
+    cache.save()
+    again = ExtractCache(path=str(tmp_path / "cache.json"))
+    assert again.files["page.html"]["mtime"] == st.st_mtime_ns + 10**9
+
+
+def test_edited_file_is_rescanned(tmp_path):
+    src, cache = _cache(tmp_path)
+    src.write_text(TEMPLATE.replace("Sign in", "Sign out"), encoding="utf-8")
+    assert _msgids(_lookup_or_scan(cache, str(src))) == ["Report a problem", "Sign out"]
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_same_size_edit_with_old_mtime_is_a_hit(tmp_path):
+    # the stat key is trusted: a same-size edit that keeps the mtime is not seen
+    src, cache = _cache(tmp_path)
+    st = os.stat(src)
+    src.write_text(TEMPLATE.replace("Sign in", "Log in!"), encoding="utf-8")
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert _msgids(_lookup_or_scan(cache, str(src))) == ["Report a problem", "Sign in"]
+
+
+def test_files_not_seen_are_dropped_on_save(tmp_path):
+    _src, cache = _cache(tmp_path)
+    cache.save()
+    assert ExtractCache(path=str(tmp_path / "cache.json")).files == {}
+
+
+def test_disabled_cache_is_not_written(tmp_path):
+    src = tmp_path / "page.html"
+    src.write_text(TEMPLATE, encoding="utf-8")
+    cache = ExtractCache(path=str(tmp_path / "cache.json"), enabled=False)
+    _lookup_or_scan(cache, str(src))
+    cache.save()
+    assert not (tmp_path / "cache.json").exists()
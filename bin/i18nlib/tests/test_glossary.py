@@ -0,0 +1,67 @@
+import os
+import random
+
+from i18nlib.glossary import Automaton, Glossary
+from i18nlib.poreader import Entry
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+
+def _naive(patterns, text):
+    return sorted((i, i + len(p), payload) for p, payload in patterns
+                  for i in range(len(text) - len(p) + 1) if text.startswith(p, i))
+
+
+def test_overlapping_patterns():
+    patterns = [("he", 1), ("she", 2), ("his", 3), ("hers", 4), ("e", 5)]
+    text = "ushers and his sheep"
+    assert sorted(Automaton(patterns).search(text)) == _naive(patterns, text)
+
+
+def test_matches_naive_search():
+    rng = random.Random(311)
+    for _ in range(200):
+        patterns = [("".join(rng.choice("abc") for _ in range(rng.randint(1, 5))), n)
+                    for n in range(rng.randint(1, 12))]
+        text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 60)))
+        assert sorted(Automaton(patterns).search(text)) == _naive(patterns, text)
+
+
+def test_duplicate_patterns_keep_every_payload():
+    got = sorted(Automaton([("report", "a"), ("report", "b")]).search("report"))
+    assert got == [(0, 6, "a"), (0, 6, "b")]
+
+
+def test_no_patterns():
+    assert list(Automaton([]).search("anything")) == []
+
+
+TERMS = [{"term": "report", "match": ["report", "reports"],
+          "ignore": ["^report", "to report", "report a"],
+          "require": {"ru_RU": ["обращени"], "es": ["reporte"]}}]
+
+
+def test_sources_whole_words_and_ignore_phrases():
+    g = Glossary(TERMS)
+    assert g.sources("Your reports") == {0}
+    assert g.sources("Reported by you") == frozenset()  # not a whole word
+    assert g.sources("Report a problem") == frozenset()  # ^report and "report a"
+    assert g.sources("How to report the report") == {0}  # second one counts
+
+
+def test_check():
+    g = Glossary(TERMS)
+    assert g.check("Your reports", "Ваши обращения", "ru_RU") == set()
+    assert g.check("Your reports", "Ваши отчёты", "ru_RU") == {0}
+    assert g.check("Your reports", "Mis informes", "tr_TR") == set()  # no rule for the locale
+    entries = [Entry("Your reports", None, "Ваши отчёты", {}, (), False),
+               Entry("Your reports", None, "Ваши отчёты", {}, ("fuzzy",), False),
+               Entry("%d report", "%d reports", "", {0: "%d обращение", 1: "%d обращения"}, (), False)]
+    issues = g.check_catalog(entries, "ru_RU")
+    assert [(i.term, i.msgid, i.expected) for i in issues] == [("report", "Your reports", ["обращени"])]
+
+
+def test_repo_glossary_loads():
+    g = Glossary.load(os.path.join(REPO, "bin/i18n-glossary.data.json"))
+    assert {"ru_RU", "tr_TR", "es"} <= set(g.locales)
+    assert g.check("Report a problem", "Сообщить о проблеме", "ru_RU") == set()
@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+from i18nlib.leaks import LATIN, LeakScanner, classify, is_brand, pairs, scan_catalog
+from i18nlib.poreader import read_po
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+
+def _scanner(locale):
+    path = os.path.join(REPO, f"locale/{locale}.UTF-8/LC_MESSAGES/FixMyStreet.po")
+    return LeakScanner.for_catalog(list(pairs(read_po(path, obsolete=False))))
+
+
+@pytest.fixture(scope="module")
+def ru():
+    return _scanner("ru_RU")
+
+
+@pytest.fixture(scope="module")
+def es():
+    return _scanner("es")
+
+
+def test_catalog_script(ru, es):
+    assert ru.script == "Cyrillic"
+    assert es.script == LATIN
+    assert _scanner("sr").script == LATIN and _scanner("uk_UA").script == "Cyrillic"
+
+
+# msgids copied into a ru msgstr unchanged; the script scan alone let most of
+# them through (capitalised words were taken for names)
+@pytest.mark.parametrize("msgid", ["Report a problem", "Sign in", "Your account", "Report abuse",
+                                   "Close account", "Privacy Policy", "Email"])
+def test_identical_msgstr_leaks_in_non_latin_catalog(ru, msgid):
+    assert ru.identical(msgid, msgid)
+    assert ru.is_leak(msgid, msgid)
+    assert ru.is_leak(msgid, f" {msgid} ")
+
+
+@pytest.mark.parametrize("msgid", ["FixMyStreet", "OK", "URL", "Open311 API", "MapIt", "GitHub"])
+def test_brands_are_not_leaks(ru, es, msgid):
+    assert is_brand(msgid)
+    assert not ru.is_leak(msgid, msgid)
+    assert not es.is_leak(msgid, msgid)
+
+
+def test_identical_in_latin_catalog_needs_length(es):
+    for msgid in ("Email", "Sign in", "Your account"):
+        assert not es.is_leak(msgid, msgid)
+    assert es.is_leak("Report a problem", "Report a problem")
+    assert es.is_leak("Privacy Policy", "Privacy Policy")
+
+
+def test_all_latin_msgstr_counts_capitalised_words(ru):
+    # nothing in Cyrillic: "Your" and "Account" are English, not names
+    assert ru.scan("Your Account", "Your Account") == (["Your", "Account"], 2, 1.0)
+    assert ru.is_leak("Manage Your Account", "Your Account")
+
+
+def test_english_clause_in_translation(ru, es):
+    assert ru.is_leak("Report a problem here", "Сообщить report a problem here")
+    assert es.is_leak("Your account has been deleted", "Tu cuenta has been deleted")
+
+
+def test_kept_names_are_not_leaks(ru, es):
+    assert not ru.is_leak("Your reports on FixMyStreet", "Ваши отчёты на FixMyStreet")
+    assert not ru.is_leak("Sign in with Google", "Войти через Google")
+    assert not ru.is_leak("Send to the URL", "Отправить на URL")
+    # one English loanword in a Latin-script translation is not enough
+    assert not es.is_leak("Email me updates", "Envíame updates por email")
+
+
+def test_native_words_are_left_out():
+    de = _scanner("de_DE")
+    assert "in" in de.native
+    assert not de.is_leak("The report is in the queue", "Der Bericht ist in der Warteschlange")
+
+
+def test_classify_ignores_markup_placeholders_and_addresses():
+    _codes, latin, total = classify('<a href="/faq">Справка</a> %s your@email.com')
+    assert latin == [] and total == 1
+
+
+def test_scan_catalog(tmp_path):
+    entries = [("Report a problem", "Сообщить о проблеме"), ("Your account", "Ваш аккаунт"),
+               ("Sign in", "Sign in"), ("FixMyStreet", "FixMyStreet"),
+               ("Report abuse here", "Пожаловаться report abuse here"),
+               ("Your reports", "Ваши отчёты")]
+    po = tmp_path / "ru.po"
+    po.write_text("".join(f'msgid "{m}"\nmsgstr "{s}"\n\n' for m, s in entries), encoding="utf-8")
+    scanner, scanned, leaks = scan_catalog(str(po))
+    assert scanner.script == "Cyrillic" and scanned == len(entries)
+    assert [(leak.msgid, leak.share) for leak in leaks] == [("Sign in", 1.0), ("Report abuse here", 0.75)]
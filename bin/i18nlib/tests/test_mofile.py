@@ -0,0 +1,114 @@
+import gettext
+import glob
+import io
+import os
+
+import pytest
+
+from i18nlib.mofile import MOFile, compile_mo, compile_po, hash_string, next_prime, po_messages
+
+polib = pytest.importorskip("polib")
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+CATALOGS = sorted(glob.glob(os.path.join(REPO, "locale/*/LC_MESSAGES/FixMyStreet.po")))
+LOCALES = [os.path.join(REPO, f"locale/{loc}.UTF-8/LC_MESSAGES/FixMyStreet.po")
+           for loc in ("ru_RU", "tr_TR", "es")]
+
+
+def _hash_c(data):
+    """hash_string() as 32-bit C computes it, written out without shortcuts."""
+    hval = 0
+    for c in data:
+        if c == 0:
+            break
+        hval = (hval << 4) % 2**32
+        hval = (hval + c) % 2**32
+        g = hval & (0xF << 28)
+        if g != 0:
+            hval ^= g >> 24
+            hval ^= g
+    return hval
+
+
+def test_hash_string_known_values():
+    assert hash_string(b"") == 0
+    assert hash_string(b"a") == 0x61
+    assert hash_string(b"ab\0cd") == hash_string(b"ab") == (0x61 << 4) + 0x62
+    assert hash_string(b"\x0f" * 7) == 0xFFFFFFF
+
+
+def test_hash_string_stays_32_bit():
+    # (hval << 4) + c passes 2**32 here; unmasked the result was 0x1000000ef
+    assert hash_string(b"\x0f" * 7 + b"\xff") == 0xEF
+    for s in (b"\xff" * 40, "Отправить сообщение о проблеме".encode(), b"Report a problem" * 8):
+        assert hash_string(s) == _hash_c(s) < 2**32
+
+
+def test_next_prime():
+    # gettext's is_prime() takes 3 and 9 for composite; msgfmt sizes tables with it
+    assert [next_prime(n) for n in (0, 2, 4, 8, 12, 100, 3104)] == [1, 5, 5, 11, 13, 101, 3109]
+
+
+@pytest.mark.parametrize("path", CATALOGS, ids=lambda p: p.split(os.sep)[-3])
+def test_without_hash_table_matches_polib(path, tmp_path):
+    mo = tmp_path / "ref.mo"
+    polib.pofile(path).save_as_mofile(str(mo))
+    assert compile_po(path, hash_table=False) == mo.read_bytes()
+
+
+@pytest.mark.parametrize("path", LOCALES, ids=lambda p: p.split(os.sep)[-3])
+def test_round_trip(path, tmp_path):
+    data = compile_po(path)
+    mo = tmp_path / "out.mo"
+    mo.write_bytes(data)
+    parsed = polib.mofile(str(mo))
+    assert "Plural-Forms" in parsed.metadata
+    got = {(e.msgid, e.msgid_plural or None): (e.msgstr, dict(e.msgstr_plural))
+           for e in parsed}
+    want = {}
+    for e in polib.pofile(path).translated_entries():
+        want[e.msgid, e.msgid_plural or None] = (
+            "" if e.msgid_plural else e.msgstr,
+            {int(k): v for k, v in e.msgstr_plural.items()})
+    assert got == want
+    # and gettext reads it back, plural rule included
+    tr = gettext.GNUTranslations(io.BytesIO(data))
+    for (msgid, plural), (msgstr, forms) in list(want.items())[:200]:
+        if plural is None:
+            assert tr.gettext(msgid) == msgstr
+        else:
+            assert tr.ngettext(msgid, plural, 1) == forms[0]
+
+
+@pytest.mark.parametrize("path", LOCALES, ids=lambda p: p.split(os.sep)[-3])
+def test_lookups_agree(path):
+    mo = MOFile(compile_po(path))
+    messages = po_messages(path)
+    assert mo.n == len(messages) and mo.hash_size == next_prime(mo.n * 4 // 3)
+    for orig, trans in messages:
+        msgid = orig.split(b"\0")[0]
+        assert mo.find_hashed(msgid) == mo.find_bisect(msgid) == trans
+    for missing in (b"No such msgid", b"Report a problem!", b"\xff" * 12):
+        assert mo.find_hashed(missing) is None and mo.find_bisect(missing) is None
+
+
+def test_small_catalogs():
+    for n in range(0, 12):
+        messages = [(f"msgid {i}".encode(), f"msgstr {i}".encode()) for i in range(n)]
+        mo = MOFile(compile_mo(messages))
+        assert mo.hash_size == max(next_prime(n * 4 // 3), 3)
+        for orig, trans in messages:
+            assert mo.find(orig) == trans
+        assert mo.find(b"msgid") is None
+
+
+def test_bisect_only_file():
+    messages = po_messages(LOCALES[0])
+    mo = MOFile(compile_mo(messages, hash_table=False))
+    assert mo.hash_size == 0
+    assert all(mo.find(orig.split(b"\0")[0]) == trans for orig, trans in messages)
+
+
+def test_rejects_foreign_data():
+    with pytest.raises(ValueError):
+        MOFile(b"\0" * 28)
@@ -0,0 +1,69 @@
+import pytest
+
+from i18nlib.placeholders import Issue, Signature, check_catalog, compare, signature
+
+
+def test_signature():
+    assert signature('%s reported <a href="%s">%d problems</a> &ndash; %% {{NAME}} {0}') == \
+        Signature(("s", "s", "d"), 1, ("{0}", "{{NAME}}"), ("/a", "a"), ("&ndash;",))
+    assert signature("%2$s by %1$s, %.1f km") == Signature(("2$s", "1$s", ".1f"), 0, (), (), ())
+    # prose is not a conversion: the space flag is left out
+    assert signature("50% of reports").conv == ()
+    assert signature("{{ name }}").fields == ("{{name}}",)
+    assert signature("<BR/><br>").tags == ("br", "br")
+
+
+@pytest.mark.parametrize("msgid, msgstr, kinds", [
+    ("%s of %d", "%s из %d", []),
+    ("%s of %d", "%d из %s", ["placeholder"]),
+    ("%1$s of %2$s", "%2$s из %1$s", []),
+    ("%s of %s", "%2$s из %1$s", []),
+    ("Hi {{NAME}}", "Привет", ["placeholder"]),
+    ("100%% sure", "уверен на 100%%", []),
+    ("100%% sure", "уверен", ["placeholder"]),
+    ("<strong>Note</strong>", "Примечание", ["markup"]),
+    ("<a>x</a> <b>y</b>", "<b>y</b> <a>x</a>", []),
+    ("&ldquo;x&rdquo;", "«x»", ["entity"]),
+])
+def test_compare(msgid, msgstr, kinds):
+    assert [kind for kind, _detail in compare(signature(msgid), signature(msgstr))] == kinds
+
+
+def test_plural_form_may_drop_but_not_add_conversions():
+    src = signature("%d reports")
+    assert compare(src, signature("один отчёт"), plural_form=True) == []
+    assert compare(src, signature("%d отчёта за %s"), plural_form=True) == \
+        [("placeholder", "adds s (msgid_plural has d)")]
+
+
+def test_check_catalog(tmp_path):
+    po = tmp_path / "FixMyStreet.po"
+    po.write_text('''msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+"Plural-Forms: nplurals=2; plural=(n != 1);\\n"
+
+msgid "%s updated"
+msgstr "%s обновлено"
+
+msgid "Report <strong>%s</strong>"
+msgstr "Сообщить %s"
+
+#, fuzzy
+msgid "%d left"
+msgstr "осталось"
+
+msgid "Untranslated %s"
+msgstr ""
+
+msgid "%d day"
+msgid_plural "%d days"
+msgstr[0] "один день"
+msgstr[1] "%d дней %s"
+''', encoding="utf-8")
+    checked, issues = check_catalog(str(po))
+    assert checked == 3
+    assert issues == [
+        Issue("markup", "Report <strong>%s</strong>", "tags missing: /strong strong; added: none"),
+        Issue("placeholder", "%d day", "msgstr[1] adds s (msgid_plural has d)"),
+    ]
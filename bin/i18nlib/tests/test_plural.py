@@ -0,0 +1,108 @@
+import gettext
+import glob
+import os
+
+import pytest
+
+from i18nlib.plural import (check_catalog, compile_plural, distinct_forms_expected,
+                            forms_table, parse_header)
+from i18nlib.poreader import read_po
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+CATALOGS = sorted(glob.glob(os.path.join(REPO, "locale/*/LC_MESSAGES/FixMyStreet.po")))
+
+
+def _catalog_exprs():
+    exprs = set()
+    for path in CATALOGS:
+        header = next(e for e in read_po(path, header=True) if not e.msgid)
+        rule = parse_header(header.msgstr)
+        if rule:
+            exprs.add(rule[1])
+    return sorted(exprs)
+
+
+EXPRS = [
+    "0",
+    "n != 1",
+    "n>1",
+    "n==1 ? 0 : n==2 ? 1 : 2",
+    "n ? n>1 ? 2 : 1 : 0",
+    "(n%10==1 && n%100!=11) ? 0 : (n%10>=2 && n%10<=4 && (n%100<10 || n%100>=20)) ? 1 : 2",
+    "n==0 ? 0 : n==1 ? 1 : n==2 ? 2 : n%100>=3 && n%100<=10 ? 3 : n%100>=11 ? 4 : 5",
+    "!(n == 1) + n / 10 * 0 + 2 - 2",
+    "n % 3 == 1 || n / 7 < 2 && n != 4",
+] + _catalog_exprs()
+
+
+@pytest.mark.parametrize("expr", EXPRS)
+def test_matches_gettext_c2py(expr):
+    ref = gettext.c2py(expr)
+    ns = list(range(2000)) + [10**6 + 1, 10**9 + 21]
+    assert [int(i) for i in compile_plural(expr)(ns)] == [ref(n) for n in ns]
+
+
+@pytest.mark.parametrize("expr", ["n ==", "n ? 1", "(n > 1", "n > 1)", "n ** 2",
+                                  "__import__('os')", "n; 1", "1 2", "", "? 1 : 0"])
+def test_rejects_bad_expressions(expr):
+    with pytest.raises(ValueError):
+        compile_plural(expr)
+
+
+def test_forms_table():
+    table = forms_table("(n%10==1 && n%100!=11) ? 0 : (n%10>=2 && n%10<=4 && "
+                        "(n%100<10 || n%100>=20)) ? 1 : 2", 30)
+    assert table[0] == [1, 21]
+    assert table[1][:4] == [2, 3, 4, 22]
+    assert table[2][:3] == [0, 5, 6]
+    assert forms_table("0", 5) == {0: [0, 1, 2, 3, 4, 5]}
+
+
+def test_parse_header():
+    header = ("Content-Type: text/plain; charset=UTF-8\n"
+              "Plural-Forms: nplurals=3; plural=(n==1 ? 0 : n>=2 && n<=4 ? 1 : 2);\n")
+    assert parse_header(header) == (3, "(n==1 ? 0 : n>=2 && n<=4 ? 1 : 2)")
+    assert parse_header("Content-Type: text/plain\n") is None
+
+
+def test_distinct_forms_expected():
+    assert distinct_forms_expected("ru_RU") and distinct_forms_expected("es")
+    assert not distinct_forms_expected("tr_TR")
+    assert not distinct_forms_expected("zh")
+
+
+def _po(tmp_path, rule, forms):
+    body = "".join(f'msgstr[{i}] "{text}"\n' for i, text in enumerate(forms))
+    path = tmp_path / "x.po"
+    path.write_text('msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=UTF-8\\n"\n'
+                    f'"Plural-Forms: {rule}\\n"\n\n'
+                    f'msgid "%d day"\nmsgid_plural "%d days"\n{body}', encoding="utf-8")
+    return str(path)
+
+
+RU = ("nplurals=4; plural=(n%10==1 && n%100!=11 ? 0 : n%10>=2 && n%10<=4 && "
+      "(n%100<10 || n%100>=20) ? 1 : n%10==0 || (n%10>=5 && n%10<=9) || "
+      "(n%100>=11 && n%100<=14) ? 2 : 3);")
+
+
+def test_check_catalog_form_count(tmp_path):
+    out = check_catalog(_po(tmp_path, RU, ["%d день", "%d дня", "%d дней"]))
+    assert out["nplurals"] == 4 and out["unreachable"] == [3]
+    assert [i.kind for i in out["issues"]] == ["forms"]
+    out = check_catalog(_po(tmp_path, RU, ["%d день", "%d дня", "%d дней", "%d дня"]))
+    assert out["issues"] == []
+
+
+def test_check_catalog_duplicates(tmp_path):
+    path = _po(tmp_path, "nplurals=2; plural=(n != 1);", ["%d gün", "%d gün"])
+    assert [i.kind for i in check_catalog(path)["issues"]] == ["duplicate"]
+    assert check_catalog(path, duplicates=False)["issues"] == []
+    path = _po(tmp_path, "nplurals=1; plural=0;", ["%d 天"])
+    assert check_catalog(path)["issues"] == []
+
+
+def test_check_catalog_bad_header(tmp_path):
+    out = check_catalog(_po(tmp_path, "nplurals=2; plural=n >> 1;", ["a", "b"]))
+    assert [i.kind for i in out["issues"]] == ["header"]
+    out = check_catalog(_po(tmp_path, "nplurals=2; plural=n % 3;", ["a", "b"]))
+    assert [i.kind for i in out["issues"]] == ["header"]
@@ -0,0 +1,93 @@
+import glob
+import os
+
+import pytest
+
+from i18nlib.poreader import catalog, read_blocks, read_po, translation
+
+polib = pytest.importorskip("polib")
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+CATALOGS = sorted(glob.glob(os.path.join(REPO, "locale/*/LC_MESSAGES/FixMyStreet.po")))
+
+SAMPLE = r'''# Translator comment
+msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\n"
+"Plural-Forms: nplurals=2; plural=n != 1;\n"
+
+#: templates/web/base/a.html:1
+#, fuzzy, perl-format
+msgid "Line one\n"
+"line \"two\"\t%s"
+msgstr "Ligne un\n"
+"ligne \"deux\"\t%s"
+
+msgid "%d day"
+msgid_plural "%d days"
+msgstr[0] "%d jour"
+msgstr[1] "%d jours"
+msgid "No blank line before me"
+msgstr "Pas de ligne vide"
+
+#~ msgid "Old"
+#~ msgstr "Vieux"
+'''
+
+
+def _polib_entries(po):
+    return [(e.msgid, e.msgid_plural or None, "" if e.msgid_plural else e.msgstr,
+             {int(k): v for k, v in e.msgstr_plural.items()}, tuple(e.flags), e.obsolete)
+            for e in po]
+
+
+def _entries(path, **kw):
+    return [(e.msgid, e.msgid_plural, "" if e.msgid_plural is not None else e.msgstr,
+             e.msgstr_plural, e.flags, e.obsolete) for e in read_po(path, **kw)]
+
+
+@pytest.fixture
+def sample(tmp_path):
+    path = tmp_path / "sample.po"
+    path.write_text(SAMPLE, encoding="utf-8")
+    return str(path)
+
+
+def test_sample_matches_polib(sample):
+    assert _entries(sample) == _polib_entries(polib.pofile(sample))
+
+
+def test_sample_entries(sample):
+    entries = list(read_po(sample))
+    assert [e.msgid for e in entries] == ["Line one\nline \"two\"\t%s", "%d day",
+                                          "No blank line before me", "Old"]
+    assert entries[0].msgstr == "Ligne un\nligne \"deux\"\t%s"
+    assert entries[0].flags == ("fuzzy", "perl-format")
+    assert entries[1].msgstr_plural == {0: "%d jour", 1: "%d jours"}
+    assert translation(entries[1]) == "%d jour %d jours"
+    assert entries[3].obsolete and not entries[2].obsolete
+
+
+def test_header_and_obsolete_options(sample):
+    msgids = [e.msgid for e in read_po(sample, obsolete=False, header=True)]
+    assert msgids == ["", "Line one\nline \"two\"\t%s", "%d day", "No blank line before me"]
+    assert "Old" not in catalog(sample)
+
+
+def test_blocks_join_to_the_file(sample):
+    blocks = list(read_blocks(sample))
+    assert "".join(text for _e, text in blocks) == SAMPLE
+    assert [e.msgid if e else None for e, _text in blocks] == [
+        "", "Line one\nline \"two\"\t%s", None, "Old"]
+
+
+@pytest.mark.parametrize("path", CATALOGS, ids=lambda p: p.split(os.sep)[-3])
+def test_catalog_matches_polib(path):
+    assert _entries(path) == _polib_entries(polib.pofile(path))
+
+
+@pytest.mark.parametrize("path", CATALOGS, ids=lambda p: p.split(os.sep)[-3])
+def test_catalog_blocks_round_trip(path):
+    with open(path, encoding="utf-8") as fh:
+        text = fh.read()
+    assert "".join(text for _e, text in read_blocks(path)) == text
@@ -0,0 +1,70 @@
+import glob
+import heapq
+import os
+
+from i18nlib import similar
+from i18nlib.poreader import catalog
+from i18nlib.similar import Suggester, TrigramIndex, sim_key, trigrams
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+ES = os.path.join(REPO, "locale/es.UTF-8/LC_MESSAGES/FixMyStreet.po")
+
+STRINGS = ["Report a problem", "Report abuse", "Reported problems", "Sign in",
+           "Sign in or create an account", "Your account", "Close account"]
+
+
+def _jaccard(a, b):
+    ga, gb = trigrams(a), trigrams(b)
+    return len(ga & gb) / len(ga | gb)
+
+
+def _brute(strings, s, k, min_score):
+    scored = ((_jaccard(s, t), t) for t in strings)
+    return heapq.nlargest(k, ((score, t) for score, t in scored if score >= min_score))
+
+
+def test_key_ignores_case_punctuation_and_spaces():
+    assert sim_key("Sign  in!") == sim_key("sign in") == " sign in "
+    assert sim_key("%s reports") == " %s reports "
+
+
+def test_exact_match_first():
+    index = TrigramIndex(STRINGS)
+    assert index.query("Report a problem", k=1) == [(1.0, "Report a problem")]
+    assert index.query("sign in.", k=2)[0] == (1.0, "Sign in")
+
+
+def test_query_matches_brute_force():
+    index = TrigramIndex(STRINGS)
+    for s in ("Report problem", "Create account", "Sign", "xyz"):
+        for min_score in (0.1, 0.3, 0.5):
+            assert index.query(s, k=3, min_score=min_score) == _brute(STRINGS, s, 3, min_score)
+
+
+def test_query_matches_brute_force_on_a_catalog():
+    msgids = sorted(m for m in catalog(ES) if m)
+    index = TrigramIndex(msgids)
+    for s in msgids[::97] + ["Report a pothole", "Your reports in this area"]:
+        got = index.query(s, k=5)
+        want = _brute(msgids, s, 5, 0.3)
+        assert [round(score, 9) for score, _m in got] == [round(score, 9) for score, _m in want]
+
+
+def test_accept_filters_candidates():
+    index = TrigramIndex(STRINGS)
+    hits = index.query("Report a problem", k=3, accept=lambda i: "problem" not in STRINGS[i])
+    assert hits and all("problem" not in t for _score, t in hits)
+
+
+def test_suggester(tmp_path, monkeypatch):
+    po = tmp_path / "fr.po"
+    po.write_text('msgid "Sign in"\nmsgstr "Connexion"\n\n'
+                  'msgid "Your account"\nmsgstr ""\n\n'
+                  '#, fuzzy\nmsgid "Close account"\nmsgstr "Fermer"\n', encoding="utf-8")
+    monkeypatch.setattr(similar, "po_path", lambda loc: str(tmp_path / f"{loc}.po"))
+    sug = Suggester(["fr"])
+    assert sug.suggest("Sign in here", "fr") == [
+        {"msgid": "Sign in", "msgstr": "Connexion", "score": round(_jaccard("Sign in here", "Sign in"), 3)}]
+    # untranslated and fuzzy entries are never suggested
+    hits = sug.suggest("Sign in to close your account", "fr", min_score=0.1)
+    assert hits and {h["msgid"] for h in hits} == {"Sign in"}
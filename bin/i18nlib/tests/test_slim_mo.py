@@ -0,0 +1,49 @@
+import importlib.util
+import json
+import os
+
+import pytest
+
+from i18nlib import po_path
+from i18nlib.audit import LANGS
+from i18nlib.mofile import MOFile, compile_mo, po_messages
+
+BIN = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location("i18n_slim_mo", os.path.join(BIN, "i18n-slim-mo.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def slim_mo():
+    return _load_script()
+
+
+@pytest.fixture(scope="module")
+def keep(slim_mo):
+    with open(slim_mo.DATA_FILE, encoding="utf-8") as fh:
+        return slim_mo.reachable(json.load(fh))
+
+
+def test_cobrand_loads_the_slim_domain(slim_mo):
+    with open(slim_mo.DATA_FILE, encoding="utf-8") as fh:
+        domain = json.load(fh)["domain"]
+    with open(os.path.join(BIN, "..", "perllib/FixMyStreet/Cobrand/Infrasignal.pm"), encoding="utf-8") as fh:
+        assert f"sub language_domain {{ '{domain}' }}" in fh.read()
+
+
+@pytest.mark.parametrize("locale", sorted(LANGS.values()))
+def test_slim_catalog_keeps_every_scope_msgid(slim_mo, keep, locale):
+    messages = po_messages(po_path(locale))
+    full = MOFile(compile_mo(messages))
+    slim = MOFile(compile_mo(slim_mo.slim(messages, keep)))
+    assert slim.find(b"") == full.find(b"")  # header, Plural-Forms included
+    in_scope = [orig.split(b"\0", 1)[0] for orig, _tr in messages
+                if orig and orig.split(b"\0", 1)[0].decode("utf-8") in keep]
+    assert in_scope
+    assert [m for m in in_scope if slim.find(m) != full.find(m)] == []
+    assert len(slim_mo.slim(messages, keep)) == len(in_scope) + 1
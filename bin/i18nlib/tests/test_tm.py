@@ -0,0 +1,131 @@
+import json
+import os
+import sqlite3
+
+import pytest
+
+from i18nlib import tm
+from i18nlib.tm import TranslationMemory, build, source_files
+
+CATALOG = '''msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+msgid "Sign in"
+msgstr "Войти"
+
+msgid "Report a\\n  problem"
+msgstr "Сообщить о проблеме"
+
+#, fuzzy
+msgid "Unsure"
+msgstr "Неуверенно"
+
+msgid "OK"
+msgstr "OK"
+
+msgid "%d day"
+msgid_plural "%d days"
+msgstr[0] "%d день"
+msgstr[1] "%d дня"
+
+msgid "%d week"
+msgid_plural "%d weeks"
+msgstr[0] "%d неделя"
+msgstr[1] ""
+'''
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    """xx_XX catalog, two dictionary layers and a fill-missing table."""
+    po = tmp_path / "FixMyStreet.po"
+    po.write_text(CATALOG, encoding="utf-8")
+    dicts = tmp_path / "dicts"
+    dicts.mkdir()
+    (dicts / "a.tsv").write_text("Sign in\tВход\nBoth\tA\nNew\tA\n", encoding="utf-8")
+    (dicts / "b.json").write_text('{"Both": "B", "Other": "B", "%d hour": ["%d час", "%d часа"]}',
+                                  encoding="utf-8")
+    apply_data = tmp_path / "apply.json"
+    apply_data.write_text(json.dumps({"xx_XX": {"layers": ["a.tsv", {"file": "b.json"}]}}),
+                          encoding="utf-8")
+    fill_data = tmp_path / "fill.json"
+    fill_data.write_text(json.dumps({"New": {"xx": "Заполнено"}, "Fill only": {"xx": "Ф"},
+                                     "Other lang": {"yy": "Y"}}), encoding="utf-8")
+    monkeypatch.setattr(tm, "discover_locales", lambda: {"xx_XX": "xx_XX"})
+    monkeypatch.setattr(tm, "po_path", lambda locale: str(po))
+    monkeypatch.setattr(tm, "LANGS", {"xx": "xx_XX"})
+    monkeypatch.setattr(tm, "APPLY_DATA", str(apply_data))
+    monkeypatch.setattr(tm, "FILL_DATA", str(fill_data))
+    monkeypatch.setattr(tm, "DICT_DIR", str(dicts))
+    return tmp_path
+
+
+@pytest.fixture
+def memory(sources):
+    path = str(sources / "tm.sqlite")
+    build(path)
+    with TranslationMemory(path) as mem:
+        yield mem
+
+
+def test_lookups(memory):
+    assert memory.get("Sign in", "xx_XX") == "Войти"
+    assert memory.get("Sign in", "yy_YY") is None
+    # keyed on the normalized msgid
+    assert memory.get("Report a problem", "xx_XX") == "Сообщить о проблеме"
+    assert memory.get("%d day", "xx_XX") == ("%d день", "%d дня")
+    assert memory.get("%d hour", "xx_XX") == ("%d час", "%d часа")
+    assert memory.get_many(["Sign in", "Missing", "Other"], "xx_XX") == {
+        "Sign in": "Войти", "Other": "B"}
+
+
+def test_skipped_catalog_entries(memory):
+    # fuzzy, msgstr equal to the English, and plural entries with an empty form
+    for msgid in ("Unsure", "OK", "%d week"):
+        assert memory.get(msgid, "xx_XX") is None
+
+
+def test_source_precedence(memory):
+    [(locale, value, source)] = memory.lookup("Sign in")
+    assert (locale, value, os.path.basename(source)) == ("xx_XX", "Войти", "FixMyStreet.po")
+    assert memory.get("New", "xx_XX") == "Заполнено"  # fill-missing over dictionaries
+    assert memory.get("Fill only", "xx_XX") == "Ф"
+    assert memory.get("Both", "xx_XX") == "A"  # first layer wins
+    assert memory.get("Other lang", "xx_XX") is None
+
+
+def test_stats(memory):
+    st = memory.stats()
+    assert st["rows"] == st["keys"] == st["locales"]["xx_XX"] == 8
+    by_file = {os.path.basename(src): n for src, n in st["sources"].items()}
+    assert by_file == {"FixMyStreet.po": 3, "a.tsv": 1, "b.json": 2, "fill.json": 2}
+
+
+def test_open_rebuilds_only_when_a_source_changes(sources):
+    path = str(sources / "tm.sqlite")
+    TranslationMemory.open(path).close()
+    built = os.stat(path).st_mtime_ns
+    TranslationMemory.open(path).close()
+    assert os.stat(path).st_mtime_ns == built
+    assert len(source_files()) == 5
+
+    fill = sources / "fill.json"
+    fill.write_text(json.dumps({"Later": {"xx": "Позже"}}), encoding="utf-8")
+    os.utime(fill, ns=(0, os.stat(fill).st_mtime_ns + 10**9))
+    with TranslationMemory.open(path) as mem:
+        assert mem.get("Later", "xx_XX") == "Позже"
+        assert mem.get("Fill only", "xx_XX") is None
+
+
+def test_other_version_is_rebuilt(sources):
+    path = str(sources / "tm.sqlite")
+    build(path)
+    db = sqlite3.connect(path)
+    db.execute("UPDATE meta SET value = '0' WHERE name = 'version'")
+    db.commit()
+    db.close()
+    with pytest.raises(ValueError, match="not a v1 translation memory"):
+        TranslationMemory(path)
+    with TranslationMemory.open(path) as mem:
+        assert mem.get("Sign in", "xx_XX") == "Войти"
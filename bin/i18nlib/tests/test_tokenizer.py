@@ -0,0 +1,44 @@
+from i18nlib.tokenizer import scan_perl, scan_template
+
+
+def _tt(text):
+    return [(m.msgid, m.msgid_plural, m.line) for m in scan_template(text)]
+
+
+def _pl(text):
+    return [(m.msgid, m.msgid_plural, m.line) for m in scan_perl(text)]
+
+
+def test_simple_directive_and_escapes():
+    text = "<h1>[% loc('Sign in') %]</h1>\n[%- loc(\"Say \\\"hi\\\"\") -%]\n[% loc('It\\'s') %]"
+    assert _tt(text) == [("Sign in", None, 1), ('Say "hi"', None, 2), ("It's", None, 3)]
+
+
+def test_walked_directive():
+    text = ("[% INCLUDE navitem uri='/my' label=loc('Your account') %]\n"
+            "[%\n  title = loc('Help' _ \" me\");\n"
+            "  # loc('commented')\n"
+            "  tprintf(nget('%d day', '%d days', n), n);\n%]")
+    assert _tt(text) == [("Your account", None, 1), ("Help me", None, 3),
+                         ("%d day", "%d days", 5)]
+
+
+def test_calls_outside_directives_and_comments_are_skipped():
+    text = ("<p>loc('plain text')</p>\n[%# loc('whole comment') %]\n"
+            "[% c.loc('method') %][% x = loc(var) %][% loc('After') %]")
+    assert _tt(text) == [("After", None, 3)]
+
+
+def test_unterminated_quote_does_not_stop_the_scan():
+    text = "[% x = \"broken; loc('Same directive') %]\n[% loc('Still found') %]"
+    assert _tt(text) == [("Same directive", None, 1), ("Still found", None, 2)]
+
+
+def test_perl_calls():
+    text = ("my $a = _('Report');\n"
+            "# _('comment')\n"
+            "$self->_('method');\n"
+            "my $b = mySociety::Locale::nget('%d update', '%d updates', $n);\n"
+            "my $c = _('Hello' . \" world\\n\");\n")
+    assert _pl(text) == [("Report", None, 1), ("%d update", "%d updates", 4),
+                         ("Hello world\n", None, 5)]
@@ -0,0 +1,37 @@
+from i18nlib import watch
+from i18nlib.watch import Watcher
+
+
+def _watcher(monkeypatch, scope):
+    monkeypatch.setattr(watch, "source_files", lambda _scope: list(scope))
+    w = Watcher.__new__(Watcher)
+    w.langs, w.scope = {}, "infrasignal"
+    w.files, w.users, w.catalogs, w.issues = {}, {}, {}, {}
+    return w
+
+
+def test_file_that_left_the_scope_is_dropped(tmp_path, monkeypatch):
+    page = tmp_path / "page.html"
+    page.write_text("[% loc('Sign in') %]", encoding="utf-8")
+    scope = {str(page)}
+    w = _watcher(monkeypatch, scope)
+
+    touched, _ = w.poll()
+    assert len(touched) == 1 and set(w.users) == {"Sign in"}
+    assert w.poll()[0] == []
+
+    scope.clear()  # still on disk, no longer in the scope
+    touched, _ = w.poll()
+    assert len(touched) == 1
+    assert w.files == {} and w.users == {}
+    assert w.poll()[0] == []
+
+
+def test_deleted_file_is_dropped(tmp_path, monkeypatch):
+    page = tmp_path / "page.html"
+    page.write_text("[% loc('Sign in') %]", encoding="utf-8")
+    w = _watcher(monkeypatch, {str(page)})
+    w.poll()
+    page.unlink()
+    assert len(w.poll()[0]) == 1
+    assert w.files == {} and w.users == {}
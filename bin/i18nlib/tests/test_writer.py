@@ -0,0 +1,55 @@
+import hashlib
+import os
+
+import pytest
+
+from i18nlib import writer
+from i18nlib.writer import file_digest, write_if_changed
+
+
+def test_new_file(tmp_path):
+    path = tmp_path / "FixMyStreet.mo"
+    assert file_digest(str(path)) is None
+    assert write_if_changed(str(path), b"data") is True
+    assert path.read_bytes() == b"data"
+    assert path.stat().st_mode & 0o777 == 0o644
+    assert file_digest(str(path)) == hashlib.blake2b(b"data").digest()
+
+
+def test_unchanged_content_is_not_written(tmp_path):
+    path = tmp_path / "FixMyStreet.po"
+    path.write_bytes(b"same")
+    os.utime(path, ns=(0, 1_000_000_000))
+    inode = path.stat().st_ino
+    assert write_if_changed(str(path), b"same") is False
+    st = path.stat()
+    assert (st.st_mtime_ns, st.st_ino) == (1_000_000_000, inode)
+
+
+def test_changed_content_replaces_the_file(tmp_path):
+    path = tmp_path / "FixMyStreet.po"
+    path.write_bytes(b"old")
+    path.chmod(0o600)
+    reader = open(path, "rb")  # a reader holding the old file keeps it whole
+    try:
+        # same size, different bytes: the digest decides
+        assert write_if_changed(str(path), b"new") is True
+        assert reader.read() == b"old"
+    finally:
+        reader.close()
+    assert path.read_bytes() == b"new"
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert os.listdir(tmp_path) == ["FixMyStreet.po"]
+
+
+def test_failed_write_leaves_the_file_and_no_temp(tmp_path, monkeypatch):
+    path = tmp_path / "FixMyStreet.po"
+    path.write_bytes(b"old")
+
+    def fail(src, dst):
+        raise OSError("disk full")
+    monkeypatch.setattr(writer.os, "replace", fail)
+    with pytest.raises(OSError, match="disk full"):
+        write_if_changed(str(path), b"new content")
+    assert path.read_bytes() == b"old"
+    assert os.listdir(tmp_path) == ["FixMyStreet.po"]
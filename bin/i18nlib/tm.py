@@ -0,0 +1,210 @@
+"""Translation memory: every known translation in one SQLite file.
+
+    tm(key, locale, msgid, msgstr, plural, source, priority)
+        PRIMARY KEY (key, locale), WITHOUT ROWID
+
+key is the whitespace-normalized msgid, so a string reflowed in a template
+still finds its translation. msgstr holds the plural forms joined by NUL
+when plural is 1. Lookups go straight to the primary key b-tree.
+
+The sources are every locale's catalog (translated, non-fuzzy entries whose
+msgstr is not just the English text), the i18n-apply-translations
+dictionaries and i18n-fill-missing.data.json. When two sources translate the
+same key for a locale, the catalog wins over the dictionaries, then the
+dictionary earlier in precedence wins. The memory is rebuilt whenever any
+source's mtime or size changed, into a temp file that is then renamed over
+the old one, like the catalog indexes.
+"""
+import json
+import os
+import sqlite3
+
+from . import CACHE_DIR, discover_locales, normalize, po_path, rel
+from .apply import load_layers
+from .audit import LANGS
+from .poreader import read_po
+
+BIN = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APPLY_DATA = os.path.join(BIN, "i18n-apply-translations.data.json")
+DICT_DIR = os.path.join(BIN, "i18n-dictionaries")
+FILL_DATA = os.path.join(BIN, "i18n-fill-missing.data.json")
+PATH = os.environ.get("I18N_TM", os.path.join(CACHE_DIR, "tm.sqlite"))
+VERSION = 1
+
+PRIORITY_CATALOG = 3
+PRIORITY_FILL = 2
+PRIORITY_DICT = 1
+
+_SCHEMA = """
+CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE tm (
+    key TEXT NOT NULL,
+    locale TEXT NOT NULL,
+    msgid TEXT NOT NULL,
+    msgstr TEXT NOT NULL,
+    plural INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    PRIMARY KEY (key, locale)
+) WITHOUT ROWID;
+"""
+
+
+def _label(path):
+    """Path relative to the checkout (bin/ may be reached through the ROOT symlink)."""
+    return os.path.relpath(path, os.path.dirname(BIN)) if path.startswith(BIN) else rel(path)
+
+
+def source_files():
+    """Every file the memory is built from."""
+    files = [po_path(loc) for loc in discover_locales()]
+    files += [APPLY_DATA, FILL_DATA]
+    with open(APPLY_DATA, encoding="utf-8") as fh:
+        for spec in json.load(fh).values():
+            for layer in spec["layers"]:
+                files.append(os.path.join(DICT_DIR, layer if isinstance(layer, str) else layer["file"]))
+    return files
+
+
+def signature(files):
+    sig = {}
+    for path in files:
+        try:
+            st = os.stat(path)
+            sig[_label(path)] = [st.st_mtime_ns, st.st_size]
+        except FileNotFoundError:
+            sig[_label(path)] = None
+    return json.dumps(sig, sort_keys=True)
+
+
+def _rows():
+    """(key, locale, msgid, msgstr, plural, source, priority) from every source."""
+    for locale in discover_locales():
+        po = po_path(locale)
+        source = rel(po)
+        for e in read_po(po, obsolete=False):
+            if "fuzzy" in e.flags:
+                continue
+            if e.msgid_plural is not None:
+                forms = [v for _k, v in sorted(e.msgstr_plural.items())]
+                if not all(forms):
+                    continue
+                yield normalize(e.msgid), locale, e.msgid, "\0".join(forms), 1, source, PRIORITY_CATALOG
+            elif e.msgstr.strip() and e.msgstr.strip() != e.msgid.strip():
+                yield normalize(e.msgid), locale, e.msgid, e.msgstr, 0, source, PRIORITY_CATALOG
+
+    with open(APPLY_DATA, encoding="utf-8") as fh:
+        manifest = json.load(fh)
+    for locale, spec in manifest.items():
+        # last row wins on equal priority, and the first layer must win
+        for layer in reversed(load_layers(DICT_DIR, spec["layers"])):
+            for msgid, value in layer.table.items():
+                plural = not isinstance(value, str)
+                yield (normalize(msgid), locale, msgid, "\0".join(value) if plural else value,
+                       int(plural), _label(layer.path), PRIORITY_DICT)
+
+    with open(FILL_DATA, encoding="utf-8") as fh:
+        table = json.load(fh)
+    for lang, locale in LANGS.items():
+        for msgid, tr in table.items():
+            if tr.get(lang):
+                yield normalize(msgid), locale, msgid, tr[lang], 0, _label(FILL_DATA), PRIORITY_FILL
+
+
+def build(path=PATH, files=None):
+    """Rebuild the memory from all sources; returns the number of rows."""
+    files = files or source_files()
+    sig = signature(files)
+    best = {}
+    for row in _rows():
+        k = row[:2]
+        if k not in best or row[6] >= best[k][6]:
+            best[k] = row
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    if os.path.exists(tmp):
+        os.unlink(tmp)
+    db = sqlite3.connect(tmp)
+    try:
+        db.executescript("PRAGMA journal_mode=OFF; PRAGMA synchronous=OFF;" + _SCHEMA)
+        db.executemany("INSERT INTO meta VALUES (?, ?)",
+                       [("version", str(VERSION)), ("signature", sig)])
+        db.executemany("INSERT INTO tm VALUES (?, ?, ?, ?, ?, ?, ?)", sorted(best.values()))
+        db.commit()
+    finally:
+        db.close()
+    os.replace(tmp, path)
+    return len(best)
+
+
+class TranslationMemory:
+    """Read-only view of the memory; see open()."""
+
+    def __init__(self, path=PATH):
+        self.path = path
+        self.db = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        meta = dict(self.db.execute("SELECT name, value FROM meta"))
+        if meta.get("version") != str(VERSION):
+            self.db.close()
+            raise ValueError(f"{path}: not a v{VERSION} translation memory")
+        self.signature = meta.get("signature")
+
+    @classmethod
+    def open(cls, path=PATH, rebuild=True):
+        """The memory at path, rebuilt first if it is missing or a source changed."""
+        if rebuild:
+            files = source_files()
+            try:
+                tm = cls(path)
+                if tm.signature == signature(files):
+                    return tm
+                tm.close()
+            except (sqlite3.Error, ValueError):
+                pass
+            build(path, files)
+        return cls(path)
+
+    @staticmethod
+    def _value(msgstr, plural):
+        return tuple(msgstr.split("\0")) if plural else msgstr
+
+    def get(self, msgid, locale):
+        """Translation of msgid (str, or tuple of plural forms) in locale, or None."""
+        row = self.db.execute("SELECT msgstr, plural FROM tm WHERE key = ? AND locale = ?",
+                              (normalize(msgid), locale)).fetchone()
+        return None if row is None else self._value(*row)
+
+    def get_many(self, msgids, locale):
+        """{msgid: translation} for the msgids locale has a translation for."""
+        out = {}
+        for msgid in msgids:
+            value = self.get(msgid, locale)
+            if value is not None:
+                out[msgid] = value
+        return out
+
+    def lookup(self, msgid):
+        """[(locale, translation, source)] across every locale."""
+        return [(locale, self._value(msgstr, plural), source)
+                for locale, msgstr, plural, source in self.db.execute(
+                    "SELECT locale, msgstr, plural, source FROM tm WHERE key = ? ORDER BY locale",
+                    (normalize(msgid),))]
+
+    def stats(self):
+        """{"rows", "keys", "locales": {locale: rows}, "sources": {source: rows}}."""
+        q = self.db.execute
+        return {"rows": q("SELECT count(*) FROM tm").fetchone()[0],
+                "keys": q("SELECT count(DISTINCT key) FROM tm").fetchone()[0],
+                "locales": dict(q("SELECT locale, count(*) FROM tm GROUP BY locale")),
+                "sources": dict(q("SELECT source, count(*) FROM tm GROUP BY source "
+                                  "ORDER BY count(*) DESC"))}
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
@@ -0,0 +1,232 @@
+"""Single-pass msgid scanner for Template Toolkit templates and Perl modules.
+
+Replaces the old `loc\\(\\s*(['"])(.*?)(?<!\\\\)\\1` style regexes. Most of the
+input holds no call at all, so the scan jumps from one call site to the next
+with literal-prefix regexes (`loc\\s*\\(`, `nget\\s*\\(`, `_\\s*\\(`), which re
+runs at C speed; the word-boundary checks a lookbehind would make re try at
+every position are done in Python on the hits only. Template Toolkit
+directives without a call are never parsed: for a call site the scanner
+goes back to the `[%` that opens its directive and walks just that
+directive, where a single alternation regex jumps between quotes, comments,
+the closing `%]` and further call sites; the common `[% loc('...') %]`
+directive is matched whole by one regex and not walked at all. String literals are matched with
+unrolled (non-backtracking) patterns, and a quote found to be unterminated
+is never re-matched, so a stray quote cannot make the scan go quadratic.
+A `[%` or `%]` inside a string literal of an earlier directive is not seen,
+as the directives before a call site are skipped unread.
+
+Understood call forms:
+
+    loc('a')  loc("a")  loc('a' _ "b")          -> msgid
+    nget('a', 'as', n)  tprintf(nget(...), n)   -> msgid + msgid_plural
+    _('a')  _("a" . 'b')  nget('a', 'as', $n)   (Perl)
+
+Arguments that are not (concatenations of) literals are not static msgids and
+are skipped.
+"""
+import re
+from collections import namedtuple
+
+Message = namedtuple("Message", "msgid msgid_plural file line")
+
+_SQ = r"'[^'\\]*(?:\\.[^'\\]*)*'"
+_DQ = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_STRING_RE = re.compile(rf"\s*({_SQ}|{_DQ})", re.S)
+_WS_RE = re.compile(r"\s*")
+
+# Call sites, one regex per name so each keeps its literal prefix.
+_TT_CALL_RES = (re.compile(r"(loc)\s*\("), re.compile(r"(nget)\s*\("))
+_PERL_CALL_RES = (re.compile(r"(_)\s*\("), re.compile(r"(nget)\s*\("))
+# Inside a TT directive: the next quote, comment, directive end or call site.
+_TT_EVENT_RE = re.compile(r"""['"#]|%\]|(?<![\w$.])(loc|nget)\s*\(""")
+# A directive that is nothing but loc() of a single literal.
+_TT_SIMPLE_RE = re.compile(rf"\[%[-+=~]?\s*loc\s*\(\s*({_SQ}|{_DQ})\s*\)\s*[-+=~]?%\]")
+
+_TT_SQ_ESC = {"'": "'", "\\": "\\"}
+_TT_DQ_ESC = {'"': '"', "\\": "\\", "n": "\n", "t": "\t", "$": "$"}
+_PERL_DQ_ESC = {'"': '"', "\\": "\\", "n": "\n", "t": "\t", "$": "$", "@": "@"}
+_ESC_RE = re.compile(r"\\(.)", re.S)
+
+
+def _unquote(lit, dq_escapes):
+    body = lit[1:-1]
+    if "\\" not in body:
+        return body
+    table = dq_escapes if lit[0] == '"' else _TT_SQ_ESC
+    return _ESC_RE.sub(lambda m: table.get(m.group(1), m.group(0)), body)
+
+
+class _Scanner:
+    """Literal/call parsing shared by the TT and Perl scanners.
+
+    `dead` holds quote characters known to have no closing partner anywhere
+    after the current position; once a literal fails to terminate, every later
+    literal of that kind would fail the same way, so it is not re-matched.
+    """
+    def __init__(self, text, op, dq_escapes):
+        self.text = text
+        self.op = op
+        self.dq_escapes = dq_escapes
+        self.dead = set()
+        self.lines = _Lines(text)
+
+    def literal(self, pos):
+        """(value, end) for a literal at pos (after whitespace), or (None, pos)."""
+        text = self.text
+        p = _WS_RE.match(text, pos).end()
+        q = text[p:p + 1]
+        if q not in ("'", '"') or q in self.dead:
+            return None, pos
+        m = _STRING_RE.match(text, p)
+        if not m:
+            self.dead.add(q)
+            return None, pos
+        return _unquote(m.group(1), self.dq_escapes), m.end()
+
+    def concat(self, pos):
+        """Parse `lit (op lit)*` at pos. Returns (value or None, end_pos)."""
+        value, pos = self.literal(pos)
+        if value is None:
+            return None, pos
+        parts = [value]
+        text, op = self.text, self.op
+        while True:
+            p = _WS_RE.match(text, pos).end()
+            if not text.startswith(op, p):
+                return "".join(parts), pos
+            value, end = self.literal(p + len(op))
+            if value is None:
+                return None, p  # concatenated with a variable: not a static msgid
+            parts.append(value)
+            pos = end
+
+    def call(self, pos, name):
+        """Parse the literal arguments of loc/_/nget. Returns (msgid, plural, end)."""
+        msgid, pos = self.concat(pos)
+        if msgid is None or name != "nget":
+            return msgid, None, pos
+        p = _WS_RE.match(self.text, pos).end()
+        if not self.text.startswith(",", p):
+            return None, None, pos
+        plural, pos = self.concat(p + 1)
+        if plural is None:
+            return None, None, pos
+        return msgid, plural, pos
+
+
+class _Lines:
+    """Monotonic offset -> line number, counting each newline once."""
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+        self.line = 1
+
+    def at(self, pos):
+        self.line += self.text.count("\n", self.pos, pos)
+        self.pos = pos
+        return self.line
+
+
+def _call_sites(text, regexes):
+    """Matches of every regex in text, in order of position."""
+    sites = [m for rx in regexes for m in rx.finditer(text)]
+    sites.sort(key=lambda m: m.start())
+    return sites
+
+
+def _tt_call(text, pos):
+    # what (?<![\w$.]) would check: not a method or part of a longer name
+    if pos == 0:
+        return True
+    prev = text[pos - 1]
+    return not (prev.isalnum() or prev in "_$.")
+
+
+def _perl_call(text, pos):
+    # method calls and other packages' subs are skipped, but
+    # mySociety::Locale::nget() is gettext
+    if pos == 0:
+        return True
+    prev = text[pos - 1]
+    return (not (prev.isalnum() or prev in "_$@%&>:")
+            or text.endswith("mySociety::Locale::", 0, pos))
+
+
+def _directive(sc, start, file):
+    """Yield the calls in the directive opening at start; returns its end."""
+    text = sc.text
+    find, search, n = text.find, _TT_EVENT_RE.search, len(text)
+    pos = start + 2
+    end = find("%]", pos)
+    if end < 0:
+        return n  # never closed: nothing after it is a directive
+    if text.startswith("#", pos) or text.startswith("-#", pos):
+        # [%# ... %] comments out the whole directive
+        return end + 2
+    while True:
+        m = search(text, pos)
+        if m is None:
+            return n
+        c = text[m.start()]
+        if c == "%":
+            return m.end()
+        if c == "'" or c == '"':
+            # an unterminated literal is stepped over; TT would choke too
+            _value, end = sc.literal(m.start())
+            pos = max(end, m.start() + 1)
+        elif c == "#":
+            # line comment, ends at newline or at the directive close
+            nl = find("\n", m.end())
+            close = find("%]", m.end())
+            if close >= 0 and (nl < 0 or close < nl):
+                pos = close
+            else:
+                pos = n if nl < 0 else nl
+        else:
+            msgid, plural, pos = sc.call(m.end(), m.group(1))
+            if msgid is not None:
+                yield Message(msgid, plural, file, sc.lines.at(m.start()))
+            pos = max(pos, m.end())
+
+
+def scan_template(text, file=None):
+    """Yield Message records for loc()/nget() calls inside [% %] directives."""
+    sc = _Scanner(text, "_", _TT_DQ_ESC)
+    pos = 0  # always outside any directive
+    for m in _call_sites(text, _TT_CALL_RES):
+        site = m.start()
+        if site < pos or not _tt_call(text, site):
+            continue
+        start = text.rfind("[%", pos, site)
+        if start < 0:
+            continue  # in plain text
+        simple = _TT_SIMPLE_RE.match(text, start)
+        if simple:
+            msgid = _unquote(simple.group(1), _TT_DQ_ESC)
+            yield Message(msgid, None, file, sc.lines.at(site))
+            pos = simple.end()
+            continue
+        pos = yield from _directive(sc, start, file)
+
+
+def scan_perl(text, file=None):
+    """Yield Message records for _()/nget() calls in Perl source."""
+    sc = _Scanner(text, ".", _PERL_DQ_ESC)
+    pos = 0
+    for m in _call_sites(text, _PERL_CALL_RES):
+        start = m.start()
+        if start < pos or not _perl_call(text, start):
+            continue  # inside a call we already parsed, or not gettext
+        bol = text.rfind("\n", 0, start) + 1
+        if text[bol:start].lstrip().startswith("#"):
+            continue
+        msgid, plural, pos = sc.call(m.end(), m.group(1))
+        if msgid is not None:
+            yield Message(msgid, plural, file, sc.lines.at(start))
+
+
+def scan_file(path, file=None):
+    with open(path, encoding="utf-8", errors="ignore") as fh:
+        text = fh.read()
+    scan = scan_perl if path.endswith((".pm", ".pl")) else scan_template
+    return list(scan(text, file or path))
@@ -0,0 +1,137 @@
+"""Incremental re-audit for i18n-audit.py --watch.
+
+Keeps, per source file, its stat key and msgid set, plus which files use
+each msgid and the MISSING/EMPTY/FUZZY category of every used msgid per
+language. Each poll() re-stats the sources and catalogs. A changed template
+is re-scanned on its own, and only the msgids that entered or left use are
+re-checked. A changed catalog re-checks the used msgids against that
+language only. poll() returns what changed as (sign, category, msgid, langs,
+file) rows.
+
+There is no stdlib inotify binding, so this polls. A tick over the
+InfraSignal sources is about a hundred stats (well under a millisecond).
+"""
+import os
+
+from . import po_path, rel
+from .audit import HARD, classify
+from .catindex import CatalogIndex
+from .extract import ExtractCache, collect, source_files
+from .tokenizer import scan_file
+
+
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class Watcher:
+    def __init__(self, langs, scope="infrasignal"):
+        self.langs = langs
+        self.scope = scope
+        self.files = {}  # path -> (stat key, set(msgids))
+        self.users = {}  # msgid -> set(rel paths)
+        self.catalogs = {}  # lang -> (stat key, CatalogIndex)
+        self.issues = {}  # msgid -> {lang: category}
+
+        found = {}
+        for m in collect(ExtractCache(scope=scope), scope=scope):
+            if m.msgid.strip():
+                found.setdefault(m.file, set()).add(m.msgid)
+        for path in source_files(scope):
+            mids = found.get(rel(path), set())
+            self.files[path] = (_stat_key(path), mids)
+            for mid in mids:
+                self.users.setdefault(mid, set()).add(rel(path))
+        for lang, locale in langs.items():
+            po = po_path(locale)
+            self.catalogs[lang] = (_stat_key(po), CatalogIndex.open(po))
+        self._recheck(self.users, self.langs)
+
+    def _recheck(self, mids, langs):
+        """Recompute issues for mids in langs; returns the delta rows."""
+        delta = []
+        for mid in mids:
+            before = self.issues.get(mid, {})
+            after = {lang: cat for lang, cat in before.items() if lang not in langs}
+            if mid in self.users:
+                for lang in langs:
+                    cat = classify(self.catalogs[lang][1].lookup(mid))
+                    if cat in HARD:
+                        after[lang] = cat
+            if after:
+                self.issues[mid] = after
+            else:
+                self.issues.pop(mid, None)
+            if after == before:
+                continue
+            where = min(self.users.get(mid, ()), default="(no longer used)")
+            for sign, a, b in (("+", after, before), ("-", before, after)):
+                by_cat = {}
+                for lang, cat in a.items():
+                    if b.get(lang) != cat:
+                        by_cat.setdefault(cat, []).append(lang)
+                for cat in HARD:
+                    if cat in by_cat:
+                        delta.append((sign, cat, mid, by_cat[cat], where))
+        return delta
+
+    def _rescan(self, path, in_scope=True):
+        """Re-extract one file; returns the msgids that entered or left use.
+
+        A file that was deleted or has left the scope is dropped from
+        self.files, so its msgids leave use and it is not polled again.
+        """
+        relpath = rel(path)
+        sk = _stat_key(path)
+        old = self.files.get(path, (None, set()))[1]
+        new = set()
+        if sk is not None and in_scope:
+            new = {m.msgid for m in scan_file(path, relpath) if m.msgid.strip()}
+            self.files[path] = (sk, new)
+        else:
+            self.files.pop(path, None)
+        changed = []
+        for mid in old - new:
+            users = self.users[mid]
+            users.discard(relpath)
+            if not users:
+                del self.users[mid]
+                changed.append(mid)
+        for mid in new - old:
+            users = self.users.setdefault(mid, set())
+            if not users:
+                changed.append(mid)
+            users.add(relpath)
+        return changed
+
+    def poll(self):
+        """(touched rel paths, delta rows) since the previous poll."""
+        touched, mids = [], []
+        paths = set(source_files(self.scope))
+        for path in sorted(paths | set(self.files)):
+            known = self.files.get(path)
+            if path not in paths or known is None or known[0] != _stat_key(path):
+                touched.append(rel(path))
+                mids.extend(self._rescan(path, path in paths))
+        delta = self._recheck(mids, self.langs)
+        for lang, locale in self.langs.items():
+            po = po_path(locale)
+            sk = _stat_key(po)
+            if sk is not None and sk != self.catalogs[lang][0]:
+                touched.append(rel(po))
+                self.catalogs[lang][1].close()
+                self.catalogs[lang] = (sk, CatalogIndex.open(po))
+                delta.extend(self._recheck(list(self.users), {lang: locale}))
+        return touched, delta
+
+    def counts(self):
+        """{lang: {category: n}} over the msgids currently in use."""
+        out = {lang: dict.fromkeys(HARD, 0) for lang in self.langs}
+        for cats in self.issues.values():
+            for lang, cat in cats.items():
+                out[lang][cat] += 1
+        return out
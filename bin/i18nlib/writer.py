@@ -0,0 +1,50 @@
+"""Atomic, change-detecting file writes for the i18n tools.
+
+write_if_changed() hashes the new content and the file on disk. When they
+differ, it writes a temp file in the same directory and renames it over the
+target, so readers (Catalyst, msgfmt users, the catalog index) see either the
+old file or the new one, never a partial write. When they match it does not
+touch the file, so its mtime and every cache keyed on it stay valid.
+"""
+import hashlib
+import os
+import tempfile
+
+
+def file_digest(path):
+    """blake2b of a file's content, or None if it does not exist."""
+    h = hashlib.blake2b()
+    try:
+        with open(path, "rb") as fh:
+            for block in iter(lambda: fh.read(1 << 16), b""):
+                h.update(block)
+    except FileNotFoundError:
+        return None
+    return h.digest()
+
+
+def write_if_changed(path, data):
+    """Atomically replace path with data (bytes) unless identical; True if written."""
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = None
+    if size == len(data) and file_digest(path) == hashlib.blake2b(data).digest():
+        return False
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".",
+                               prefix="." + os.path.basename(path) + ".")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return True
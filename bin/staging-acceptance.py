@@ -6,7 +6,28 @@ Deterministic pre-production gate.  Runs all test suites (A–I) against
 the staging environment and writes a PASS/FAIL report.
 
 Usage:
-    python3 bin/staging-acceptance.py [--base URL] [--suite A,B,...] [--report FILE]
+    python3 bin/staging-acceptance.py [--base URL] [--suite A,B,...] [--report FILE] [--jobs N]
+
+Suites run concurrently, each on its own cookie jar, as soon as the suites
+they need (ALL_SUITES) have finished: F and G start from a copy of E's
+logged-in session. Output and report rows stay in suite order.
+
+Every request's connect time, time to first byte, total time and size are
+recorded; the report gives p50/p95/max per suite and per path, and "suite"
+L fails each path of latency_budgets_ms whose p95 is over budget.
+
+Load mode:
+    python3 bin/staging-acceptance.py --load USERS [--duration S] [--think S]
+    python3 bin/staging-acceptance.py --self-test
+
+--load runs no suites: USERS asyncio virtual users, each on its own
+keep-alive connection, fetch public_pages and load_pages in turn, pausing
+about --think seconds between requests, for --duration seconds.
+load_pages are formatted with test_coords and {report_id}: load_report_id
+from the data file, else the first report linked from /around, /reports
+or /. The report gives throughput, error rate and
+p50/p95/p99 per endpoint. --self-test runs a short load against a stand-in
+server started in-process and checks the harness's own numbers.
 
 Environment:
     STAGING_BASE_URL   (default http://REDACTED-IP:8080)
@@ -17,19 +38,28 @@ Exit codes:  0 = all PASS   1 = at least one FAIL   2 = harness error
 """
 
 import argparse
+import asyncio
+import concurrent.futures
+import copy
 import html
+import http.client
 import http.cookiejar
+import http.server
 import io
 import json
+import math
 import os
+import random
 import re
+import ssl
 import subprocess
 import sys
 import textwrap
+import threading
 import time
-import urllib.error
 import urllib.parse
 import urllib.request
+from collections import Counter, namedtuple
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_FILE = os.path.join(SCRIPT_DIR, "staging-acceptance.data.json")
@@ -37,9 +67,25 @@ FIXTURE_JPG = os.path.join(SCRIPT_DIR, "fixtures", "test-report.jpg")
 
 # ── Helpers ──────────────────────────────────────────────────────────
 
+# One request as HTTPClient saw it, times in ms: connect (TCP, plus TLS on
+# https) is 0 on a reused keep-alive connection; ttfb runs to the response
+# headers, total to the last body byte. status 0 is a request that failed.
+Timing = namedtuple("Timing", "suite method path status connect ttfb total bytes")
+
+# the (suite key, Results) the current thread's requests are timed into
+_sink = threading.local()
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
 class Results:
     def __init__(self):
         self.rows = []
+        self.timings = []
 
     def record(self, suite, name, passed, detail=""):
         status = "PASS" if passed else "FAIL"
@@ -53,6 +99,47 @@ class Results:
         self.rows.append((suite, name, "SKIP", reason))
         print(f"  [SKIP] {suite}: {name}  -- {reason}")
 
+    def check_budgets(self, budgets):
+        """FAIL each path (query ignored) whose p95 total time is over budget."""
+        for path, budget in budgets.items():
+            times = [t.total for t in self.timings if t.path == path]
+            if not times:
+                continue
+            p95 = percentile(times, 95)
+            self.record("L", f"{path} p95 < {budget} ms", p95 < budget,
+                        f"p95={p95:.0f} ms, max={max(times):.0f} ms over {len(times)} requests")
+
+    def latency(self):
+        """Report lines: p50/p95/max total time per suite and per path."""
+        if not self.timings:
+            return []
+        lines = ["\n── Latency (ms; connect = new connections only) ──",
+                 f"  {'suite':<6} {'reqs':>5} {'p50':>7} {'p95':>7} {'max':>7} {'connect':>8}"]
+        groups = {}
+        for t in self.timings:
+            groups.setdefault(t.suite, []).append(t)
+        for suite, ts in groups.items():
+            totals = [t.total for t in ts]
+            lines.append(f"  {suite:<6} {len(ts):5d} {percentile(totals, 50):7.0f} "
+                         f"{percentile(totals, 95):7.0f} {max(totals):7.0f} "
+                         f"{sum(t.connect for t in ts):8.0f}")
+        groups = {}
+        for t in self.timings:
+            groups.setdefault(t.path, []).append(t)
+        rows = []
+        for path, ts in groups.items():
+            totals = [t.total for t in ts]
+            rows.append((percentile(totals, 95), path, ts, totals))
+        w = min(48, max(len(path) for path in groups))
+        lines.append(f"\n  {'path':<{w}} {'reqs':>5} {'p50':>7} {'p95':>7} {'max':>7} "
+                     f"{'ttfb50':>7} {'KB':>7}")
+        for p95, path, ts, totals in sorted(rows, key=lambda r: (-r[0], r[1])):
+            lines.append(f"  {path[:w]:<{w}} {len(ts):5d} {percentile(totals, 50):7.0f} "
+                         f"{p95:7.0f} {max(totals):7.0f} "
+                         f"{percentile([t.ttfb for t in ts], 50):7.0f} "
+                         f"{sum(t.bytes for t in ts) / 1024:7.0f}")
+        return lines
+
     @property
     def total(self):
         return len(self.rows)
@@ -83,6 +170,7 @@ class Results:
             if detail and status != "PASS":
                 line += f"  -- {detail}"
             lines.append(line)
+        lines.extend(self.latency())
         lines.append("")
         lines.append("-" * 60)
         lines.append(f"TOTAL: {self.total}  PASS: {self.passed}  FAIL: {self.failed}  SKIP: {self.skipped}")
@@ -92,96 +180,186 @@ class Results:
         return "\n".join(lines)
 
 
-class _RewriteRedirectHandler(urllib.request.HTTPRedirectHandler):
-    """Rewrites redirects that go to the configured BASE_URL back to our staging IP."""
-    def __init__(self, base_url):
-        self._base = base_url.rstrip("/")
-        parsed = urllib.parse.urlparse(self._base)
-        self._scheme = parsed.scheme
-        self._netloc = parsed.netloc
+class ConnectionPool:
+    """Persistent http.client connections, kept open per (scheme, host, port).
 
-    def redirect_request(self, req, fp, code, msg, headers, newurl):
-        parsed = urllib.parse.urlparse(newurl)
-        # Rewrite any redirect that goes to a different host back to our staging base
-        if parsed.netloc and parsed.netloc != self._netloc:
-            newurl = urllib.parse.urlunparse((
-                self._scheme, self._netloc,
-                parsed.path, parsed.params, parsed.query, parsed.fragment
-            ))
-        return super().redirect_request(req, fp, code, msg, headers, newurl)
+    A connection is taken out of the pool for one request/response and put
+    back afterwards unless the server asked to close it, so concurrent suites
+    never share one. Shared by every HTTPClient of the run.
+    """
+    MAX_IDLE = 8
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.idle = {}
+        self.opened = 0
+        self.reused = 0
+
+    def get(self, scheme, netloc, timeout, fresh=False):
+        """(connection, reused) for scheme://netloc; fresh=True never reuses."""
+        with self.lock:
+            conns = None if fresh else self.idle.get((scheme, netloc))
+            if conns:
+                conn = conns.pop()
+                self.reused += 1
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+            self.opened += 1
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(netloc, timeout=timeout), False
+
+    def put(self, scheme, netloc, conn):
+        with self.lock:
+            conns = self.idle.setdefault((scheme, netloc), [])
+            if len(conns) < self.MAX_IDLE:
+                conns.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        with self.lock:
+            for conns in self.idle.values():
+                for conn in conns:
+                    conn.close()
+            self.idle.clear()
+
+
+POOL = ConnectionPool()
+
+# a reused keep-alive connection the server has since closed fails like this
+_STALE = (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+          ConnectionResetError, BrokenPipeError)
+_REDIRECTS = (301, 302, 303, 307, 308)
+# safe to send twice: a stale connection may have dropped the request after
+# the server acted on it, so a POST (login, report submission) is never resent
+_IDEMPOTENT = ("GET", "HEAD")
+MAX_REDIRECTS = 10
 
 
 class HTTPClient:
-    def __init__(self, base_url):
+    """Cookie-keeping client over the shared keep-alive POOL.
+
+    Redirects are followed the way urllib did: POST becomes GET on 301-303
+    and is not followed on 307/308; a redirect to any other host is rewritten
+    back to the staging base (BASE_URL may name a host staging cannot reach).
+    """
+
+    def __init__(self, base_url, pool=POOL):
         self.base = base_url.rstrip("/")
+        parsed = urllib.parse.urlparse(self.base)
+        self._scheme = parsed.scheme
+        self._netloc = parsed.netloc
         self.cj = http.cookiejar.CookieJar()
-        self.opener = urllib.request.build_opener(
-            urllib.request.HTTPCookieProcessor(self.cj),
-            _RewriteRedirectHandler(self.base),
-        )
-        self.opener.addheaders = [("User-Agent", "InfraSignal-StagingTest/1.0")]
+        self.pool = pool
+        self.headers = {"User-Agent": "InfraSignal-StagingTest/1.0"}
+
+    def clone(self):
+        """A new client on a copy of this one's cookie jar (its session)."""
+        other = HTTPClient(self.base, self.pool)
+        for cookie in self.cj:
+            other.cj.set_cookie(copy.copy(cookie))
+        return other
+
+    def _url(self, path):
+        return self.base + path if path.startswith("/") else path
+
+    def _rewrite_redirect(self, url, location):
+        """Absolute redirect target, on the staging host whatever host it names."""
+        parsed = urllib.parse.urlparse(urllib.parse.urljoin(url, location))
+        if parsed.netloc and parsed.netloc != self._netloc:
+            parsed = parsed._replace(scheme=self._scheme, netloc=self._netloc)
+        return urllib.parse.urlunparse(parsed)
+
+    def _send(self, method, url, body, headers, timeout):
+        """One request/response on a pooled connection: (status, HTTPMessage, body)."""
+        parsed = urllib.parse.urlsplit(url)
+        target = urllib.parse.urlunsplit(("", "", parsed.path or "/", parsed.query, ""))
+        req = urllib.request.Request(url, method=method, headers=headers)
+        self.cj.add_cookie_header(req)
+        for attempt in (1, 2):
+            # a retry always opens a new connection (another idle one may be
+            # stale too), and so does a request that must not be resent
+            conn, reused = self.pool.get(parsed.scheme, parsed.netloc, timeout,
+                                         fresh=attempt > 1 or method not in _IDEMPOTENT)
+            t0 = time.perf_counter()
+            connect = ttfb = 0.0
+            try:
+                if not reused:
+                    conn.connect()
+                    connect = time.perf_counter() - t0
+                conn.request(method, target, body, dict(req.header_items()))
+                resp = conn.getresponse()
+                ttfb = time.perf_counter() - t0
+                data = resp.read()
+                break
+            except _STALE:
+                conn.close()
+                if reused and method in _IDEMPOTENT:
+                    # the server dropped the idle connection: once more on a new one
+                    continue
+                self._timed(method, parsed.path, 0, connect, ttfb, time.perf_counter() - t0, 0)
+                raise
+            except BaseException:
+                conn.close()
+                self._timed(method, parsed.path, 0, connect, ttfb, time.perf_counter() - t0, 0)
+                raise
+        self._timed(method, parsed.path, resp.status, connect, ttfb,
+                    time.perf_counter() - t0, len(data))
+        if resp.will_close:
+            conn.close()
+        else:
+            self.pool.put(parsed.scheme, parsed.netloc, conn)
+        self.cj.extract_cookies(resp, req)
+        return resp.status, resp.headers, data
 
-    def get(self, path, follow=True, timeout=25):
-        url = self.base + path if path.startswith("/") else path
-        req = urllib.request.Request(url)
+    @staticmethod
+    def _timed(method, path, status, connect, ttfb, total, nbytes):
+        sink = getattr(_sink, "target", None)
+        if sink is not None:
+            suite, R = sink
+            R.timings.append(Timing(suite, method, path or "/", status, connect * 1000,
+                                    ttfb * 1000, total * 1000, nbytes))
+
+    def request(self, method, path, body=None, headers=None, follow=True, timeout=25):
+        """(status, headers dict, body) after redirects; (0, {}, error) on failure."""
+        url = self._url(path)
+        headers = dict(self.headers, **(headers or {}))
         try:
-            resp = self.opener.open(req, timeout=timeout)
-            body = resp.read()
-            return resp.status, dict(resp.headers), body
-        except urllib.error.HTTPError as e:
-            body = e.read() if e.fp else b""
-            return e.code, dict(e.headers), body
+            for _ in range(MAX_REDIRECTS + 1):
+                status, hdrs, data = self._send(method, url, body, headers, timeout)
+                location = hdrs.get("Location")
+                if not (follow and status in _REDIRECTS and location):
+                    break
+                if method == "POST":
+                    if status not in (301, 302, 303):
+                        break
+                    method, body = "GET", None
+                    headers = {k: v for k, v in headers.items() if k != "Content-Type"}
+                url = self._rewrite_redirect(url, location)
+            return status, dict(hdrs), data
         except Exception as e:
             return 0, {}, str(e).encode()
 
+    def get(self, path, follow=True, timeout=25):
+        return self.request("GET", path, follow=follow, timeout=timeout)
+
     def head(self, path, timeout=10):
-        url = self.base + path if path.startswith("/") else path
-        req = urllib.request.Request(url, method="HEAD")
-        try:
-            resp = self.opener.open(req, timeout=timeout)
-            return resp.status, dict(resp.headers)
-        except urllib.error.HTTPError as e:
-            return e.code, dict(e.headers)
-        except Exception:
-            return 0, {}
+        status, hdrs, _ = self.request("HEAD", path, timeout=timeout)
+        return status, hdrs
 
     def post(self, path, data=None, files=None, timeout=20):
-        url = self.base + path if path.startswith("/") else path
         if files:
             body, content_type = self._encode_multipart(data or {}, files)
-            req = urllib.request.Request(url, data=body)
-            req.add_header("Content-Type", content_type)
         else:
-            encoded = urllib.parse.urlencode(data or {}).encode()
-            req = urllib.request.Request(url, data=encoded)
-            req.add_header("Content-Type", "application/x-www-form-urlencoded")
-        try:
-            resp = self.opener.open(req, timeout=timeout)
-            body = resp.read()
-            return resp.status, dict(resp.headers), body
-        except urllib.error.HTTPError as e:
-            body = e.read() if e.fp else b""
-            return e.code, dict(e.headers), body
-        except Exception as e:
-            return 0, {}, str(e).encode()
+            body = urllib.parse.urlencode(data or {}).encode()
+            content_type = "application/x-www-form-urlencoded"
+        return self.request("POST", path, body, {"Content-Type": content_type}, timeout=timeout)
 
     def get_no_redirect(self, path, timeout=10):
         """GET without following redirects."""
-        url = self.base + path if path.startswith("/") else path
-        opener = urllib.request.build_opener(
-            urllib.request.HTTPCookieProcessor(self.cj),
-            _NoRedirectHandler(),
-        )
-        req = urllib.request.Request(url)
-        try:
-            resp = opener.open(req, timeout=timeout)
-            body = resp.read()
-            return resp.status, dict(resp.headers), body
-        except urllib.error.HTTPError as e:
-            body = e.read() if e.fp else b""
-            return e.code, dict(e.headers), body
-        except Exception as e:
-            return 0, {}, str(e).encode()
+        return self.request("GET", path, follow=False, timeout=timeout)
 
     @staticmethod
     def _encode_multipart(fields, files):
@@ -199,11 +377,6 @@ class HTTPClient:
         return body, f"multipart/form-data; boundary={boundary}"
 
 
-class _NoRedirectHandler(urllib.request.HTTPRedirectHandler):
-    def redirect_request(self, req, fp, code, msg, headers, newurl):
-        raise urllib.error.HTTPError(newurl, code, msg, headers, fp)
-
-
 def db_query(container, dbname, sql):
     try:
         out = subprocess.check_output(
@@ -301,29 +474,24 @@ def suite_c(client, R, cfg):
         text = body.decode("utf-8", errors="replace")
         R.record("C", f"404 page [{lang}] returns 404", status == 404, f"got {status}")
 
-    # Run i18n-audit.py if available
-    audit_script = os.path.join(SCRIPT_DIR, "i18n-audit.py")
-    if os.path.exists(audit_script):
-        try:
-            out = subprocess.check_output(
-                [sys.executable, audit_script],
-                cwd=os.path.dirname(SCRIPT_DIR),
-                stderr=subprocess.STDOUT, timeout=60,
-            ).decode()
-            # Count hard failures only (MISSING/EMPTY); LEAK(eng==translit) is heuristic
-            import re as _re
-            missing_vals = [int(x) for x in _re.findall(r'MISSING=(\d+)', out)]
-            empty_vals = [int(x) for x in _re.findall(r'EMPTY=(\d+)', out)]
-            fuzzy_vals = [int(x) for x in _re.findall(r'FUZZY=(\d+)', out)]
-            hard_issues = sum(missing_vals) + sum(empty_vals) + sum(fuzzy_vals)
-            R.record("C", "i18n-audit.py: 0 missing/empty/fuzzy", hard_issues == 0,
-                     f"{hard_issues} hard issues")
-        except subprocess.CalledProcessError as e:
-            R.record("C", "i18n-audit.py runs without error", False, e.output.decode()[:200])
-        except Exception as e:
-            R.skip("C", "i18n-audit.py", str(e))
-    else:
-        R.skip("C", "i18n-audit.py", "script not found")
+    # Catalog audit, run in-process (same code as bin/i18n-audit.py)
+    try:
+        from i18nlib.audit import HARD, hard_issues, run_audit
+    except ImportError as e:
+        R.skip("C", "i18n catalog audit", f"i18nlib unavailable: {e}")
+        return
+    try:
+        result = run_audit()
+    except Exception as e:
+        R.record("C", "i18n catalog audit runs without error", False, str(e)[:200])
+        return
+    # Count hard failures only (MISSING/EMPTY/FUZZY); LEAK is heuristic
+    hard = hard_issues(result)
+    per_locale = ", ".join(
+        f"{loc['lang']}: " + "/".join(f"{c}={loc['counts'][c]}" for c in HARD if loc["counts"][c])
+        for loc in result["locales"] if any(loc["counts"][c] for c in HARD))
+    R.record("C", "i18n catalog audit: 0 missing/empty/fuzzy", hard == 0,
+             f"{hard} hard issues ({per_locale})")
 
 # ── Suite D: Language Switcher Correctness ───────────────────────────
 
@@ -727,21 +895,326 @@ def suite_i(client, R, cfg):
         R.record("I", f"unauthenticated {ep} -> not 200",
                  status_ep != 200, f"got {status_ep}")
 
-# ── Main ─────────────────────────────────────────────────────────────
+# ── Scheduler ────────────────────────────────────────────────────────
 
+# key -> (name, function, suites whose session it continues)
 ALL_SUITES = {
-    "A": ("Infrastructure & Health", suite_a),
-    "B": ("Public Pages (EN)", suite_b),
-    "C": ("i18n Leak Checks", suite_c),
-    "D": ("Language Switcher", suite_d),
-    "E": ("Admin Pages & Auth", suite_e),
-    "F": ("Admin Bodies AJAX", suite_f),
-    "G": ("Full E2E Report Flow", suite_g),
-    "H": ("Media & Assets", suite_h),
-    "I": ("Negative & Security", suite_i),
+    "A": ("Infrastructure & Health", suite_a, ()),
+    "B": ("Public Pages (EN)", suite_b, ()),
+    "C": ("i18n Leak Checks", suite_c, ()),
+    "D": ("Language Switcher", suite_d, ()),
+    "E": ("Admin Pages & Auth", suite_e, ()),
+    "F": ("Admin Bodies AJAX", suite_f, ("E",)),
+    "G": ("Full E2E Report Flow", suite_g, ("E",)),
+    "H": ("Media & Assets", suite_h, ()),
+    "I": ("Negative & Security", suite_i, ()),
 }
 
 
+class _SuiteOutput(io.TextIOBase):
+    """sys.stdout stand-in: a suite thread's prints go to that suite's buffer."""
+
+    def __init__(self, real):
+        self.real = real
+        self.local = threading.local()
+
+    def write(self, s):
+        buf = getattr(self.local, "buf", None)
+        return (buf if buf is not None else self.real).write(s)
+
+    def flush(self):
+        self.real.flush()
+
+
+def _run_suite(key, client, cfg, out):
+    """Run one suite on its own Results; returns (Results, client, output, seconds)."""
+    out.local.buf = buf = io.StringIO()
+    R = Results()
+    _sink.target = (key, R)
+    t0 = time.perf_counter()
+    try:
+        ALL_SUITES[key][1](client, R, cfg)
+    except Exception as e:
+        R.record(key, f"suite {key} unhandled error", False, str(e)[:200])
+    finally:
+        out.local.buf = None
+        _sink.target = None
+    return R, client, buf.getvalue(), time.perf_counter() - t0
+
+
+def run_suites(selected, base, cfg, jobs):
+    """Run the selected suites, each as soon as the suites it needs are done.
+
+    Returns {key: (Results, client, output, seconds)}. Each suite's output is
+    printed in selection order as soon as it and every suite before it are
+    done. A dependency that is not selected is ignored.
+    """
+    out = _SuiteOutput(sys.stdout)
+    done, running = {}, {}
+    pending = list(selected)
+    shown = 0
+    sys.stdout = out
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+            while pending or running:
+                for key in list(pending):
+                    needs = [d for d in ALL_SUITES[key][2] if d in selected]
+                    if all(d in done for d in needs):
+                        pending.remove(key)
+                        client = done[needs[0]][1].clone() if needs else HTTPClient(base)
+                        running[pool.submit(_run_suite, key, client, cfg, out)] = key
+                finished, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for fut in finished:
+                    done[running.pop(fut)] = fut.result()
+                while shown < len(selected) and selected[shown] in done:
+                    out.real.write(done[selected[shown]][2])
+                    out.real.flush()
+                    shown += 1
+    finally:
+        sys.stdout = out.real
+    return done
+
+# ── Load mode ────────────────────────────────────────────────────────
+
+# One load request: endpoint as configured, status (0: no response), time in
+# ms, body bytes, and the error (an exception name or "HTTP <status>")
+Sample = namedtuple("Sample", "page status ms bytes error")
+
+# options --self-test uses when not given
+SELF_TEST = {"load": 8, "duration": 3.0, "think": 0.05}
+
+
+# a report page linked from a list or map page
+REPORT_LINK_RE = re.compile(r'href="[^"]*/report/(\d+)')
+
+
+def find_report_id(base_url, cfg):
+    """A report id for load_pages' {report_id}: load_report_id when set,
+    else the first report linked from /around, /reports or /; None if none is."""
+    if cfg.get("load_report_id"):
+        return str(cfg["load_report_id"])
+    coords = cfg["test_coords"]
+    client = HTTPClient(base_url)
+    for path in (f"/around?latitude={coords['latitude']}&longitude={coords['longitude']}",
+                 "/reports", "/"):
+        status, _, body = client.get(path, timeout=10)
+        m = REPORT_LINK_RE.search(body.decode("utf-8", "replace")) if status == 200 else None
+        if m:
+            return m.group(1)
+    return None
+
+
+def load_pages(cfg, report_id=None):
+    """The endpoints a load run cycles through, in data-file order.
+
+    load_pages entries are formatted with test_coords and report_id; those
+    naming {report_id} are left out, with a warning, when it is None.
+    """
+    fields = dict(cfg["test_coords"], report_id=report_id)
+    pages = list(cfg["public_pages"])
+    for p in cfg.get("load_pages", []):
+        if "{report_id}" in p and report_id is None:
+            print(f"WARNING: no report found to load-test; skipping {p}", file=sys.stderr)
+            continue
+        pages.append(p.format(**fields))
+    return pages
+
+
+class AsyncHTTPClient:
+    """A virtual user's HTTP/1.1 keep-alive connection, on asyncio streams.
+
+    GET only, no cookies and no redirects: a load run measures each
+    endpoint's own response. Reconnects when the server closes the
+    connection; a request that fails on a reused connection is retried once
+    on a new one.
+    """
+
+    def __init__(self, base_url):
+        parsed = urllib.parse.urlsplit(base_url)
+        self.host = parsed.hostname
+        self.port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        self.netloc = parsed.netloc
+        self.ssl = ssl.create_default_context() if parsed.scheme == "https" else None
+        self.reader = self.writer = None
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def get(self, path):
+        """(status, body bytes) of GET path."""
+        reused = self.writer is not None
+        if not reused:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port, ssl=self.ssl)
+        try:
+            return await self._exchange(path)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            self.close()
+            if not reused:
+                raise
+            return await self.get(path)
+        except BaseException:
+            self.close()
+            raise
+
+    async def _exchange(self, path):
+        self.writer.write(f"GET {path} HTTP/1.1\r\nHost: {self.netloc}\r\n"
+                          f"User-Agent: InfraSignal-StagingLoad/1.0\r\n"
+                          f"Accept-Encoding: identity\r\n\r\n".encode("latin-1"))
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionResetError("connection closed by server")
+        version, status = line.split(None, 2)[:2]
+        status = int(status)
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip().lower()
+        keep = version == b"HTTP/1.1" and headers.get("connection") != "close"
+        if status in (204, 304) or status < 200:
+            size = 0
+        elif headers.get("transfer-encoding") == "chunked":
+            size = 0
+            while True:
+                chunk = int((await self.reader.readline()).split(b";")[0], 16)
+                if not chunk:
+                    while (await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                size += len(await self.reader.readexactly(chunk + 2)) - 2
+        elif "content-length" in headers:
+            size = len(await self.reader.readexactly(int(headers["content-length"])))
+        else:
+            size, keep = len(await self.reader.read()), False
+        if not keep:
+            self.close()
+        return status, size
+
+
+async def _virtual_user(n, users, base, pages, deadline, think, timeout, samples):
+    """Fetch pages in turn, starting at the n-th, until the deadline."""
+    loop = asyncio.get_running_loop()
+    rng = random.Random(n)
+    client = AsyncHTTPClient(base)
+    # stagger the start so users do not arrive in lockstep
+    await asyncio.sleep(think * n / users)
+    i = n
+    try:
+        while loop.time() < deadline:
+            page = pages[i % len(pages)]
+            i += 1
+            t0 = loop.time()
+            try:
+                status, size = await asyncio.wait_for(client.get(page), timeout)
+                error = f"HTTP {status}" if status >= 400 else ""
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+                client.close()
+                status, size, error = 0, 0, type(e).__name__
+            samples.append(Sample(page, status, (loop.time() - t0) * 1000, size, error))
+            # think time, jittered +/-50% so the users spread out
+            await asyncio.sleep(think * rng.uniform(0.5, 1.5))
+    finally:
+        client.close()
+
+
+async def _load(base, pages, users, duration, think, timeout):
+    samples = []
+    deadline = asyncio.get_running_loop().time() + duration
+    await asyncio.gather(*(_virtual_user(n, users, base, pages, deadline, think, timeout, samples)
+                           for n in range(users)))
+    return samples
+
+
+def run_load(base, pages, users, duration, think, timeout=25):
+    """([Sample], wall seconds) of a load run of users virtual users."""
+    t0 = time.perf_counter()
+    samples = asyncio.run(_load(base, pages, users, duration, think, timeout))
+    return samples, time.perf_counter() - t0
+
+
+def load_report(samples, wall, pages):
+    """Report lines: throughput, error rate and p50/p95/p99 per endpoint."""
+    by_page = {page: [] for page in pages}
+    for smp in samples:
+        by_page[smp.page].append(smp)
+    w = min(56, max(len(page) for page in pages))
+    lines = [f"  {'endpoint':<{w}} {'reqs':>6} {'req/s':>7} {'err%':>6} "
+             f"{'p50':>7} {'p95':>7} {'p99':>7} {'max':>7} {'KB':>7}"]
+
+    def row(name, group):
+        if not group:
+            return f"  {name[:w]:<{w}} {0:6d}"
+        ms = [smp.ms for smp in group]
+        errors = sum(1 for smp in group if smp.error)
+        return (f"  {name[:w]:<{w}} {len(group):6d} {len(group) / wall:7.1f} "
+                f"{100 * errors / len(group):6.1f} {percentile(ms, 50):7.0f} "
+                f"{percentile(ms, 95):7.0f} {percentile(ms, 99):7.0f} {max(ms):7.0f} "
+                f"{sum(smp.bytes for smp in group) / 1024:7.0f}")
+
+    for page, group in by_page.items():
+        lines.append(row(page, group))
+    lines.append(row("all", samples))
+    errors = Counter(smp.error for smp in samples if smp.error)
+    if errors:
+        lines.append("  errors: " + ", ".join(f"{e} x{n}" for e, n in errors.most_common()))
+    return lines
+
+
+class _StandInHandler(http.server.BaseHTTPRequestHandler):
+    """Any GET is a small 200 page, linking /report/1, after a short delay; keep-alive."""
+    protocol_version = "HTTP/1.1"
+    delay = 0.005
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        body = (f"<html><body>stand-in {html.escape(self.path)} "
+                f'<a href="/report/1">report</a></body></html>').encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def self_test(cfg, users, duration, think):
+    """Load the stand-in server; True when every endpoint answered without error."""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    print(f"Stand-in server: {base}")
+    try:
+        report_id = find_report_id(base, dict(cfg, load_report_id=None))
+        pages = load_pages(cfg, report_id)
+        samples, wall = run_load(base, pages, users, duration, think, timeout=5)
+    finally:
+        server.shutdown()
+        server.server_close()
+    print("\n".join(load_report(samples, wall, pages)))
+    R = Results()
+    R.record("self-test", "report id found on the pages", report_id == "1", f"got {report_id}")
+    R.record("self-test", "load run made requests", bool(samples), "no samples")
+    R.record("self-test", "no errors", not any(smp.error for smp in samples),
+             f"{sum(1 for smp in samples if smp.error)} errors")
+    missing = sorted(set(pages) - {smp.page for smp in samples})
+    R.record("self-test", "every endpoint requested", not missing, ", ".join(missing))
+    R.record("self-test", "every response has a body",
+             all(smp.bytes for smp in samples if not smp.error), "empty 200 body")
+    return R.failed == 0
+
+# ── Main ─────────────────────────────────────────────────────────────
+
+
 def main():
     parser = argparse.ArgumentParser(description="InfraSignal Staging Acceptance Tests")
     parser.add_argument("--base", default=os.environ.get("STAGING_BASE_URL", "http://REDACTED-IP:8080"),
@@ -750,13 +1223,45 @@ def main():
                         help="Comma-separated suites to run (e.g. A,B,C). Default: all")
     parser.add_argument("--report", default="staging-test-report.txt",
                         help="Output report file path")
+    parser.add_argument("--jobs", type=int, default=len(ALL_SUITES),
+                        help="Suites run at once (default: all; 1 = one at a time)")
+    parser.add_argument("--load", type=int, default=0, metavar="USERS",
+                        help="Load-test public pages with USERS virtual users instead of running suites")
+    parser.add_argument("--duration", type=float, default=30.0,
+                        help="Load run length in seconds (default 30)")
+    parser.add_argument("--think", type=float, default=1.0,
+                        help="Mean pause between a virtual user's requests, in seconds (default 1)")
+    parser.add_argument("--max-errors", type=float, default=1.0, metavar="PCT",
+                        help="Load run fails above this error rate, in percent (default 1)")
+    parser.add_argument("--self-test", action="store_true",
+                        help="Run a short load against an in-process stand-in server")
     args = parser.parse_args()
 
     with open(DATA_FILE) as f:
         cfg = json.load(f)
 
+    if args.self_test:
+        for opt, value in SELF_TEST.items():
+            if getattr(args, opt) == parser.get_default(opt):
+                setattr(args, opt, value)
+        ok = self_test(cfg, args.load, args.duration, args.think)
+        sys.exit(0 if ok else 1)
+    if args.load:
+        report_id = find_report_id(args.base, cfg)
+        pages = load_pages(cfg, report_id)
+        print(f"InfraSignal Staging Load Test")
+        print(f"Base: {args.base}")
+        print(f"Report: {f'/report/{report_id}' if report_id else 'none found'}")
+        print(f"Users: {args.load}  duration: {args.duration:g}s  think: {args.think:g}s  "
+              f"endpoints: {len(pages)}")
+        samples, wall = run_load(args.base, pages, args.load, args.duration, args.think)
+        print("\n".join(load_report(samples, wall, pages)))
+        rate = 100 * sum(1 for smp in samples if smp.error) / max(1, len(samples))
+        print(f"\n{len(samples)} requests in {wall:.1f}s ({len(samples) / wall:.1f} req/s), "
+              f"error rate {rate:.1f}% (max {args.max_errors:g}%)")
+        sys.exit(0 if samples and rate <= args.max_errors else 1)
+
     selected = [s.strip().upper() for s in args.suite.split(",") if s.strip()] if args.suite else list(ALL_SUITES.keys())
-    client = HTTPClient(args.base)
     R = Results()
 
     print(f"InfraSignal Staging Acceptance Tests")
@@ -765,17 +1270,27 @@ def main():
     print(f"Time: {time.strftime('%Y-%m-%d %H:%M:%S %Z')}")
 
     for key in selected:
-        if key in ALL_SUITES:
-            name, fn = ALL_SUITES[key]
-            try:
-                fn(client, R, cfg)
-            except Exception as e:
-                R.record(key, f"suite {key} unhandled error", False, str(e)[:200])
-        else:
+        if key not in ALL_SUITES:
             print(f"  [WARN] Unknown suite '{key}', skipping")
+    selected = [key for key in selected if key in ALL_SUITES]
+
+    t0 = time.perf_counter()
+    done = run_suites(selected, args.base, cfg, max(1, args.jobs))
+    wall = time.perf_counter() - t0
+    for key in selected:
+        R.rows.extend(done[key][0].rows)
+        R.timings.extend(done[key][0].timings)
+    if R.timings:
+        print("\n▸ Latency budgets")
+        R.check_budgets(cfg.get("latency_budgets_ms", {}))
 
     report = R.summary()
     print(f"\n{report}")
+    print(f"\n{len(selected)} suites in {wall:.1f}s "
+          f"(suite time {sum(done[key][3] for key in selected):.1f}s, jobs={max(1, args.jobs)})")
+    print(f"HTTP connections: {POOL.opened} opened, {POOL.reused} reused "
+          f"({POOL.opened + POOL.reused} requests)")
+    POOL.close()
 
     with open(args.report, "w") as f:
         f.write(report + "\n")
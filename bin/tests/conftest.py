@@ -0,0 +1,25 @@
+"""Unit tests for the bin/ scripts: python3 -m pytest -q bin/tests
+
+The scripts have hyphenated file names, so they are loaded from their path
+rather than imported.
+"""
+import importlib.util
+import os
+
+import pytest
+
+BIN = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_script(name):
+    """The bin/ script name (e.g. "staging-acceptance.py") as a module."""
+    spec = importlib.util.spec_from_file_location(
+        name[:-len(".py")].replace("-", "_"), os.path.join(BIN, name))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def staging():
+    return load_script("staging-acceptance.py")
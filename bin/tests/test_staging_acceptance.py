@@ -0,0 +1,284 @@
+import http.cookiejar
+import http.server
+import threading
+import time
+
+import pytest
+
+# longer than _Handler.timeout: the server has closed an idle connection by then
+IDLE = 0.3
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Keep-alive stand-in that drops connections idle for `timeout` seconds.
+
+    Every request is logged to server.log as (method, path, client port,
+    Content-Type). POST /drop closes the connection without answering;
+    POST /see-other and /temporary redirect to another host's /landing.
+    """
+    protocol_version = "HTTP/1.1"
+    timeout = 0.1
+
+    def _log(self):
+        self.server.log.append((self.command, self.path, self.client_address[1],
+                                self.headers.get("Content-Type")))
+
+    def _answer(self, status=200, location=None, body=b"ok"):
+        self.send_response(status)
+        if location:
+            self.send_header("Location", location)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._log()
+        self._answer(body=f"{self.command} {self.path}".encode())
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._log()
+        if self.path == "/drop":
+            self.close_connection = True
+        elif self.path == "/see-other":
+            self._answer(303, "http://staging.invalid/landing")
+        elif self.path == "/temporary":
+            self._answer(307, "http://staging.invalid/landing")
+        else:
+            self._answer()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.daemon_threads = True
+    srv.log = []
+    srv.base = f"http://127.0.0.1:{srv.server_address[1]}"
+    threading.Thread(target=srv.serve_forever, args=(0.05,), daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def client(staging, server):
+    c = staging.HTTPClient(server.base, pool=staging.ConnectionPool())
+    yield c
+    c.pool.close()
+
+
+def _cookie(name, value):
+    return http.cookiejar.Cookie(
+        0, name, value, None, False, "staging.test", False, False, "/", True,
+        False, None, False, None, None, {})
+
+
+@pytest.fixture
+def suites(staging, monkeypatch):
+    """Replace ALL_SUITES with recording stand-ins; returns the event log."""
+    log = []
+    lock = threading.Lock()
+
+    def suite(key, delay=0.0, login=False):
+        def run(client, R, cfg):
+            with lock:
+                log.append(("start", key, sorted(c.name for c in client.cj), id(client)))
+            time.sleep(delay)
+            if login:
+                client.cj.set_cookie(_cookie("fixmystreet_app_session", "admin"))
+            print(f"suite {key} output")
+            R.record(key, "ran", True)
+            with lock:
+                log.append(("end", key))
+        return run
+
+    monkeypatch.setattr(staging, "ALL_SUITES", {
+        "A": ("Slow", suite("A", delay=0.2), ()),
+        "B": ("Fast", suite("B"), ()),
+        "E": ("Login", suite("E", delay=0.1, login=True), ()),
+        "F": ("Needs E", suite("F"), ("E",)),
+        "G": ("Needs E", suite("G"), ("E",)),
+    })
+    return log
+
+
+def _started(log, key):
+    return next(e for e in log if e[:2] == ("start", key))
+
+
+def test_dependents_start_after_e_on_a_copy_of_its_session(staging, suites):
+    done = staging.run_suites(["E", "F", "G"], "http://staging.test", {}, jobs=3)
+    assert set(done) == {"E", "F", "G"}
+    e_end = suites.index(("end", "E"))
+    for key in ("F", "G"):
+        start = _started(suites, key)
+        assert suites.index(start) > e_end
+        assert start[2] == ["fixmystreet_app_session"]
+    # each on its own jar: F and G got clones, not E's client
+    clients = {done[key][1] for key in done}
+    assert len(clients) == 3
+    assert {_started(suites, k)[3] for k in "EFG"} == {id(c) for c in clients}
+
+
+def test_unselected_dependency_is_ignored(staging, suites):
+    done = staging.run_suites(["F"], "http://staging.test", {}, jobs=2)
+    assert list(done) == ["F"]
+    assert _started(suites, "F")[2] == []  # a fresh, logged-out client
+
+
+def test_output_and_rows_stay_in_selection_order(staging, suites, capsys):
+    done = staging.run_suites(["A", "B"], "http://staging.test", {}, jobs=2)
+    # B finished first but is printed after A
+    assert suites.index(("end", "B")) < suites.index(("end", "A"))
+    out = capsys.readouterr().out
+    assert out.index("suite A output") < out.index("suite B output")
+    assert [done[k][0].rows[0][0] for k in ("A", "B")] == ["A", "B"]
+
+
+def test_one_job_runs_suites_one_at_a_time(staging, suites):
+    staging.run_suites(["A", "B", "E"], "http://staging.test", {}, jobs=1)
+    assert [e[:2] for e in suites] == [("start", "A"), ("end", "A"), ("start", "B"),
+                                       ("end", "B"), ("start", "E"), ("end", "E")]
+
+
+def test_unhandled_error_is_a_failed_row(staging, monkeypatch):
+    def broken(client, R, cfg):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(staging, "ALL_SUITES", {"X": ("Broken", broken, ())})
+    R = staging.run_suites(["X"], "http://staging.test", {}, jobs=1)["X"][0]
+    assert R.rows == [("X", "suite X unhandled error", "FAIL", "boom")]
+
+
+@pytest.mark.parametrize("method", ["GET", "HEAD"])
+def test_idempotent_request_is_retried_on_a_new_connection(client, server, method):
+    assert client.request(method, "/first")[0] == 200
+    time.sleep(IDLE)  # the pooled connection is now closed at the server end
+    status, _hdrs, body = client.request(method, "/second")
+    assert status == 200 and body == (b"" if method == "HEAD" else f"{method} /second".encode())
+    assert [e[:2] for e in server.log] == [(method, "/first"), (method, "/second")]
+    assert server.log[0][2] != server.log[1][2]
+    # the stale connection was taken from the pool, then one opened for the retry
+    assert (client.pool.opened, client.pool.reused) == (2, 1)
+
+
+def test_post_never_goes_on_a_pooled_connection(client, server):
+    client.get("/first")
+    client.get("/second")  # pooled again: the next POST could reuse it
+    assert client.post("/form", {"a": "1"})[0] == 200
+    assert server.log[1][2] == server.log[0][2] != server.log[2][2]
+    assert client.pool.reused == 1
+
+
+def test_post_is_not_resent_when_the_connection_drops(client, server):
+    status, _hdrs, error = client.post("/drop", {"report": "pothole"})
+    assert status == 0 and error
+    assert [e[:2] for e in server.log] == [("POST", "/drop")]
+
+
+def test_post_redirect_becomes_get_on_the_staging_host(client, server):
+    status, _hdrs, body = client.post("/see-other", {"a": "1"})
+    assert (status, body) == (200, b"GET /landing")
+    assert [e[:2] for e in server.log] == [("POST", "/see-other"), ("GET", "/landing")]
+    assert server.log[1][3] is None  # no Content-Type on the GET
+
+
+def test_post_is_not_followed_on_307(client, server):
+    status, hdrs, _body = client.post("/temporary", {"a": "1"})
+    assert status == 307 and hdrs["Location"] == "http://staging.invalid/landing"
+    assert [e[:2] for e in server.log] == [("POST", "/temporary")]
+
+
+def test_redirect_rewrite(staging):
+    c = staging.HTTPClient("http://staging.test:8080")
+    assert c._rewrite_redirect("http://staging.test:8080/a/b", "c?x=1") == \
+        "http://staging.test:8080/a/c?x=1"
+    assert c._rewrite_redirect("http://staging.test:8080/a", "https://infrasignal.org/my") == \
+        "http://staging.test:8080/my"
+
+
+def test_percentile(staging):
+    values = list(range(100, 0, -1))
+    assert [staging.percentile(values, p) for p in (50, 95, 99, 100)] == [50, 95, 99, 100]
+    assert staging.percentile([7], 95) == 7
+    assert staging.percentile([3, 1, 2], 50) == 2
+    assert staging.percentile([1, 2], 0) == 1
+
+
+def _timing(staging, path, total):
+    return staging.Timing("A", "GET", path, 200, 0.0, total / 2, total, 100)
+
+
+def test_check_budgets(staging):
+    R = staging.Results()
+    R.timings = ([_timing(staging, "/", 10) for _ in range(19)] + [_timing(staging, "/", 900)]
+                 + [_timing(staging, "/reports", 300) for _ in range(5)])
+    R.check_budgets({"/": 50, "/reports": 250, "/faq": 100})
+    assert [(row[1], row[2]) for row in R.rows] == [("/ p95 < 50 ms", "PASS"),
+                                                    ("/reports p95 < 250 ms", "FAIL")]
+    assert R.rows[1][3] == "p95=300 ms, max=300 ms over 5 requests"
+    assert {row[0] for row in R.rows} == {"L"}
+
+
+def test_requests_are_timed_into_the_suite(staging, client):
+    R = staging.Results()
+    staging._sink.target = ("A", R)
+    try:
+        client.get("/first?x=1")
+        client.get("/first?x=2")
+    finally:
+        staging._sink.target = None
+    first, second = R.timings
+    assert (first.suite, first.method, first.path, first.status) == ("A", "GET", "/first", 200)
+    assert first.connect > 0 and second.connect == 0  # the second reused the connection
+    assert 0 < second.ttfb <= second.total
+    assert second.bytes == len(b"GET /first?x=2")
+    assert any(line.lstrip().startswith("/first ") for line in R.latency())
+
+
+def test_load_pages(staging, capsys):
+    cfg = {"test_coords": {"latitude": 40.7, "longitude": -74.0},
+           "public_pages": ["/"],
+           "load_pages": ["/around?latitude={latitude}&longitude={longitude}",
+                          "/report/{report_id}"]}
+    assert staging.load_pages(cfg, "42") == ["/", "/around?latitude=40.7&longitude=-74.0",
+                                             "/report/42"]
+    assert staging.load_pages(cfg) == ["/", "/around?latitude=40.7&longitude=-74.0"]
+    assert "skipping /report/{report_id}" in capsys.readouterr().err
+    # a configured id is used without asking the server
+    assert staging.find_report_id("http://127.0.0.1:9", dict(cfg, load_report_id=7)) == "7"
+
+
+def test_self_test_passes(staging, capsys):
+    cfg = {"test_coords": {"latitude": 40.7, "longitude": -74.0},
+           "public_pages": ["/", "/faq"], "load_pages": ["/report/{report_id}"]}
+    assert staging.self_test(cfg, users=4, duration=0.5, think=0.02)
+    out = capsys.readouterr().out
+    assert "/report/1" in out and "[FAIL]" not in out
+
+
+def test_load_reconnects_after_the_server_drops_idle_connections(staging, server):
+    # each user pauses longer than the server keeps an idle connection open
+    samples, wall = staging.run_load(server.base, ["/a", "/b"], users=2, duration=0.8,
+                                     think=0.3, timeout=5)
+    assert samples and not [smp for smp in samples if smp.error]
+    assert {smp.page for smp in samples} == {"/a", "/b"}
+    assert all(smp.status == 200 and smp.bytes == len(f"GET {smp.page}") for smp in samples)
+    # every request after a user's first found its connection closed
+    assert len({e[2] for e in server.log}) == len(samples)
+
+
+def test_load_report(staging):
+    Sample = staging.Sample
+    samples = ([Sample("/", 200, float(ms), 1024, "") for ms in range(1, 100)]
+               + [Sample("/", 0, 5000.0, 0, "TimeoutError")])
+    lines = staging.load_report(samples, 10.0, ["/", "/faq"])
+    assert lines[1].split() == ["/", "100", "10.0", "1.0", "50", "95", "99", "5000", "99"]
+    assert lines[2].split() == ["/faq", "0"]
+    assert lines[3].split()[:2] == ["all", "100"]
+    assert lines[4] == "  errors: TimeoutError x1"
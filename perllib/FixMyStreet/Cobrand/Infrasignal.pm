@@ -76,6 +76,10 @@ Overrides area fetching to avoid slow global MapIt calls.
 
 =cut
 
+# Load InfraSignal.mo, the slim catalogs bin/make_msg builds next to each
+# FixMyStreet.mo (bin/i18n-slim-mo.py) with only the msgids we can look up.
+sub language_domain { 'InfraSignal' }
+
 # Enable social auth (Google Sign-In via OIDC) if oidc_login is configured
 sub social_auth_enabled {
     my $self = shift;